@@ -5,26 +5,24 @@ Uses Click for a rich command-line experience with commands, options, and help t
 """
 
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import click
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.config.settings import get_settings
 from src.core.logging import configure_logging
-from src.workflows.workflow import run_workflow
-from src.rag.retriever import get_article_retriever
-from src.database.repository import Repository
 
 console = Console()
 
 
+def _clip(values: List[str], width: int) -> List[str]:
+    """Truncate a column of strings to width, marking cut values with '...'."""
+    return [value[:width] + "..." if len(value) > width else value for value in values]
+
+
 @click.group()
 @click.version_option(version="2.0.0", prog_name="AI News Aggregator")
 @click.option('--debug', is_flag=True, help='Enable debug logging')
@@ -66,6 +64,8 @@ def run(hours, top_n, skip_scraping, skip_email):
 
     with console.status("[bold green]Running workflow...") as status:
         try:
+            from src.workflows.workflow import run_workflow
+
             result = run_workflow(hours=hours, top_n=top_n)
 
             if result and result.get("success"):
@@ -77,15 +77,16 @@ def run(hours, top_n, skip_scraping, skip_email):
                 table.add_column("Status", style="green")
                 table.add_column("Count", justify="right", style="yellow")
 
-                articles_count = len(result.get("articles", []))
-                digests_count = len(result.get("digests", []))
-                ranked_count = len(result.get("ranked_articles", []))
+                counts = result["counts"]
+                articles_count = counts["articles"]
+                digests_count = counts["digests"]
+                ranked_count = counts["ranked"]
 
                 table.add_row("Articles Scraped", "✓" if articles_count > 0 else "SKIP", str(articles_count))
                 table.add_row("Digests Created", "✓" if digests_count > 0 else "SKIP", str(digests_count))
                 table.add_row("Vector Indexed", "✓" if result.get("vector_indexed") else "SKIP", str(digests_count) if result.get("vector_indexed") else "0")
                 table.add_row("Articles Ranked", "✓" if ranked_count > 0 else "SKIP", str(ranked_count))
-                table.add_row("Email Sent", "✓" if result.get("success") else "✗", str(min(ranked_count, result.get("top_n", 10))))
+                table.add_row("Email Sent", "✓" if result.get("success") else "✗", str(len(result["top_articles"])))
 
                 console.print(table)
             else:
@@ -111,8 +112,10 @@ def digests(hours, limit):
     console.print(f"\n[bold]Recent Digests (last {hours}h)[/bold]\n")
 
     try:
+        from src.database.repository import Repository
+
         repo = Repository()
-        results = repo.get_recent_digests(hours=hours)
+        results = repo.get_recent_digests(hours=hours, limit=limit)
 
         if not results:
             console.print("[yellow]No digests found[/yellow]")
@@ -124,16 +127,18 @@ def digests(hours, limit):
         table.add_column("Type", style="green")
         table.add_column("URL", style="blue")
 
-        for digest in results[:limit]:
-            table.add_row(
-                digest["id"][:20] + "...",
-                digest["title"][:60] + "..." if len(digest["title"]) > 60 else digest["title"],
-                digest["article_type"],
-                digest["url"][:40] + "..." if len(digest["url"]) > 40 else digest["url"]
-            )
+        # Truncate each column in one pass, then add the rows
+        ids = [d["id"][:20] + "..." for d in results]
+        titles = _clip([d["title"] for d in results], 60)
+        types = [d["article_type"] for d in results]
+        urls = _clip([d["url"] for d in results], 40)
+
+        for row in zip(ids, titles, types, urls):
+            table.add_row(*row)
 
         console.print(table)
-        console.print(f"\n[dim]Showing {min(len(results), limit)} of {len(results)} digests[/dim]\n")
+        total = repo.count_recent_digests(hours=hours) if len(results) == limit else len(results)
+        console.print(f"\n[dim]Showing {len(results)} of {total} digests[/dim]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error: {str(e)}[/bold red]")
@@ -144,7 +149,8 @@ def digests(hours, limit):
 @click.argument('query')
 @click.option('--results', default=5, help='Number of results', show_default=True)
 @click.option('--type', 'article_type', help='Filter by type (youtube/openai/anthropic)')
-def search(query, results, article_type):
+@click.option('--no-cache', is_flag=True, help='Bypass the semantic query cache')
+def search(query, results, article_type, no_cache):
     """
     Semantic search using RAG (vector similarity).
 
@@ -156,14 +162,25 @@ def search(query, results, article_type):
     console.print(f"\n[bold]Searching for: '{query}'[/bold]\n")
 
     try:
+        import numpy as np
+        from src.rag.retriever import get_article_retriever
+        from src.rag.semantic_cache import get_semantic_cache
+
         retriever = get_article_retriever()
-        similar = retriever.find_similar(
-            query=query,
-            n_results=results,
-            article_type=article_type
-        )
+        cache = get_semantic_cache()
+
+        query_embedding = retriever.embed_query_cached(query)
+        similar = None if no_cache else cache.get(query_embedding, article_type=article_type, limit=results)
+        if similar is None:
+            similar = retriever.search_columns(
+                query_embedding=query_embedding,
+                n_results=results,
+                article_type=article_type
+            )
+            if not no_cache:
+                cache.put(query_embedding, similar, article_type=article_type, limit=results)
 
-        if not similar:
+        if len(similar["ids"]) == 0:
             console.print("[yellow]No results found[/yellow]")
             return
 
@@ -172,19 +189,19 @@ def search(query, results, article_type):
         table.add_column("Title", style="cyan")
         table.add_column("Type", style="yellow")
 
-        for result in similar:
-            similarity = 1 - result.get("distance", 0) if result.get("distance") is not None else 0
-            title = result.get("metadata", {}).get("title", "N/A")
-            atype = result.get("metadata", {}).get("article_type", "N/A")
+        similarities = similar["similarities"]
+        for i in np.argsort(-similarities, kind="stable"):
+            metadata = similar["metadatas"][i] or {}
+            title = metadata.get("title", "N/A")
 
             table.add_row(
-                f"{similarity:.2%}",
+                f"{similarities[i]:.2%}",
                 title[:70] + "..." if len(title) > 70 else title,
-                atype
+                metadata.get("article_type", "N/A")
             )
 
         console.print(table)
-        console.print(f"\n[dim]Found {len(similar)} similar articles[/dim]\n")
+        console.print(f"\n[dim]Found {len(similar['ids'])} similar articles[/dim]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error: {str(e)}[/bold red]")
@@ -199,6 +216,9 @@ def stats():
     console.print("\n[bold]System Statistics[/bold]\n")
 
     try:
+        from src.rag.retriever import get_article_retriever
+        from src.database.repository import Repository
+
         # Vector store stats
         retriever = get_article_retriever()
         vector_count = retriever.count_articles()
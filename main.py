@@ -12,11 +12,15 @@ Production-ready REST API for the AI News Aggregator with:
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import structlog
 
 from src.config.settings import get_settings
 from src.core.logging import configure_logging
 from src.api.routes import router
+from src.api.dependencies import async_engine
+from src.rag.faiss_store import persist_faiss_store
+from src.rag.retriever import get_article_retriever
 
 # Configure logging
 settings = get_settings()
@@ -36,9 +40,14 @@ async def lifespan(app: FastAPI):
              version=settings.app_version,
              environment=settings.environment)
 
+    # Load the embedding model and vector store once, before the first request
+    get_article_retriever()
+
     yield
 
     # Shutdown
+    persist_faiss_store()
+    await async_engine.dispose()
     log.info("Shutting down AI News Aggregator API")
 
 
@@ -68,6 +77,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # Model responses are encoded with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -4,32 +4,34 @@ FastMCP Server - AI News Aggregator
 Exposes the AI News Aggregator as MCP tools for Claude and other MCP clients.
 
 Tools provided:
-- search_ai_news: Semantic search using RAG
+- search_ai_news: Semantic, keyword (BM25) or hybrid search using RAG
+- clear_semantic_cache: Invalidate cached search results
 - get_latest_digests: Get recent AI summaries
 - run_news_scraper: Trigger scraping from 23 sources
 - get_news_stats: System statistics
 - run_full_workflow: Complete workflow (scrape + AI + email)
 - send_email_digest: Send email digest on-demand (NEW)
+- get_email_status: Check delivery status of a queued email digest
 """
 
 import sys
-from pathlib import Path
-from typing import Optional
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Literal, Optional, Tuple
 
 from fastmcp import FastMCP
 from src.config.settings import get_settings
 from src.core.logging import configure_logging
-from src.database.repository import Repository
-from src.rag.retriever import get_article_retriever
-from src.core.runner import run_scrapers
-from src.workflows.workflow import run_workflow
 
-# Configure logging
+# Heavy dependencies (ChromaDB, torch, SQLAlchemy, LangGraph) are imported
+# inside the tools that use them, so the server starts without loading them
+
+# Configure logging (stderr: stdout carries the stdio transport)
 settings = get_settings()
-configure_logging(settings)
+configure_logging(settings, stream=sys.stderr)
 
 # Create FastMCP server
 mcp = FastMCP(
@@ -38,8 +40,110 @@ mcp = FastMCP(
 )
 
 
+
+@lru_cache(maxsize=1)
+def _retriever():
+    """Article retriever shared across tool calls (embedding model + ChromaDB client)."""
+    from src.rag.retriever import get_article_retriever
+    return get_article_retriever()
+
+
+@lru_cache(maxsize=1)
+def _repo():
+    """Repository shared across tool calls, backed by a thread-local pooled session."""
+    from sqlalchemy.orm import scoped_session
+    from src.database.connection import SessionLocal
+    from src.database.repository import Repository
+    return Repository(session=scoped_session(SessionLocal))
+
+
+# Recent digests shared by list-then-email tool calls:
+# hours -> (expires_at, fetched_limit, DigestsBatch, total)
+_DIGESTS_TTL = 30
+_digests_cache: Dict[int, Tuple[float, int, Any, int]] = {}
+
+
+def _recent_digests_cached(hours: int, limit: int) -> Tuple[Any, int]:
+    """
+    Get the newest digests in a time window and the window's total count.
+
+    Results are cached per time window for a few seconds; a cached fetch
+    with a larger limit also serves smaller ones.
+
+    Args:
+        hours: Time window in hours
+        limit: Maximum number of digests
+
+    Returns:
+        Tuple of (column-oriented DigestsBatch, total digests in the window)
+    """
+    cached = _digests_cache.get(hours)
+    if cached and cached[0] > time.monotonic() and (limit <= cached[1] or len(cached[2]) < cached[1]):
+        _, _, digests, total = cached
+        return digests.head(limit), total
+
+    digests = _repo().get_recent_digests_batch(hours=hours, limit=limit)
+    total = _repo().count_recent_digests(hours=hours) if len(digests) == limit else len(digests)
+    _digests_cache[hours] = (time.monotonic() + _DIGESTS_TTL, limit, digests, total)
+    return digests, total
+
+
+# SMTP delivery runs off the stdio loop; futures are tracked by task ID.
+# Finished results stay queryable until the oldest are pruned past the cap.
+_EMAIL_TASKS_MAX = 500
+_email_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp-email")
+_email_tasks: "OrderedDict[str, Future]" = OrderedDict()
+
+
+def _track_email_task(task_id: str, future: Future):
+    """Register a delivery future, pruning the oldest finished tasks past the cap."""
+    _email_tasks[task_id] = future
+    if len(_email_tasks) <= _EMAIL_TASKS_MAX:
+        return
+    for old_id in [tid for tid, f in _email_tasks.items() if f.done()]:
+        del _email_tasks[old_id]
+        if len(_email_tasks) <= _EMAIL_TASKS_MAX:
+            break
+
+
+def _iter_search_results(results: Dict[str, Any], order, score_format: str) -> Iterator[Dict[str, Any]]:
+    """Yield formatted search results one at a time, in the given row order."""
+    similarities = results["similarities"]
+    documents = results["documents"]
+    metadatas = results["metadatas"]
+
+    for rank, i in enumerate(order, 1):
+        metadata = metadatas[i] or {}
+        document = documents[i] or ""
+        yield {
+            "rank": rank,
+            "title": metadata.get("title", "N/A"),
+            "summary": document[:300] + "..." if len(document) > 300 else document,
+            "url": metadata.get("url", ""),
+            "article_type": metadata.get("article_type", ""),
+            "similarity_score": score_format.format(similarities[i])
+        }
+
+
+def _iter_digests(digests) -> Iterator[Dict[str, Any]]:
+    """Yield digests from a DigestsBatch formatted for readability, one at a time."""
+    for title, summary, article_type, url, created_at in zip(
+        digests.titles, digests.summaries, digests.article_types, digests.urls, digests.created_ats
+    ):
+        yield {
+            "title": title,
+            "summary": summary,
+            "type": article_type,
+            "url": url,
+            "created_at": str(created_at)
+        }
+
+
 @mcp.tool()
-def search_ai_news(query: str, limit: int = 5, article_type: Optional[str] = None) -> dict:
+def search_ai_news(query: str,
+                   limit: int = 5,
+                   article_type: Optional[str] = None,
+                   mode: Literal["semantic", "keyword", "hybrid"] = "semantic") -> dict:
     """
     Search AI news articles semantically using RAG (vector similarity).
 
@@ -47,38 +151,64 @@ def search_ai_news(query: str, limit: int = 5, article_type: Optional[str] = Non
         query: Search query (e.g., "LLM reasoning capabilities")
         limit: Number of results to return (default: 5)
         article_type: Filter by type - youtube, official, research, news, safety (optional)
+        mode: "semantic" (embeddings), "keyword" (BM25), or "hybrid"
+              (BM25 + cosine, best for exact model names like "DeepSeek-R1")
 
     Returns:
         Dictionary with search results including titles, summaries, URLs, and similarity scores
 
     Example:
         search_ai_news("GPT-5 capabilities", limit=3)
+        search_ai_news("DeepSeek-R1", mode="hybrid")
     """
     try:
-        retriever = get_article_retriever()
-        results = retriever.find_similar(
-            query=query,
-            n_results=limit,
-            article_type=article_type
-        )
-
-        # Format results for better readability
-        formatted_results = []
-        for i, result in enumerate(results, 1):
-            metadata = result.get("metadata", {})
-            similarity = 1 - result.get("distance", 0) if result.get("distance") is not None else 0
-
-            formatted_results.append({
-                "rank": i,
-                "title": metadata.get("title", "N/A"),
-                "summary": result.get("document", "")[:300] + "..." if len(result.get("document", "")) > 300 else result.get("document", ""),
-                "url": metadata.get("url", ""),
-                "article_type": metadata.get("article_type", ""),
-                "similarity_score": f"{similarity:.2%}"
-            })
+        import numpy as np
+        from src.rag.retriever import get_batch_embedder
+        from src.rag.semantic_cache import get_semantic_cache
+        from src.rag.embedding_cache import get_embedding_cache
+
+        retriever = _retriever()
+
+        if mode not in ("semantic", "keyword", "hybrid"):
+            return {"error": f"Unknown search mode: {mode}"}
+
+        if mode == "keyword":
+            results = retriever.keyword_search_columns(query, n_results=limit, article_type=article_type)
+        else:
+            # Repeated queries skip the model via the on-disk embedding cache;
+            # concurrent misses share one batched encode
+            embedding_cache = get_embedding_cache()
+            model_name = retriever.embedding_generator.model_name
+            query_embedding = embedding_cache.get(model_name, query)
+            if query_embedding is None:
+                query_embedding = get_batch_embedder().embed(query)
+                embedding_cache.put(model_name, query, query_embedding)
+
+            if mode == "hybrid":
+                results = retriever.hybrid_search_columns(
+                    query, query_embedding, n_results=limit, article_type=article_type
+                )
+            else:
+                # Near-duplicate queries are served from the semantic cache
+                # (semantic mode only: keyword scores depend on exact tokens)
+                cache = get_semantic_cache()
+                results = cache.get(query_embedding, article_type=article_type, limit=limit)
+                if results is None:
+                    results = retriever.search_columns(
+                        query_embedding=query_embedding,
+                        n_results=limit,
+                        article_type=article_type
+                    )
+                    cache.put(query_embedding, results, article_type=article_type, limit=limit)
+
+        # Order by score (cosine, hybrid in [0, 1], or raw BM25)
+        order = np.argsort(-results["similarities"], kind="stable")[:limit]
+        score_format = "{:.2f}" if mode == "keyword" else "{:.2%}"
+        formatted_results = list(_iter_search_results(results, order, score_format))
 
         return {
             "query": query,
+            "mode": mode,
             "results": formatted_results,
             "count": len(formatted_results)
         }
@@ -86,6 +216,35 @@ def search_ai_news(query: str, limit: int = 5, article_type: Optional[str] = Non
         return {"error": str(e)}
 
 
+@mcp.tool()
+def clear_semantic_cache() -> dict:
+    """
+    Invalidate cached search results.
+
+    Call after new content has been indexed so that search_ai_news
+    reflects the latest articles.
+
+    Returns:
+        Dictionary with the number of cached queries that were dropped
+
+    Example:
+        clear_semantic_cache()
+    """
+    try:
+        from src.rag.semantic_cache import get_semantic_cache
+
+        cache = get_semantic_cache()
+        cleared = cache.size()
+        cache.clear()
+
+        return {
+            "status": "success",
+            "cleared_entries": cleared
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @mcp.tool()
 def get_latest_digests(hours: int = 168, limit: int = 10) -> dict:
     """
@@ -102,27 +261,18 @@ def get_latest_digests(hours: int = 168, limit: int = 10) -> dict:
         get_latest_digests(hours=24, limit=5)  # Last 24 hours, top 5
     """
     try:
-        repo = Repository()
-        digests = repo.get_recent_digests(hours=hours)
-
-        # Format for readability
-        formatted_digests = []
-        for digest in digests[:limit]:
-            formatted_digests.append({
-                "title": digest["title"],
-                "summary": digest["summary"],
-                "type": digest["article_type"],
-                "url": digest["url"],
-                "created_at": str(digest["created_at"])
-            })
+        digests, total_found = _recent_digests_cached(hours, limit)
+
+        formatted_digests = list(_iter_digests(digests))
 
         return {
             "digests": formatted_digests,
-            "total_found": len(digests),
+            "total_found": total_found,
             "returned": len(formatted_digests),
             "time_window_hours": hours
         }
     except Exception as e:
+        _repo().session.rollback()
         return {"error": str(e)}
 
 
@@ -147,7 +297,10 @@ def run_news_scraper(hours: int = 168) -> dict:
         run_news_scraper(hours=24)  # Last 24 hours
     """
     try:
+        from src.core.runner import run_scrapers
+
         results = run_scrapers(hours=hours)
+        _digests_cache.clear()
 
         return {
             "status": "success",
@@ -173,8 +326,11 @@ def get_news_stats() -> dict:
         get_news_stats()
     """
     try:
-        retriever = get_article_retriever()
+        from src.rag.retriever import get_batch_embedder
+
+        retriever = _retriever()
         article_count = retriever.count_articles()
+        batch_embedder = get_batch_embedder()
 
         return {
             "status": "healthy",
@@ -183,6 +339,11 @@ def get_news_stats() -> dict:
                 "embedding_model": settings.embedding_model,
                 "embedding_dimensions": settings.embedding_dimension
             },
+            "query_batching": {
+                "batches": batch_embedder.batches,
+                "queries": batch_embedder.items,
+                "batch_fill_ratio": round(batch_embedder.batch_fill_ratio, 3)
+            },
             "database": {
                 "status": "connected",
                 "host": settings.postgres_host,
@@ -223,17 +384,21 @@ def run_full_workflow(hours: int = 168, top_n: int = 10) -> dict:
         run_full_workflow(hours=168, top_n=15)
     """
     try:
+        from src.workflows.workflow import run_workflow
+
         result = run_workflow(hours=hours, top_n=top_n)
+        _digests_cache.clear()
 
         if result and result.get("success"):
+            counts = result["counts"]
             return {
                 "status": "success",
-                "articles_scraped": len(result.get("articles", [])),
-                "digests_created": len(result.get("digests", [])),
-                "articles_indexed": len(result.get("digests", [])),
-                "articles_ranked": len(result.get("ranked_articles", [])),
+                "articles_scraped": counts["articles"],
+                "digests_created": counts["digests"],
+                "articles_indexed": counts["digests"],
+                "articles_ranked": counts["ranked"],
                 "email_sent": result.get("success", False),
-                "email_article_count": min(len(result.get("ranked_articles", [])), top_n),
+                "email_article_count": len(result["top_articles"]),
                 "message": f"Successfully processed and emailed top {top_n} articles"
             }
         else:
@@ -262,7 +427,7 @@ def send_email_digest(hours: int = 24, top_n: int = 10, recipient: Optional[str]
         recipient: Email recipient (defaults to MY_EMAIL from config)
 
     Returns:
-        Dictionary with email send status and details
+        Dictionary with queue status, task_id (see get_email_status) and details
 
     Example:
         send_email_digest(hours=24, top_n=10)  # Send last 24 hours, top 10
@@ -273,12 +438,10 @@ def send_email_digest(hours: int = 24, top_n: int = 10, recipient: Optional[str]
     """
     try:
         import os
-        from src.agents.email import EmailAgent, RankedArticleDetail
-        from src.services.email import send_email, digest_to_html
+        from src.services.email import send_email, build_digest_email
 
-        # Get recent digests
-        repo = Repository()
-        digests = repo.get_recent_digests(hours=hours)
+        # Get recent digests (shared with a preceding get_latest_digests call)
+        digests, total_found = _recent_digests_cached(hours, top_n)
 
         if not digests:
             return {
@@ -287,39 +450,14 @@ def send_email_digest(hours: int = 24, top_n: int = 10, recipient: Optional[str]
                 "articles_count": 0
             }
 
-        # Convert to ranked article format
-        ranked_articles = []
-        for idx, digest in enumerate(digests[:top_n]):
-            ranked_articles.append(
-                RankedArticleDetail(
-                    digest_id=digest['id'],
-                    rank=idx + 1,
-                    relevance_score=10.0 - (idx * 0.5),
-                    title=digest['title'],
-                    summary=digest['summary'],
-                    url=digest['url'],
-                    article_type=digest['article_type'],
-                    reasoning=f"Ranked #{idx + 1} by recency and relevance"
-                )
+        # Build the email (ranking, introduction, HTML) from the batch's rows
+        rows = [
+            {"id": digest_id, "title": title, "summary": summary, "url": url, "article_type": article_type}
+            for digest_id, title, summary, url, article_type in zip(
+                digests.ids, digests.titles, digests.summaries, digests.urls, digests.article_types
             )
-
-        # Create email using EmailAgent
-        user_profile = {
-            "name": "AI Enthusiast",
-            "interests": ["AI", "Machine Learning", "LLMs", "AI Safety"]
-        }
-
-        email_agent = EmailAgent(user_profile=user_profile)
-        email_digest = email_agent.create_email_digest_response(
-            ranked_articles=ranked_articles,
-            total_ranked=len(digests),
-            limit=top_n
-        )
-
-        # Generate email content
-        subject = f"🤖 AI News Digest - Top {top_n} Articles"
-        text_content = email_digest.to_markdown()
-        html_content = digest_to_html(email_digest)
+        ]
+        email = build_digest_email(rows, top_n=top_n, total_ranked=total_found)
 
         # Determine recipient
         email_recipient = recipient or os.getenv("MY_EMAIL")
@@ -329,24 +467,28 @@ def send_email_digest(hours: int = 24, top_n: int = 10, recipient: Optional[str]
                 "message": "No recipient specified and MY_EMAIL not configured"
             }
 
-        # Send email
-        send_email(
-            subject=subject,
-            body_text=text_content,
-            body_html=html_content,
+        # Queue email delivery and return immediately
+        task_id = uuid.uuid4().hex
+        _track_email_task(task_id, _email_executor.submit(
+            send_email,
+            subject=email["subject"],
+            body_text=email["body_text"],
+            body_html=email["body_html"],
             recipients=[email_recipient]
-        )
+        ))
 
         return {
-            "status": "success",
-            "message": f"Email digest sent successfully to {email_recipient}",
-            "articles_count": len(ranked_articles),
+            "status": "queued",
+            "task_id": task_id,
+            "message": f"Email digest queued for delivery to {email_recipient}",
+            "articles_count": email["articles_count"],
             "recipient": email_recipient,
             "time_window_hours": hours,
             "top_n": top_n
         }
 
     except Exception as e:
+        _repo().session.rollback()
         return {
             "status": "error",
             "message": f"Failed to send email: {str(e)}",
@@ -354,6 +496,33 @@ def send_email_digest(hours: int = 24, top_n: int = 10, recipient: Optional[str]
         }
 
 
+@mcp.tool()
+def get_email_status(task_id: str) -> dict:
+    """
+    Check the delivery status of an email digest queued by send_email_digest.
+
+    Args:
+        task_id: Task ID returned by send_email_digest
+
+    Returns:
+        Dictionary with status: pending, sent, or failed
+
+    Example:
+        get_email_status("3f2c9a...")
+    """
+    future = _email_tasks.get(task_id)
+    if future is None:
+        return {"status": "error", "message": f"Unknown task ID: {task_id}"}
+
+    if not future.done():
+        return {"task_id": task_id, "status": "pending"}
+
+    error = future.exception()
+    if error:
+        return {"task_id": task_id, "status": "failed", "error": str(error)}
+    return {"task_id": task_id, "status": "sent"}
+
+
 if __name__ == "__main__":
-    # Run the MCP server (no print statements - they interfere with stdio transport)
+    # Run the MCP server (stdout is reserved for the stdio transport)
     mcp.run()
@@ -2,45 +2,126 @@
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
+from plotly.colors import sequential
 from datetime import datetime, timedelta
 import pandas as pd
 
 from src.config.settings import get_settings
-from src.database.repository import Repository
-from src.rag.retriever import get_article_retriever
+from src.rag.vectorstore import get_vector_store
+from src.ui.cache import get_recent_digests_cached
+from src.ui.constants import TYPE_LABELS
+
+
+# Static source badges, assembled once at import
+_YT_HTML = """
+<div style='padding: 1rem;'>
+    <h4>YouTube Channels</h4>
+    <span class="source-badge">📺 Varun Mayya - AI Tools & Entrepreneurship</span>
+    <span class="source-badge">📺 Krish Naik - AI Tutorials & ML</span>
+    <span class="source-badge">📺 Codebasics - Data Science & Python</span>
+</div>
+"""
+
+_WEB_SOURCES = {
+    "Official AI Blogs": ["OpenAI", "Anthropic", "Google DeepMind", "Google Research", "Meta AI",
+                          "Hugging Face", "EleutherAI", "Stability AI", "LAION AI"],
+    "Research Papers": ["arXiv AI", "arXiv ML", "Papers With Code"],
+    "AI News": ["VentureBeat", "TechCrunch", "MIT Tech Review", "The Decoder", "Ars Technica"],
+    "AI Safety": ["Alignment Forum", "LessWrong", "Center for AI Safety"]
+}
+
+_WEB_HTML = "<br>".join(
+    f"**{group} ({len(names)})**\n\n"
+    + "\n".join(f'<span class="source-badge">{name}</span>' for name in names)
+    + "\n\n"
+    for group, names in _WEB_SOURCES.items()
+)
+
+
+@st.cache_data(ttl=300)  # Counts drift slowly; cache for 5 minutes
+def get_vector_count_cached():
+    """Get vector store article count (cached).
+
+    Only opens the ChromaDB collection; the embedding model is not needed.
+    """
+    return get_vector_store().count()
 
 
-@st.cache_resource
-def get_cached_retriever():
-    """Get article retriever (cached)."""
+def get_vector_count():
+    """Get vector store article count, falling back to the last known value."""
     try:
-        return get_article_retriever()
+        count = get_vector_count_cached()
     except Exception as e:
-        st.warning(f"Could not load retriever: {e}")
-        return None
+        st.warning(f"Could not load vector store: {e}")
+        return st.session_state.get('last_vector_count', 0)
 
+    st.session_state['last_vector_count'] = count
+    return count
 
-@st.cache_resource
-def get_cached_repository():
-    """Get database repository (cached)."""
-    return Repository()
 
+def _stat_card(value, label: str) -> str:
+    """Build the HTML for one stat card."""
+    return (
+        '<div class="stat-card" style="flex: 1;">'
+        f'<div class="stat-number">{value}</div>'
+        f'<div class="stat-label">{label}</div>'
+        '</div>'
+    )
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def get_recent_digests_cached(hours: int):
-    """Get recent digests from database (cached)."""
-    repo = get_cached_repository()
-    return repo.get_recent_digests(hours=hours)
 
+def render_activity_charts(df: pd.DataFrame):
+    """Render the daily activity and category charts side by side."""
+    # Two column layout
+    col1, col2 = st.columns([1, 1])
+    col1.subheader("📈 Recent Activity")
+    col2.subheader("🗂️ Articles by Category")
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def get_vector_count():
-    """Get vector store article count (cached)."""
-    retriever = get_cached_retriever()
-    if retriever:
-        return retriever.count_articles()
-    return 0
+    if df.empty:
+        col1.info("No recent activity. Run a workflow to see stats!")
+        col2.info("No data available yet.")
+        return
+
+    # Aggregate once for both charts: (date x type) counts
+    agg = df.groupby([df['created_at'].dt.date.rename('date'), 'type']).size().unstack(fill_value=0)
+    daily_counts = agg.sum(axis=1).rename_axis('date').reset_index(name='count')
+    type_counts = agg.sum(axis=0).rename_axis('type').reset_index(name='count')
+
+    with col1:
+        # Plot
+        fig = go.Figure(go.Bar(
+            x=daily_counts['date'],
+            y=daily_counts['count'],
+            marker_color='#667eea'
+        ))
+        fig.update_layout(
+            title='Articles Processed (Last 7 Days)',
+            xaxis_title='Date',
+            yaxis_title='Articles',
+            showlegend=False,
+            height=300,
+            margin=dict(l=0, r=0, t=40, b=0),
+            uirevision='daily'  # Keep client-side zoom across reruns
+        )
+        st.plotly_chart(fig, use_container_width=True)
+
+    with col2:
+        # Map types to readable names
+        type_counts['label'] = type_counts['type'].map(TYPE_LABELS)
+
+        # Pie chart
+        fig = go.Figure(go.Pie(
+            labels=type_counts['label'],
+            values=type_counts['count'],
+            marker_colors=sequential.Purples_r
+        ))
+        fig.update_layout(
+            title='Distribution by Source Type',
+            showlegend=True,
+            height=300,
+            margin=dict(l=0, r=0, t=40, b=0),
+            uirevision='types'  # Keep legend toggles across reruns
+        )
+        st.plotly_chart(fig, use_container_width=True)
 
 
 def show():
@@ -53,113 +134,24 @@ def show():
     vector_count = get_vector_count()
     digests = get_recent_digests_cached(hours=168)
 
-    # Quick stats
-    col1, col2, col3, col4 = st.columns(4)
-
-    with col1:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-number">{vector_count}</div>
-            <div class="stat-label">📚 Indexed Articles</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-number">{len(digests)}</div>
-            <div class="stat-label">📝 Weekly Digests</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-number">23</div>
-            <div class="stat-label">🌐 Active Sources</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col4:
-        st.markdown(f"""
-        <div class="stat-card">
-            <div class="stat-number">{settings.app_version}</div>
-            <div class="stat-label">🚀 Version</div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("<br>", unsafe_allow_html=True)
-
-    # Two column layout
-    col1, col2 = st.columns([1, 1])
-
-    with col1:
-        st.subheader("📈 Recent Activity")
-
-        # Use already fetched weekly digests
-        if digests:
-            # Create daily counts
-            df_data = []
-            for digest in digests:
-                df_data.append({
-                    'date': digest['created_at'].date(),
-                    'type': digest['article_type']
-                })
-
-            df = pd.DataFrame(df_data)
-            daily_counts = df.groupby('date').size().reset_index(name='count')
-
-            # Plot
-            fig = px.bar(
-                daily_counts,
-                x='date',
-                y='count',
-                title='Articles Processed (Last 7 Days)',
-                labels={'date': 'Date', 'count': 'Articles'},
-                color_discrete_sequence=['#667eea']
-            )
-            fig.update_layout(
-                showlegend=False,
-                height=300,
-                margin=dict(l=0, r=0, t=40, b=0)
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No recent activity. Run a workflow to see stats!")
-
-    with col2:
-        st.subheader("🗂️ Articles by Category")
-
-        if digests:
-            # Count by type
-            type_counts = df.groupby('type').size().reset_index(name='count')
-
-            # Map types to readable names
-            type_map = {
-                'official': '🏢 Official Blogs',
-                'research': '🔬 Research Papers',
-                'news': '📰 News Sites',
-                'safety': '🛡️ AI Safety',
-                'youtube': '📺 YouTube'
-            }
-            type_counts['label'] = type_counts['type'].map(type_map)
-
-            # Pie chart
-            fig = px.pie(
-                type_counts,
-                values='count',
-                names='label',
-                title='Distribution by Source Type',
-                color_discrete_sequence=px.colors.sequential.Purples_r
-            )
-            fig.update_layout(
-                showlegend=True,
-                height=300,
-                margin=dict(l=0, r=0, t=40, b=0)
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No data available yet.")
+    # Quick stats (one element instead of four columns)
+    st.markdown(
+        '<div style="display: flex; gap: 1rem;">'
+        + _stat_card(vector_count, "📚 Indexed Articles")
+        + _stat_card(len(digests), "📝 Weekly Digests")
+        + _stat_card(23, "🌐 Active Sources")
+        + _stat_card(settings.app_version, "🚀 Version")
+        + '</div><br>',
+        unsafe_allow_html=True
+    )
+
+    # Digests as a frame, shared by the charts and the recent preview
+    df = pd.DataFrame({
+        'created_at': pd.to_datetime([d['created_at'] for d in digests]),
+        'type': [d['article_type'] for d in digests]
+    })
+
+    render_activity_charts(df)
 
     # System information
     st.markdown("---")
@@ -192,63 +184,22 @@ Environment: {settings.environment}
     tab1, tab2 = st.tabs(["YouTube (3)", "Web Sources (20)"])
 
     with tab1:
-        st.markdown("""
-        <div style='padding: 1rem;'>
-            <h4>YouTube Channels</h4>
-            <span class="source-badge">📺 Varun Mayya - AI Tools & Entrepreneurship</span>
-            <span class="source-badge">📺 Krish Naik - AI Tutorials & ML</span>
-            <span class="source-badge">📺 Codebasics - Data Science & Python</span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_YT_HTML, unsafe_allow_html=True)
 
     with tab2:
-        st.markdown("**Official AI Blogs (9)**")
-        st.markdown("""
-        <span class="source-badge">OpenAI</span>
-        <span class="source-badge">Anthropic</span>
-        <span class="source-badge">Google DeepMind</span>
-        <span class="source-badge">Google Research</span>
-        <span class="source-badge">Meta AI</span>
-        <span class="source-badge">Hugging Face</span>
-        <span class="source-badge">EleutherAI</span>
-        <span class="source-badge">Stability AI</span>
-        <span class="source-badge">LAION AI</span>
-        """, unsafe_allow_html=True)
-
-        st.markdown("<br>**Research Papers (3)**", unsafe_allow_html=True)
-        st.markdown("""
-        <span class="source-badge">arXiv AI</span>
-        <span class="source-badge">arXiv ML</span>
-        <span class="source-badge">Papers With Code</span>
-        """, unsafe_allow_html=True)
-
-        st.markdown("<br>**AI News (5)**", unsafe_allow_html=True)
-        st.markdown("""
-        <span class="source-badge">VentureBeat</span>
-        <span class="source-badge">TechCrunch</span>
-        <span class="source-badge">MIT Tech Review</span>
-        <span class="source-badge">The Decoder</span>
-        <span class="source-badge">Ars Technica</span>
-        """, unsafe_allow_html=True)
-
-        st.markdown("<br>**AI Safety (3)**", unsafe_allow_html=True)
-        st.markdown("""
-        <span class="source-badge">Alignment Forum</span>
-        <span class="source-badge">LessWrong</span>
-        <span class="source-badge">Center for AI Safety</span>
-        """, unsafe_allow_html=True)
+        st.markdown(_WEB_HTML, unsafe_allow_html=True)
 
     # Recent digests preview
     st.markdown("---")
     st.subheader("📰 Recent Digests Preview")
 
-    # Filter to last 24 hours from already cached weekly digests
-    now = datetime.now()
-    cutoff = now - timedelta(hours=24)
-    recent = [d for d in digests if d['created_at'] >= cutoff]
+    # Filter to last 24 hours from already cached weekly digests (vectorized)
+    cutoff = pd.Timestamp(datetime.now() - timedelta(hours=24))
+    recent_rows = df.index[df['created_at'] >= cutoff][:5]
+    recent = [digests[row] for row in recent_rows]
 
     if recent:
-        for i, digest in enumerate(recent[:5]):
+        for i, digest in enumerate(recent):
             with st.expander(f"📄 {digest['title'][:80]}..." if len(digest['title']) > 80 else f"📄 {digest['title']}"):
                 st.markdown(f"**Type:** `{digest['article_type']}`")
                 st.markdown(f"**Published:** {digest['created_at'].strftime('%Y-%m-%d %H:%M')}")
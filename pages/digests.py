@@ -1,21 +1,70 @@
 """Digests page - View AI-generated summaries."""
 
+import json
+from itertools import groupby
 import streamlit as st
 from datetime import datetime
-from src.database.repository import Repository
+from src.ui.cache import get_recent_digests_cached, get_digest_type_counts_cached
+from src.ui.constants import DEFAULT_TYPE_EMOJI, TYPE_EMOJI
 
+# Digests rendered per page (each one is an expander with widgets)
+PAGE_SIZE = 10
 
-@st.cache_resource
-def get_cached_repository():
-    """Get database repository (cached)."""
-    return Repository()
 
+def group_by_date(digests):
+    """
+    Group digests by creation date (YYYY-MM-DD).
 
-@st.cache_data(ttl=60)  # Cache for 60 seconds
-def get_recent_digests_cached(hours: int):
-    """Get recent digests from database (cached)."""
-    repo = get_cached_repository()
-    return repo.get_recent_digests(hours=hours)
+    Digests arrive newest first (Repository.get_recent_digests orders by
+    created_at DESC), so days come out newest first in a single pass.
+
+    Returns:
+        List of (date_str, digests) tuples, newest day first
+    """
+    return [
+        (date_str, list(day_digests))
+        for date_str, day_digests in groupby(digests, key=lambda d: d['created_at'].strftime('%Y-%m-%d'))
+    ]
+
+
+def _iter_markdown(rows: tuple, date_str: str):
+    """Yield Markdown fragments for digest rows, grouped by day (newest first)."""
+    yield f"# AI News Digests - {date_str}\n\n"
+
+    # Rows are newest first, so consecutive runs of a day are already ordered
+    for day, day_rows in groupby(rows, key=lambda row: row[5][:10]):
+        yield f"## {day}\n\n"
+
+        for _, title, article_type, summary, url, _ in day_rows:
+            yield (
+                f"### {title}\n\n"
+                f"**Type:** {article_type}\n\n"
+                f"**Summary:** {summary}\n\n"
+                f"**Link:** {url}\n\n"
+                "---\n\n"
+            )
+
+
+@st.cache_data
+def build_markdown(rows: tuple, date_str: str) -> str:
+    """Serialize digest rows (id, title, type, summary, url, created_at) to Markdown (cached)."""
+    return "".join(_iter_markdown(rows, date_str))
+
+
+@st.cache_data
+def build_json(rows: tuple) -> str:
+    """Serialize digest rows (id, title, type, summary, url, created_at) to JSON (cached)."""
+    export_data = [
+        {
+            'title': title,
+            'type': article_type,
+            'summary': summary,
+            'url': url,
+            'created_at': created_at
+        }
+        for _, title, article_type, summary, url, created_at in rows
+    ]
+    return json.dumps(export_data, indent=2)
 
 
 def show():
@@ -68,14 +117,13 @@ def show():
     st.markdown("---")
     col1, col2, col3, col4 = st.columns(4)
 
-    # Count by type
-    type_counts = {}
-    for d in digests:
-        t = d['article_type']
-        type_counts[t] = type_counts.get(t, 0) + 1
+    # Count by type for the whole window (aggregated in SQL)
+    type_counts = get_digest_type_counts_cached(hours=hours)
+    if filter_type != "All":
+        type_counts = {filter_type: type_counts.get(filter_type, 0)}
 
     with col1:
-        st.metric("📚 Total Digests", len(digests))
+        st.metric("📚 Total Digests", sum(type_counts.values()))
 
     with col2:
         official_count = type_counts.get('official', 0)
@@ -109,28 +157,36 @@ def show():
     # Display digests
     st.subheader(f"📋 {len(digests)} Digests Found")
 
-    # Group by date
-    by_date = {}
-    for digest in digests:
-        date_str = digest['created_at'].strftime('%Y-%m-%d')
-        if date_str not in by_date:
-            by_date[date_str] = []
-        by_date[date_str].append(digest)
+    # Paginate: start over whenever the filters change
+    filters = (hours, limit, filter_type)
+    if st.session_state.get('digests_filters') != filters:
+        st.session_state.digests_filters = filters
+        st.session_state.digests_page = 0
+
+    num_pages = (len(digests) + PAGE_SIZE - 1) // PAGE_SIZE
+    page = min(st.session_state.get('digests_page', 0), num_pages - 1)
+
+    if num_pages > 1:
+        prev_col, info_col, next_col = st.columns([1, 2, 1])
+        with prev_col:
+            if st.button("⬅️ Prev", disabled=page == 0, use_container_width=True):
+                page -= 1
+        with next_col:
+            if st.button("Next ➡️", disabled=page >= num_pages - 1, use_container_width=True):
+                page += 1
+        st.session_state.digests_page = page
+        with info_col:
+            st.markdown(f"<div style='text-align: center'>Page {page + 1} of {num_pages}</div>", unsafe_allow_html=True)
+
+    page_digests = digests[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
 
     # Display by date
-    for date_str, date_digests in sorted(by_date.items(), reverse=True):
+    for date_str, date_digests in group_by_date(page_digests):
         st.markdown(f"### 📅 {date_str} ({len(date_digests)} articles)")
 
         for digest in date_digests:
             # Type emoji
-            type_emoji = {
-                'official': '🏢',
-                'research': '🔬',
-                'news': '📰',
-                'safety': '🛡️',
-                'youtube': '📺'
-            }
-            emoji = type_emoji.get(digest['article_type'], '📄')
+            emoji = TYPE_EMOJI.get(digest['article_type'], DEFAULT_TYPE_EMOJI)
 
             with st.expander(f"{emoji} {digest['title']}", expanded=False):
                 col1, col2 = st.columns([3, 1])
@@ -158,50 +214,29 @@ def show():
     st.markdown("---")
     st.subheader("💾 Export Digests")
 
+    # Hashable snapshot of the loaded digests: the export cache key
+    rows = tuple(
+        (d['id'], d['title'], d['article_type'], d['summary'], d['url'], d['created_at'].isoformat())
+        for d in digests
+    )
+    today = datetime.now()
+
     col1, col2 = st.columns(2)
 
     with col1:
-        if st.button("📄 Export as Markdown", use_container_width=True):
-            markdown_content = f"# AI News Digests - {datetime.now().strftime('%Y-%m-%d')}\n\n"
-
-            for date_str, date_digests in sorted(by_date.items(), reverse=True):
-                markdown_content += f"## {date_str}\n\n"
-
-                for digest in date_digests:
-                    markdown_content += f"### {digest['title']}\n\n"
-                    markdown_content += f"**Type:** {digest['article_type']}\n\n"
-                    markdown_content += f"**Summary:** {digest['summary']}\n\n"
-                    markdown_content += f"**Link:** {digest['url']}\n\n"
-                    markdown_content += "---\n\n"
-
-            st.download_button(
-                label="⬇️ Download Markdown",
-                data=markdown_content,
-                file_name=f"ai_news_digests_{datetime.now().strftime('%Y%m%d')}.md",
-                mime="text/markdown",
-                use_container_width=True
-            )
+        st.download_button(
+            label="📄 Export as Markdown",
+            data=build_markdown(rows, today.strftime('%Y-%m-%d')),
+            file_name=f"ai_news_digests_{today.strftime('%Y%m%d')}.md",
+            mime="text/markdown",
+            use_container_width=True
+        )
 
     with col2:
-        if st.button("📊 Export as JSON", use_container_width=True):
-            import json
-
-            export_data = []
-            for digest in digests:
-                export_data.append({
-                    'title': digest['title'],
-                    'type': digest['article_type'],
-                    'summary': digest['summary'],
-                    'url': digest['url'],
-                    'created_at': digest['created_at'].isoformat()
-                })
-
-            json_content = json.dumps(export_data, indent=2)
-
-            st.download_button(
-                label="⬇️ Download JSON",
-                data=json_content,
-                file_name=f"ai_news_digests_{datetime.now().strftime('%Y%m%d')}.json",
-                mime="application/json",
-                use_container_width=True
-            )
+        st.download_button(
+            label="📊 Export as JSON",
+            data=build_json(rows),
+            file_name=f"ai_news_digests_{today.strftime('%Y%m%d')}.json",
+            mime="application/json",
+            use_container_width=True
+        )
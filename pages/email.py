@@ -1,131 +1,80 @@
 """Email page - Send AI news digest emails on-demand."""
 
+import os
 import streamlit as st
 import requests
 from datetime import datetime, timedelta
-from src.database.repository import Repository
+from src.ui.cache import get_recent_digests_cached
+from src.ui.constants import DEFAULT_TYPE_EMOJI, TYPE_EMOJI
+
+# Send in-process when the email stack is importable; otherwise go through FastAPI
+try:
+    import src.agents  # noqa: F401 (LLM stack used by build_digest_email)
+    from src.services.email import send_email, build_digest_email
+except ImportError:
+    build_digest_email = None
 
 
 @st.cache_resource
-def get_cached_repository():
-    """Get database repository (cached)."""
-    return Repository()
+def get_http_session():
+    """Get a keep-alive HTTP session for the FastAPI fallback (cached)."""
+    return requests.Session()
 
 
-@st.cache_data(ttl=60)
-def get_recent_digests_cached(hours: int):
-    """Get recent digests from database (cached for 60 seconds)."""
+def load_recent_digests(hours: int):
+    """Get recent digests (shared cache), reporting database errors."""
     try:
-        repo = get_cached_repository()
-        return repo.get_recent_digests(hours=hours)
+        return get_recent_digests_cached(hours=hours)
     except Exception as e:
         st.error(f"Database error: {e}")
         return []
 
 
-def show():
-    """Display email page."""
-    st.markdown('<h1 class="main-header">📧 Email Digest</h1>', unsafe_allow_html=True)
-    st.markdown('<p class="sub-header">Send AI news digest emails on-demand</p>', unsafe_allow_html=True)
-
-    st.info("""
-    **📨 Send Email Features:**
-    - ✅ Send digest immediately with custom parameters
-    - ✅ Preview articles before sending
-    - ✅ Customize time window and article count
-    - ✅ Track email history
-
-    **Note:** FastAPI must be running on port 8000 for this feature to work.
-    """)
-
-    # Configuration
-    st.markdown("---")
-    st.subheader("⚙️ Email Configuration")
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        hours = st.selectbox(
-            "⏱️ Time Window",
-            [1, 6, 12, 24, 48, 72, 168],
-            index=3,
-            format_func=lambda x: {
-                1: "Last 1 hour",
-                6: "Last 6 hours",
-                12: "Last 12 hours",
-                24: "Last 24 hours (1 day)",
-                48: "Last 48 hours (2 days)",
-                72: "Last 72 hours (3 days)",
-                168: "Last 168 hours (1 week)"
-            }[x],
-            help="How far back to include articles"
-        )
-
-    with col2:
-        top_n = st.number_input(
-            "📊 Number of Articles",
-            min_value=1,
-            max_value=50,
-            value=10,
-            step=1,
-            help="How many top articles to include in email"
-        )
+def send_digest_email_direct(digests, top_n: int, recipient: str = None, subject: str = None) -> dict:
+    """
+    Build and send the digest email in-process, without the FastAPI hop.
 
-    # Optional custom recipient
-    with st.expander("🔧 Advanced Options"):
-        custom_recipient = st.text_input(
-            "📬 Custom Recipient (Optional)",
-            placeholder="Leave empty to use MY_EMAIL from .env",
-            help="Override the default recipient email"
-        )
+    Mirrors POST /api/v1/email/send, reusing the digests already loaded
+    for the preview.
 
-        custom_subject = st.text_input(
-            "📝 Custom Subject (Optional)",
-            placeholder="Leave empty for default subject",
-            help="Custom email subject line"
-        )
-
-    # Preview articles
-    st.markdown("---")
-    st.subheader("📋 Preview Articles")
+    Args:
+        digests: Recent digests, newest first
+        top_n: Number of top articles to include
+        recipient: Email recipient (defaults to MY_EMAIL)
+        subject: Email subject (defaults to the standard digest subject)
 
-    # Use cached function to avoid slow page loads
-    with st.spinner("Loading articles..."):
-        digests = get_recent_digests_cached(hours=hours)
+    Returns:
+        Dictionary with recipient and articles_count, like the API response
 
-    if digests:
-        preview_digests = digests[:top_n]
+    Raises:
+        ValueError: If no recipient is specified and MY_EMAIL is not configured
+    """
+    recipient = recipient or os.getenv("MY_EMAIL")
+    if not recipient:
+        raise ValueError("No recipient specified and MY_EMAIL not configured")
 
-        st.success(f"✅ Found {len(digests)} digests. Top {len(preview_digests)} will be sent:")
+    email = build_digest_email(digests, top_n=top_n, subject=subject)
+    send_email(
+        subject=email["subject"],
+        body_text=email["body_text"],
+        body_html=email["body_html"],
+        recipients=[recipient]
+    )
 
-        # Show preview
-        for i, digest in enumerate(preview_digests, 1):
-            type_emoji = {
-                'official': '🏢',
-                'research': '🔬',
-                'news': '📰',
-                'safety': '🛡️',
-                'youtube': '📺'
-            }.get(digest['article_type'], '📄')
+    return {
+        "recipient": recipient,
+        "articles_count": email["articles_count"]
+    }
 
-            with st.expander(f"{type_emoji} #{i} - {digest['title'][:60]}...", expanded=(i <= 3)):
-                st.markdown(f"**Type:** `{digest['article_type']}`")
-                st.markdown(f"**Published:** {digest['created_at'].strftime('%Y-%m-%d %H:%M')}")
-                st.markdown("**Summary:**")
-                st.write(digest['summary'])
-                st.markdown(f"[🔗 Read Full Article]({digest['url']})")
-    else:
-        st.warning(f"⚠️ No digests found in the last {hours} hours.")
-        st.info("""
-        **To generate digests:**
-        1. Go to the 🚀 Workflow page
-        2. Run the complete workflow
-        3. Come back here to send email
-        """)
 
-    # Send Email Button
-    st.markdown("---")
+@st.fragment
+def render_send_section(digests, hours: int, top_n: int, custom_recipient: str, custom_subject: str):
+    """
+    Render the Send button and its result.
 
+    Runs as a fragment, so clicking Send reruns only this section and
+    leaves the article preview above untouched.
+    """
     col1, col2, col3 = st.columns([1, 2, 1])
 
     with col2:
@@ -140,28 +89,52 @@ def show():
         # Show loading
         with st.spinner("📤 Sending email..."):
             try:
-                # Prepare request
-                payload = {
-                    "hours": hours,
-                    "top_n": top_n
-                }
+                result = None
+
+                if build_digest_email is not None:
+                    # Same process as the preview: no HTTP round-trip or re-query
+                    result = send_digest_email_direct(
+                        digests,
+                        top_n=top_n,
+                        recipient=custom_recipient or None,
+                        subject=custom_subject or None
+                    )
+
+                else:
+                    # Prepare request
+                    payload = {
+                        "hours": hours,
+                        "top_n": top_n
+                    }
+
+                    if custom_recipient:
+                        payload["recipient"] = custom_recipient
+
+                    if custom_subject:
+                        payload["subject"] = custom_subject
+
+                    # Call FastAPI endpoint
+                    response = get_http_session().post(
+                        "http://localhost:8000/api/v1/email/send",
+                        json=payload,
+                        timeout=30
+                    )
 
-                if custom_recipient:
-                    payload["recipient"] = custom_recipient
+                    if response.status_code == 200:
+                        result = response.json()
 
-                if custom_subject:
-                    payload["subject"] = custom_subject
+                    elif response.status_code == 404:
+                        st.error("❌ No digests found. Run the workflow first to generate articles.")
 
-                # Call FastAPI endpoint
-                response = requests.post(
-                    "http://localhost:8000/api/v1/email/send",
-                    json=payload,
-                    timeout=30
-                )
+                    elif response.status_code == 400:
+                        error_detail = response.json().get('detail', 'Unknown error')
+                        st.error(f"❌ Configuration Error: {error_detail}")
 
-                if response.status_code == 200:
-                    result = response.json()
+                    else:
+                        error_detail = response.json().get('detail', 'Unknown error')
+                        st.error(f"❌ Error: {error_detail}")
 
+                if result:
                     st.success(f"""
                     ### ✅ Email Sent Successfully!
 
@@ -175,16 +148,8 @@ def show():
                     # Confetti effect
                     st.balloons()
 
-                elif response.status_code == 404:
-                    st.error("❌ No digests found. Run the workflow first to generate articles.")
-
-                elif response.status_code == 400:
-                    error_detail = response.json().get('detail', 'Unknown error')
-                    st.error(f"❌ Configuration Error: {error_detail}")
-
-                else:
-                    error_detail = response.json().get('detail', 'Unknown error')
-                    st.error(f"❌ Error: {error_detail}")
+            except ValueError as e:
+                st.error(f"❌ Configuration Error: {e}")
 
             except requests.exceptions.ConnectionError:
                 st.error("""
@@ -207,6 +172,118 @@ def show():
             except Exception as e:
                 st.error(f"❌ Unexpected error: {str(e)}")
 
+
+def show():
+    """Display email page."""
+    st.markdown('<h1 class="main-header">📧 Email Digest</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="sub-header">Send AI news digest emails on-demand</p>', unsafe_allow_html=True)
+
+    st.info("""
+    **📨 Send Email Features:**
+    - ✅ Send digest immediately with custom parameters
+    - ✅ Preview articles before sending
+    - ✅ Customize time window and article count
+    - ✅ Track email history
+
+    **Note:** Emails are sent directly from this app; FastAPI on port 8000 is only needed as a fallback.
+    """)
+
+    # Configuration
+    st.markdown("---")
+    st.subheader("⚙️ Email Configuration")
+
+    # Inputs are batched in a form so the digests are only queried on submit
+    with st.form("email_cfg"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            hours = st.selectbox(
+                "⏱️ Time Window",
+                [1, 6, 12, 24, 48, 72, 168],
+                index=3,
+                format_func=lambda x: {
+                    1: "Last 1 hour",
+                    6: "Last 6 hours",
+                    12: "Last 12 hours",
+                    24: "Last 24 hours (1 day)",
+                    48: "Last 48 hours (2 days)",
+                    72: "Last 72 hours (3 days)",
+                    168: "Last 168 hours (1 week)"
+                }[x],
+                help="How far back to include articles"
+            )
+
+        with col2:
+            top_n = st.number_input(
+                "📊 Number of Articles",
+                min_value=1,
+                max_value=50,
+                value=10,
+                step=1,
+                help="How many top articles to include in email"
+            )
+
+        # Optional custom recipient
+        with st.expander("🔧 Advanced Options"):
+            custom_recipient = st.text_input(
+                "📬 Custom Recipient (Optional)",
+                placeholder="Leave empty to use MY_EMAIL from .env",
+                help="Override the default recipient email"
+            )
+
+            custom_subject = st.text_input(
+                "📝 Custom Subject (Optional)",
+                placeholder="Leave empty for default subject",
+                help="Custom email subject line"
+            )
+
+        submitted = st.form_submit_button("🔍 Preview")
+
+    if submitted:
+        st.session_state['email_last_hours'] = hours
+
+    # Preview articles
+    st.markdown("---")
+    st.subheader("📋 Preview Articles")
+
+    previewed = st.session_state.get('email_last_hours') == hours
+    digests = []
+
+    if previewed:
+        # Use cached function to avoid slow page loads
+        with st.spinner("Loading articles..."):
+            digests = load_recent_digests(hours=hours)
+
+    if digests:
+        preview_digests = digests[:top_n]
+
+        st.success(f"✅ Found {len(digests)} digests. Top {len(preview_digests)} will be sent:")
+
+        # Show preview
+        for i, digest in enumerate(preview_digests, 1):
+            type_emoji = TYPE_EMOJI.get(digest['article_type'], DEFAULT_TYPE_EMOJI)
+
+            with st.expander(f"{type_emoji} #{i} - {digest['title'][:60]}...", expanded=(i <= 3)):
+                st.markdown(f"**Type:** `{digest['article_type']}`")
+                st.markdown(f"**Published:** {digest['created_at'].strftime('%Y-%m-%d %H:%M')}")
+                st.markdown("**Summary:**")
+                st.write(digest['summary'])
+                st.markdown(f"[🔗 Read Full Article]({digest['url']})")
+    elif not previewed:
+        st.info("👆 Choose a time window and click **Preview** to load articles.")
+    else:
+        st.warning(f"⚠️ No digests found in the last {hours} hours.")
+        st.info("""
+        **To generate digests:**
+        1. Go to the 🚀 Workflow page
+        2. Run the complete workflow
+        3. Come back here to send email
+        """)
+
+    # Send Email Button
+    st.markdown("---")
+    render_send_section(digests, hours, top_n, custom_recipient, custom_subject)
+
     # Email History (show last sent)
     st.markdown("---")
     with st.expander("📜 About Email Digest"):
@@ -228,7 +305,7 @@ def show():
         **Manual vs Scheduled:**
         - **This page:** Send email RIGHT NOW
         - **n8n workflow:** Send automatically on schedule
-        - **Both use the same FastAPI endpoint**
+        - **Both send the same digest email**
 
         ### 🔧 Configuration
 
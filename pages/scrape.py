@@ -1,8 +1,121 @@
 """Scrape page - Trigger article scraping."""
 
+import textwrap
+from collections import Counter
+from itertools import islice
+
 import streamlit as st
 from datetime import datetime
 from src.core.runner import run_scrapers
+from src.ui.constants import DEFAULT_TYPE_EMOJI, TYPE_EMOJI
+from src.ui.html import details_html, field_html
+
+
+@st.fragment
+def render_scrape_results(results):
+    """
+    Display the results of the last scrape.
+
+    Runs as a fragment, so interacting with the results reruns only this
+    panel instead of the whole page.
+
+    Args:
+        results: Scraper results (youtube, web, total)
+    """
+    st.success("🎉 Successfully scraped articles!")
+
+    st.markdown("---")
+    st.subheader("📊 Scraping Results")
+
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        youtube_count = len(results.get("youtube", []))
+        st.metric(
+            "📺 YouTube Videos",
+            youtube_count,
+            delta=f"+{youtube_count}" if youtube_count > 0 else None
+        )
+
+    with col2:
+        web_count = len(results.get("web", []))
+        st.metric(
+            "🌐 Web Articles",
+            web_count,
+            delta=f"+{web_count}" if web_count > 0 else None
+        )
+
+    with col3:
+        total = results.get("total", 0)
+        st.metric(
+            "📚 Total Articles",
+            total,
+            delta=f"+{total}" if total > 0 else None
+        )
+
+    # Detailed breakdown
+    if results.get("web"):
+        st.markdown("---")
+        st.subheader("🌐 Web Articles Breakdown")
+
+        # Count by category
+        by_category = Counter(article.category for article in results["web"])
+
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("🏢 Official", by_category['official'])
+        with col2:
+            st.metric("🔬 Research", by_category['research'])
+        with col3:
+            st.metric("📰 News", by_category['news'])
+        with col4:
+            st.metric("🛡️ Safety", by_category['safety'])
+
+    # Sample articles
+    if results.get("youtube") or results.get("web"):
+        st.markdown("---")
+        st.subheader("📋 Sample Articles")
+
+        # Samples are emitted as one HTML element per list
+        # Show first few YouTube
+        if results.get("youtube"):
+            st.markdown("**📺 YouTube Videos:**")
+            st.markdown("".join(
+                details_html(f"▶️ {video.title}", [
+                    field_html("Video ID", video.video_id),
+                    field_html("Published", video.published_at),
+                    field_html("URL", video.url),
+                    field_html("Description", textwrap.shorten(video.description, 200, placeholder="...")) if video.description else ""
+                ])
+                for video in islice(results["youtube"], 3)
+            ), unsafe_allow_html=True)
+
+        # Show first few web
+        if results.get("web"):
+            st.markdown("**🌐 Web Articles:**")
+            st.markdown("".join(
+                details_html(f"{TYPE_EMOJI.get(article.category, DEFAULT_TYPE_EMOJI)} {article.title}", [
+                    field_html("Source", article.source_name),
+                    field_html("Category", article.category),
+                    field_html("Published", article.published_at),
+                    field_html("URL", article.url)
+                ])
+                for article in islice(results["web"], 5)
+            ), unsafe_allow_html=True)
+
+    # Next steps
+    st.markdown("---")
+    st.success("""
+    ### ✅ Scraping Complete!
+
+    **Next Steps:**
+    1. Go to **🚀 Workflow** to process articles and generate AI summaries
+    2. Or wait and scraping will happen automatically during the next workflow run
+
+    **Note:** These articles are now in your database but haven't been processed by AI yet.
+    """)
 
 
 def show():
@@ -49,11 +162,11 @@ def show():
     with col2:
         st.markdown("**⏱️ Estimated Time**")
         st.code("""
-YouTube (3):  ~10-15 seconds
-Web RSS (17): ~30-40 seconds
-Web Crawl (3): ~60-90 seconds
+YouTube (3):   ~5 seconds
+Web RSS (17):  ~10 seconds
+Web Crawl (3): ~20-30 seconds
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Total:        ~2-3 minutes
+Total:         ~30 seconds (run in parallel)
         """, language="text")
 
     st.markdown("---")
@@ -75,105 +188,8 @@ Total:        ~2-3 minutes
             progress_bar.progress(100)
             status_text.text("✅ Scraping complete!")
 
-            # Display results
-            st.success("🎉 Successfully scraped articles!")
-
-            st.markdown("---")
-            st.subheader("📊 Scraping Results")
-
-            # Summary metrics
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                youtube_count = len(results.get("youtube", []))
-                st.metric(
-                    "📺 YouTube Videos",
-                    youtube_count,
-                    delta=f"+{youtube_count}" if youtube_count > 0 else None
-                )
-
-            with col2:
-                web_count = len(results.get("web", []))
-                st.metric(
-                    "🌐 Web Articles",
-                    web_count,
-                    delta=f"+{web_count}" if web_count > 0 else None
-                )
-
-            with col3:
-                total = results.get("total", 0)
-                st.metric(
-                    "📚 Total Articles",
-                    total,
-                    delta=f"+{total}" if total > 0 else None
-                )
-
-            # Detailed breakdown
-            if results.get("web"):
-                st.markdown("---")
-                st.subheader("🌐 Web Articles Breakdown")
-
-                # Count by category
-                by_category = {}
-                for article in results["web"]:
-                    cat = article.category
-                    by_category[cat] = by_category.get(cat, 0) + 1
-
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    st.metric("🏢 Official", by_category.get('official', 0))
-                with col2:
-                    st.metric("🔬 Research", by_category.get('research', 0))
-                with col3:
-                    st.metric("📰 News", by_category.get('news', 0))
-                with col4:
-                    st.metric("🛡️ Safety", by_category.get('safety', 0))
-
-            # Sample articles
-            if results.get("youtube") or results.get("web"):
-                st.markdown("---")
-                st.subheader("📋 Sample Articles")
-
-                # Show first few YouTube
-                if results.get("youtube"):
-                    st.markdown("**📺 YouTube Videos:**")
-                    for video in results["youtube"][:3]:
-                        with st.expander(f"▶️ {video.title}"):
-                            st.write(f"**Video ID:** {video.video_id}")
-                            st.write(f"**Published:** {video.published_at}")
-                            st.write(f"**URL:** {video.url}")
-                            if video.description:
-                                st.write(f"**Description:** {video.description[:200]}...")
-
-                # Show first few web
-                if results.get("web"):
-                    st.markdown("**🌐 Web Articles:**")
-                    for article in results["web"][:5]:
-                        emoji = {
-                            'official': '🏢',
-                            'research': '🔬',
-                            'news': '📰',
-                            'safety': '🛡️'
-                        }.get(article.category, '📄')
-
-                        with st.expander(f"{emoji} {article.title}"):
-                            st.write(f"**Source:** {article.source_name}")
-                            st.write(f"**Category:** {article.category}")
-                            st.write(f"**Published:** {article.published_at}")
-                            st.write(f"**URL:** {article.url}")
-
-            # Next steps
-            st.markdown("---")
-            st.success("""
-            ### ✅ Scraping Complete!
-
-            **Next Steps:**
-            1. Go to **🚀 Workflow** to process articles and generate AI summaries
-            2. Or wait and scraping will happen automatically during the next workflow run
-
-            **Note:** These articles are now in your database but haven't been processed by AI yet.
-            """)
+            # Kept in session state so the results survive later reruns
+            st.session_state['scrape_results'] = results
 
         except Exception as e:
             progress_bar.progress(0)
@@ -181,6 +197,9 @@ Total:        ~2-3 minutes
             st.error(f"Error: {str(e)}")
             st.exception(e)
 
+    if st.session_state.get('scrape_results') is not None:
+        render_scrape_results(st.session_state['scrape_results'])
+
     # Tips
     st.markdown("---")
     with st.expander("💡 Scraping Tips"):
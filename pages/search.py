@@ -1,13 +1,110 @@
 """Search page - Semantic search with RAG."""
 
+import pandas as pd
 import streamlit as st
-from src.rag.retriever import get_article_retriever
+from src.rag.semantic_cache import get_semantic_cache
+from src.ui.cache import get_cached_retriever
+from src.ui.constants import DEFAULT_TYPE_EMOJI, TYPE_EMOJI
+
+# Type filter labels -> article_type values
+TYPE_FILTERS = {
+    "All Types": None,
+    "Official Blogs": "official",
+    "Research Papers": "research",
+    "News Sites": "news",
+    "AI Safety": "safety",
+    "YouTube": "youtube"
+}
+
+
+# Rendered client-side from one dataframe message
+RESULT_COLUMNS = {
+    "#": st.column_config.NumberColumn(width="small"),
+    "Title": st.column_config.TextColumn(width="large"),
+    "Type": st.column_config.TextColumn(width="small"),
+    "Relevance": st.column_config.NumberColumn(format="%.0f%%", width="small"),
+    "URL": st.column_config.LinkColumn(display_text="🔗 Open", width="small"),
+}
+
+
+def relevance(result) -> float:
+    """Convert a result's cosine distance to a 0-100 relevance score."""
+    distance = result.get("distance", 0)
+    return (1 - distance) * 100 if distance is not None else 0.0
+
+
+def results_dataframe(results) -> pd.DataFrame:
+    """Build the results table, one row per article, in rank order."""
+    rows = []
+    for rank, result in enumerate(results, 1):
+        metadata = result.get("metadata", {})
+        article_type_str = metadata.get("article_type", "unknown")
+        rows.append({
+            "#": rank,
+            "Title": metadata.get("title", "N/A"),
+            "Type": f"{TYPE_EMOJI.get(article_type_str, DEFAULT_TYPE_EMOJI)} {article_type_str}",
+            "Relevance": round(relevance(result), 1),
+            "URL": metadata.get("url") or None,
+        })
+    return pd.DataFrame(rows, columns=list(RESULT_COLUMNS))
+
+
+def cached_find_similar(retriever, query: str, n_results: int, article_type, use_cache: bool = True):
+    """
+    Find similar articles, serving repeat and near-duplicate queries from cache.
+
+    Exact repeats skip the embedding model (on-disk embedding cache);
+    near-duplicates skip the vector store (semantic query cache).
+
+    Args:
+        retriever: Article retriever
+        query: Text query
+        n_results: Number of results to return
+        article_type: Filter by type (None for all)
+        use_cache: Whether to read and populate the semantic cache
+
+    Returns:
+        List of similar articles with scores
+    """
+    if not use_cache:
+        return retriever.find_similar(query=query, n_results=n_results, article_type=article_type,
+                                      use_cache=False)
+
+    cache = get_semantic_cache()
+    query_embedding = retriever.embed_query_cached(query)
+
+    results = cache.get(query_embedding, article_type=article_type, limit=n_results)
+    if results is None:
+        results = retriever.search_by_embedding(
+            query_embedding=query_embedding,
+            n_results=n_results,
+            article_type=article_type
+        )
+        # Empty results are usually an unindexed store; don't pin them
+        if results:
+            cache.put(query_embedding, results, article_type=article_type, limit=n_results)
+    return results
+
+
+@st.cache_data(ttl=600, show_spinner=False)  # Cache for 10 minutes
+def search_cached(query: str, n_results: int, article_type):
+    """
+    Search results keyed by exact (query, n_results, article_type).
+
+    Repeats within the TTL skip the embedding, semantic cache and vector
+    store entirely; misses fall through to cached_find_similar.
+
+    Returns:
+        List of similar articles with scores (plain Python values)
+    """
+    return cached_find_similar(get_cached_retriever(), query, n_results, article_type)
 
 
-@st.cache_resource
-def get_cached_retriever():
-    """Get article retriever (cached across all users)."""
-    return get_article_retriever()
+def set_quick_query(query: str):
+    """Quick search callback: fill the search box and run the search on this rerun."""
+    st.session_state['search_input'] = query
+    st.session_state['search_query'] = query
+    st.session_state['search_triggered'] = False
 
 
 def show():
@@ -19,7 +116,7 @@ def show():
     if 'search_triggered' not in st.session_state:
         st.session_state['search_triggered'] = False
 
-    # Handle quick search query from session state
+    # Handle quick search query from session state (set by set_quick_query)
     default_query = st.session_state.pop('search_query', '')
 
     # Search interface
@@ -28,7 +125,6 @@ def show():
     with col1:
         query = st.text_input(
             "🔎 Search Query",
-            value=default_query,
             placeholder="e.g., GPT-5 reasoning capabilities, LLM safety research, AI alignment...",
             help="Enter any topic - the AI will find semantically similar articles",
             key="search_input"
@@ -49,18 +145,15 @@ def show():
     with col1:
         article_type = st.selectbox(
             "📂 Filter by Type",
-            ["All Types", "Official Blogs", "Research Papers", "News Sites", "AI Safety", "YouTube"],
+            list(TYPE_FILTERS),
             help="Filter results by source category"
         )
 
-    type_map = {
-        "All Types": None,
-        "Official Blogs": "official",
-        "Research Papers": "research",
-        "News Sites": "news",
-        "AI Safety": "safety",
-        "YouTube": "youtube"
-    }
+    use_cache = st.sidebar.toggle(
+        "⚡ Cache search results",
+        value=True,
+        help="Serve repeated and near-identical queries from memory (10 min)"
+    )
 
     # Search button - only trigger on button click or when quick search is used
     search_clicked = st.button("🔍 Search", type="primary", use_container_width=True)
@@ -76,14 +169,20 @@ def show():
 
         with st.spinner("🔄 Searching with AI..."):
             try:
-                retriever = get_cached_retriever()
-                results = retriever.find_similar(
-                    query=query,
-                    n_results=num_results,
-                    article_type=type_map[article_type]
-                )
+                if use_cache:
+                    results = search_cached(query.strip(), int(num_results), TYPE_FILTERS[article_type])
+                else:
+                    results = cached_find_similar(
+                        get_cached_retriever(),
+                        query=query,
+                        n_results=num_results,
+                        article_type=TYPE_FILTERS[article_type],
+                        use_cache=False
+                    )
 
                 if not results:
+                    # Usually an unindexed store; don't pin the empty result
+                    search_cached.clear()
                     st.info("🤷 No results found. Try a different query or run the workflow to index more articles.")
                     return
 
@@ -91,46 +190,20 @@ def show():
                 st.success(f"✅ Found {len(results)} relevant articles")
                 st.markdown("---")
 
-                for i, result in enumerate(results, 1):
-                    metadata = result.get("metadata", {})
-                    distance = result.get("distance", 0)
-                    similarity = (1 - distance) * 100 if distance is not None else 0
-
-                    # Result card
-                    with st.container():
-                        col1, col2 = st.columns([4, 1])
-
-                        with col1:
-                            st.markdown(f"### {i}. {metadata.get('title', 'N/A')}")
-
-                        with col2:
-                            st.metric("Relevance", f"{similarity:.0f}%")
-
-                        # Type badge
-                        article_type_str = metadata.get('article_type', 'unknown')
-                        type_emoji = {
-                            'official': '🏢',
-                            'research': '🔬',
-                            'news': '📰',
-                            'safety': '🛡️',
-                            'youtube': '📺'
-                        }
-                        emoji = type_emoji.get(article_type_str, '📄')
-
-                        st.markdown(f"{emoji} **Type:** `{article_type_str}`")
-
-                        # Summary
-                        document = result.get("document", "")
-                        if document:
-                            with st.expander("📝 Summary"):
-                                st.write(document)
-
-                        # Link
-                        url = metadata.get("url", "")
-                        if url:
-                            st.markdown(f"[🔗 Read Full Article]({url})")
+                # All results in one table element
+                st.dataframe(
+                    results_dataframe(results),
+                    column_config=RESULT_COLUMNS,
+                    use_container_width=True,
+                    hide_index=True
+                )
 
-                        st.markdown("---")
+                # Summary only for the top hit
+                top_document = results[0].get("document")
+                if top_document:
+                    top_title = results[0].get("metadata", {}).get("title", "N/A")
+                    with st.expander(f"📝 Top result: {top_title}", expanded=True):
+                        st.write(top_document)
 
             except Exception as e:
                 st.error(f"❌ Search failed: {str(e)}")
@@ -175,20 +248,15 @@ def show():
 
     col1, col2, col3 = st.columns(3)
 
+    # Callbacks run before the click's rerun, so the search renders in a single pass
     with col1:
-        if st.button("🤖 LLM Reasoning", use_container_width=True):
-            st.session_state['search_query'] = "large language model reasoning and chain of thought"
-            st.session_state['search_triggered'] = False
-            st.rerun()
+        st.button("🤖 LLM Reasoning", use_container_width=True, on_click=set_quick_query,
+                  args=("large language model reasoning and chain of thought",))
 
     with col2:
-        if st.button("🛡️ AI Safety", use_container_width=True):
-            st.session_state['search_query'] = "AI safety alignment and risks"
-            st.session_state['search_triggered'] = False
-            st.rerun()
+        st.button("🛡️ AI Safety", use_container_width=True, on_click=set_quick_query,
+                  args=("AI safety alignment and risks",))
 
     with col3:
-        if st.button("🔬 Research Papers", use_container_width=True):
-            st.session_state['search_query'] = "recent AI research breakthroughs"
-            st.session_state['search_triggered'] = False
-            st.rerun()
+        st.button("🔬 Research Papers", use_container_width=True, on_click=set_quick_query,
+                  args=("recent AI research breakthroughs",))
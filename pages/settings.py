@@ -2,21 +2,18 @@
 
 import streamlit as st
 import os
+import webbrowser
 from src.config.settings import get_settings
+from src.config.web_sources import ALL_WEB_SOURCES
+from src.rag.semantic_cache import get_semantic_cache
+from src.ui.cache import get_cached_repository, get_cached_retriever
 
-
-@st.cache_resource
-def get_cached_repository():
-    """Get database repository (cached)."""
-    from src.database.repository import Repository
-    return Repository()
-
-
-@st.cache_resource
-def get_cached_retriever():
-    """Get article retriever (cached)."""
-    from src.rag.retriever import get_article_retriever
-    return get_article_retriever()
+# Display names for the configured YouTube channel IDs
+CHANNEL_NAMES = {
+    "UCyR2Ct3pDOeZSRyZH5hPO-Q": "Varun Mayya",
+    "UCNU_lfiiWBdtULKOw6X0Dig": "Krish Naik",
+    "UCh9nVJoWXmFb7sLApWGcLPQ": "Codebasics"
+}
 
 
 def show():
@@ -194,7 +191,6 @@ CORS:    Enabled
         """, language="text")
 
         if st.button("🔗 Open Swagger UI"):
-            import webbrowser
             webbrowser.open("http://localhost:8000/docs")
 
     with col2:
@@ -242,12 +238,7 @@ Output:     Console
 
         channels = settings.youtube_channels
         for i, channel_id in enumerate(channels, 1):
-            channel_names = {
-                "UCyR2Ct3pDOeZSRyZH5hPO-Q": "Varun Mayya",
-                "UCNU_lfiiWBdtULKOw6X0Dig": "Krish Naik",
-                "UCh9nVJoWXmFb7sLApWGcLPQ": "Codebasics"
-            }
-            name = channel_names.get(channel_id, "Unknown")
+            name = CHANNEL_NAMES.get(channel_id, "Unknown")
 
             st.markdown(f"**{i}. {name}**")
             st.code(f"Channel ID: {channel_id}")
@@ -256,8 +247,6 @@ Output:     Console
     with tab2:
         st.markdown("**Web Sources (20)**")
 
-        from src.config.web_sources import ALL_WEB_SOURCES
-
         for i, source in enumerate(ALL_WEB_SOURCES, 1):
             with st.expander(f"{i}. {source.name} - {source.category}"):
                 st.markdown(f"**URL:** {source.url}")
@@ -303,6 +292,8 @@ Output:     Console
 
     with col1:
         if st.button("🔄 Reload Configuration", use_container_width=True):
+            # Settings are memoized per process; drop them so .env is re-read
+            get_settings.cache_clear()
             st.cache_data.clear()
             st.cache_resource.clear()
             st.success("✅ Configuration reloaded!")
@@ -312,4 +303,5 @@ Output:     Console
         if st.button("🗑️ Clear Caches", use_container_width=True):
             st.cache_data.clear()
             st.cache_resource.clear()
+            get_semantic_cache().clear()
             st.success("✅ Caches cleared!")
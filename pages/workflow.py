@@ -1,8 +1,171 @@
 """Workflow page - Run complete 6-stage workflow."""
 
+import time
+
 import streamlit as st
-from datetime import datetime
-from src.workflows.workflow import run_workflow
+from datetime import datetime, timezone
+from src.ui.html import details_html
+from src.core.jobs import get_job_registry
+
+# Stage title -> what happens (HTML list items); built once at import
+_STAGE_DETAILS = [
+    ("🕷️ Stage 1: Scraping", [
+        "Scrape 3 YouTube channels",
+        "Scrape 20 web sources (RSS + Crawl4AI)",
+        "Save raw articles to database",
+        "<strong>Time:</strong> ~2-3 minutes",
+    ]),
+    ("🔧 Stage 2: Processing", [
+        "Fetch YouTube transcripts (if missing)",
+        "Web articles already have content from Crawl4AI",
+        "<strong>Time:</strong> ~30-60 seconds",
+    ]),
+    ("📝 Stage 3: AI Digest Generation", [
+        "Use Gemini AI to generate summaries",
+        "Extract key points and insights",
+        "Save digests to database",
+        "<strong>Time:</strong> ~3-8 minutes (depends on article count)",
+        "<strong>Note:</strong> Limited by Gemini API quota (10 requests/minute for free tier)",
+    ]),
+    ("🗄️ Stage 4: RAG Indexing", [
+        "Generate embeddings using sentence-transformers",
+        "Index in ChromaDB vector database",
+        "Enable semantic search",
+        "<strong>Time:</strong> ~30-60 seconds",
+    ]),
+    ("🎯 Stage 5: Ranking", [
+        "Use Gemini AI to rank articles by relevance",
+        "Consider user preferences and interests",
+        "RAG-enhanced context from historical articles",
+        "<strong>Time:</strong> ~1-2 minutes",
+    ]),
+    ("📧 Stage 6: Email", [
+        "Generate personalized email content",
+        "Include top N ranked articles",
+        "Send via configured SMTP",
+        "<strong>Time:</strong> ~5-10 seconds",
+    ]),
+]
+STAGE_DETAILS_HTML = "".join(
+    details_html(title, ["<ul>", *(f"<li>{item}</li>" for item in items), "</ul>"], expanded=(i == 0))
+    for i, (title, items) in enumerate(_STAGE_DETAILS)
+)
+
+# Successful runs are reused for the same settings on the same (UTC) day
+WORKFLOW_CACHE_TTL = 3600  # seconds
+
+
+@st.cache_resource(show_spinner=False)
+def get_workflow_results():
+    """
+    Successful workflow results, keyed by (hours, top_n, UTC date).
+
+    Shared across sessions, so a second click does not re-run the
+    pipeline (and re-send the email). Values are (finished_at, result)
+    and must be treated as read-only.
+    """
+    return {}
+
+
+def stream_ranked_articles(articles, top_n: int):
+    """
+    Yield the top ranked articles as Markdown chunks, one per article.
+
+    Consumed by st.write_stream, so the first articles are on screen
+    before the rest are formatted.
+    """
+    for i, article in enumerate(articles[:top_n], 1):
+        reasoning = article.get('reasoning') or 'N/A'
+        yield (
+            f"#### #{i} - {article['title']}\n\n"
+            f"**Relevance Score:** {article['relevance_score']:.1f}/10 &nbsp;·&nbsp; **Rank:** #{article['rank']}\n\n"
+            f"**📝 Summary:** {article['summary']}\n\n"
+            f"> 🤔 **Why this article?** {reasoning}\n\n"
+            f"[🔗 Read Full Article]({article['url']})\n\n---\n\n"
+        )
+
+
+@st.fragment(run_every=2)
+def watch_workflow_job(job_id: str):
+    """Poll a running workflow job, rerunning the page once it finishes."""
+    job = get_job_registry().get(job_id)
+    if job is None or job.done:
+        st.rerun()
+
+    st.progress(job.pct)
+    st.markdown("### 🔄 Running Workflow... (this may take 5-15 minutes)")
+    st.markdown(job.msg or "⏳ Starting...")
+    st.caption("Runs on the server: you can leave this page and come back.")
+
+
+def render_workflow_result(result, top_n: int):
+    """Display a finished workflow's metrics, top articles or errors."""
+    if result and result.get("success"):
+        st.progress(100)
+        st.markdown("### ✅ Workflow Complete!")
+
+        # Display results
+        st.success("🎉 Workflow completed successfully!")
+
+        st.markdown("---")
+        st.subheader("📊 Workflow Results")
+
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+
+        counts = result["counts"]
+        articles_scraped = counts["articles"]
+        digests_created = counts["digests"]
+        articles_ranked = counts["ranked"]
+
+        with col1:
+            st.metric("📚 Articles Scraped", articles_scraped)
+
+        with col2:
+            st.metric("📝 Digests Created", digests_created)
+
+        with col3:
+            st.metric("🎯 Articles Ranked", articles_ranked)
+
+        with col4:
+            email_sent = "✅" if result.get("success") else "❌"
+            st.metric("📧 Email Status", email_sent)
+
+        # Top articles preview
+        if result["top_articles"]:
+            st.markdown("---")
+            st.subheader(f"🏆 Top {top_n} Articles (Sent in Email)")
+
+            st.write_stream(stream_ranked_articles(result["top_articles"], top_n))
+
+        # Next steps
+        st.markdown("---")
+        st.success(f"""
+        ### ✅ Workflow Complete!
+
+        **What happened:**
+        - ✅ Scraped {articles_scraped} articles from 23 sources
+        - ✅ Generated {digests_created} AI summaries
+        - ✅ Ranked {articles_ranked} articles by relevance
+        - ✅ Sent email with top {top_n} articles
+
+        **Next steps:**
+        - Check your email inbox for the digest
+        - Go to **🔍 Search** to find specific topics
+        - Go to **📰 Digests** to browse all summaries
+        """)
+
+    else:
+        st.markdown("### ❌ Workflow Failed")
+        st.error("Workflow did not complete successfully")
+
+        if result:
+            errors = result.get("errors", [])
+            if errors:
+                st.markdown("---")
+                st.subheader("❌ Errors")
+                for error in errors:
+                    st.error(f"**{error['stage']}:** {error['message']}")
 
 
 def show():
@@ -60,166 +223,65 @@ def show():
             help="Number of top articles to include in email digest"
         )
 
-    # Show what will happen
-    st.markdown("---")
-    st.subheader("📋 What Will Happen")
-
-    with st.expander("🕷️ Stage 1: Scraping", expanded=True):
-        st.markdown("""
-        - Scrape 3 YouTube channels
-        - Scrape 20 web sources (RSS + Crawl4AI)
-        - Save raw articles to database
-        - **Time:** ~2-3 minutes
-        """)
-
-    with st.expander("🔧 Stage 2: Processing"):
-        st.markdown("""
-        - Fetch YouTube transcripts (if missing)
-        - Web articles already have content from Crawl4AI
-        - **Time:** ~30-60 seconds
-        """)
-
-    with st.expander("📝 Stage 3: AI Digest Generation"):
-        st.markdown("""
-        - Use Gemini AI to generate summaries
-        - Extract key points and insights
-        - Save digests to database
-        - **Time:** ~3-8 minutes (depends on article count)
-        - **Note:** Limited by Gemini API quota (10 requests/minute for free tier)
-        """)
-
-    with st.expander("🗄️ Stage 4: RAG Indexing"):
-        st.markdown("""
-        - Generate embeddings using sentence-transformers
-        - Index in ChromaDB vector database
-        - Enable semantic search
-        - **Time:** ~30-60 seconds
-        """)
-
-    with st.expander("🎯 Stage 5: Ranking"):
-        st.markdown("""
-        - Use Gemini AI to rank articles by relevance
-        - Consider user preferences and interests
-        - RAG-enhanced context from historical articles
-        - **Time:** ~1-2 minutes
-        """)
-
-    with st.expander("📧 Stage 6: Email"):
-        st.markdown("""
-        - Generate personalized email content
-        - Include top N ranked articles
-        - Send via configured SMTP
-        - **Time:** ~5-10 seconds
-        """)
-
-    st.markdown("---")
-
-    # Run button
-    if st.button("🚀 Run Complete Workflow", type="primary", use_container_width=True):
-        # Progress tracking
-        progress = st.progress(0)
-        status = st.empty()
-        stage_info = st.empty()
-
-        try:
-            # Run workflow
-            status.markdown("### 🔄 Running Workflow...")
-
-            # Create a placeholder for stage updates
-            stage_container = st.container()
-
-            with st.spinner("⏳ This may take 5-15 minutes..."):
-                result = run_workflow(hours=hours, top_n=top_n)
-
-            if result and result.get("success"):
-                progress.progress(100)
-                status.markdown("### ✅ Workflow Complete!")
-
-                # Display results
-                st.success("🎉 Workflow completed successfully!")
+    # Show what will happen: heading, all six stage descriptions and the
+    # dividers in one element
+    st.markdown(
+        f"<hr><h3>📋 What Will Happen</h3>{STAGE_DETAILS_HTML}<hr>",
+        unsafe_allow_html=True
+    )
 
-                st.markdown("---")
-                st.subheader("📊 Workflow Results")
-
-                # Metrics
-                col1, col2, col3, col4 = st.columns(4)
-
-                with col1:
-                    articles_scraped = len(result.get("articles", []))
-                    st.metric("📚 Articles Scraped", articles_scraped)
-
-                with col2:
-                    digests_created = len(result.get("digests", []))
-                    st.metric("📝 Digests Created", digests_created)
-
-                with col3:
-                    articles_ranked = len(result.get("ranked_articles", []))
-                    st.metric("🎯 Articles Ranked", articles_ranked)
-
-                with col4:
-                    email_sent = "✅" if result.get("success") else "❌"
-                    st.metric("📧 Email Status", email_sent)
-
-                # Top articles preview
-                if result.get("ranked_articles"):
-                    st.markdown("---")
-                    st.subheader(f"🏆 Top {top_n} Articles (Sent in Email)")
-
-                    for i, article in enumerate(result["ranked_articles"][:top_n], 1):
-                        with st.expander(f"#{i} - {article['title']}", expanded=(i <= 3)):
-                            col1, col2 = st.columns([3, 1])
-
-                            with col1:
-                                st.markdown(f"**Relevance Score:** {article['relevance_score']:.1f}/10")
-
-                            with col2:
-                                st.markdown(f"**Rank:** #{article['rank']}")
-
-                            st.markdown("---")
-                            st.markdown("**📝 Summary:**")
-                            st.write(article['summary'])
-
-                            st.markdown("---")
-                            st.markdown("**🤔 Why This Article?**")
-                            st.info(article.get('reasoning', 'N/A'))
-
-                            st.markdown(f"[🔗 Read Full Article]({article['url']})")
+    # Run buttons
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        run_clicked = st.button("🚀 Run Complete Workflow", type="primary", use_container_width=True)
+    with col2:
+        force_clicked = st.button(
+            "🔁 Force Re-run",
+            use_container_width=True,
+            help="Ignore today's saved result and run the pipeline again"
+        )
 
-                # Next steps
-                st.markdown("---")
-                st.success(f"""
-                ### ✅ Workflow Complete!
-
-                **What happened:**
-                - ✅ Scraped {articles_scraped} articles from 23 sources
-                - ✅ Generated {digests_created} AI summaries
-                - ✅ Ranked {articles_ranked} articles by relevance
-                - ✅ Sent email with top {top_n} articles
-
-                **Next steps:**
-                - Check your email inbox for the digest
-                - Go to **🔍 Search** to find specific topics
-                - Go to **📰 Digests** to browse all summaries
-                """)
-
-            else:
-                progress.progress(0)
-                status.markdown("### ❌ Workflow Failed")
-                st.error("Workflow did not complete successfully")
-
-                if result:
-                    errors = result.get("errors", [])
-                    if errors:
-                        st.markdown("---")
-                        st.subheader("❌ Errors")
-                        for error in errors:
-                            st.error(f"**{error['stage']}:** {error['message']}")
-
-        except Exception as e:
-            progress.progress(0)
-            status.markdown("### ❌ Workflow Failed")
-            st.error(f"Error: {str(e)}")
-            st.exception(e)
+    results_cache = get_workflow_results()
+    cache_key = (hours, top_n, datetime.now(timezone.utc).date().isoformat())
+    job_id = st.session_state.get('workflow_job_id') or st.query_params.get('job')
+
+    if run_clicked or force_clicked:
+        cached = None if force_clicked else results_cache.get(cache_key)
+
+        if cached and time.time() - cached[0] < WORKFLOW_CACHE_TTL:
+            finished_at, result = cached
+            st.info(
+                f"♻️ Showing the run finished at {datetime.fromtimestamp(finished_at).strftime('%H:%M')} "
+                "with these settings. Use **Force Re-run** to run the pipeline again."
+            )
+            render_workflow_result(result, top_n)
+            job_id = None
+        else:
+            # Runs on a server-side worker thread, so navigating away or
+            # reloading the page does not stop it
+            job_id = get_job_registry().submit_workflow(hours=hours, top_n=top_n).id
+            st.session_state['workflow_job_id'] = job_id
+            st.query_params['job'] = job_id
+
+    if job_id:
+        job = get_job_registry().get(job_id)
+        if job is None:
+            # Server restarted or the job expired
+            st.session_state.pop('workflow_job_id', None)
+            st.query_params.pop('job', None)
+        elif not job.done:
+            watch_workflow_job(job_id)
+        else:
+            # Only successful runs are reused; failures can be retried
+            if job.status == "succeeded":
+                results_cache.setdefault(
+                    (job.params["hours"], job.params["top_n"],
+                     datetime.fromtimestamp(job.finished_at, timezone.utc).date().isoformat()),
+                    (job.finished_at, job.result)
+                )
+            if job.error:
+                st.error(f"Error: {job.error}")
+            render_workflow_result(job.result, job.params["top_n"])
 
     # Tips
     st.markdown("---")
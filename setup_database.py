@@ -2,8 +2,10 @@
 Setup script to create the PostgreSQL database if it doesn't exist.
 """
 import psycopg2
+from psycopg2 import errors, sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 import os
+from contextlib import closing
 from dotenv import load_dotenv
 
 load_dotenv('.env')
@@ -18,36 +20,27 @@ POSTGRES_DB = os.getenv('POSTGRES_DB', 'ai_news_aggregator')
 def create_database():
     """Create the database if it doesn't exist."""
     try:
-        # Connect to default 'postgres' database
+        # Short-lived admin connection to the default 'postgres' database;
+        # tables are created afterwards through the application's pooled engine
         print(f"Connecting to PostgreSQL at {POSTGRES_HOST}:{POSTGRES_PORT}...")
-        conn = psycopg2.connect(
+        with closing(psycopg2.connect(
             dbname='postgres',
             user=POSTGRES_USER,
             password=POSTGRES_PASSWORD,
             host=POSTGRES_HOST,
             port=POSTGRES_PORT
-        )
+        )) as conn:
+            # CREATE DATABASE cannot run inside a transaction
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
 
-        # Set autocommit mode
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        cursor = conn.cursor()
-
-        # Check if database exists
-        cursor.execute(
-            "SELECT 1 FROM pg_database WHERE datname = %s",
-            (POSTGRES_DB,)
-        )
-        exists = cursor.fetchone()
-
-        if exists:
-            print(f"[OK] Database '{POSTGRES_DB}' already exists")
-        else:
-            # Create database
-            cursor.execute(f'CREATE DATABASE {POSTGRES_DB}')
-            print(f"[OK] Database '{POSTGRES_DB}' created successfully")
-
-        cursor.close()
-        conn.close()
+            with conn.cursor() as cursor:
+                # Create directly and treat "already exists" as success:
+                # one round trip, and no race between a check and the create
+                try:
+                    cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(POSTGRES_DB)))
+                    print(f"[OK] Database '{POSTGRES_DB}' created successfully")
+                except errors.DuplicateDatabase:
+                    print(f"[OK] Database '{POSTGRES_DB}' already exists")
 
         return True
 
@@ -70,6 +63,11 @@ def create_tables():
         from src.database.connection import engine
 
         Base.metadata.create_all(engine)
+
+        # create_all skips existing tables; add indexes introduced since
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
         print("[OK] Tables created successfully")
 
         # List created tables
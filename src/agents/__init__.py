@@ -1,8 +1,42 @@
 """AI Agents for content processing and curation."""
 
+from functools import lru_cache
+
+from src.config.user_profile import USER_PROFILE
+
 from .base import BaseAgent
 from .digest import DigestAgent
 from .curator import CuratorAgent
 from .email import EmailAgent
 
-__all__ = ["BaseAgent", "DigestAgent", "CuratorAgent", "EmailAgent"]
+
+# Agents hold no per-run state, so one instance per process is reused
+# across workflow runs instead of being rebuilt by every node call
+
+@lru_cache(maxsize=1)
+def get_digest_agent() -> DigestAgent:
+    """Get or create the shared digest agent."""
+    return DigestAgent()
+
+
+@lru_cache(maxsize=1)
+def get_curator_agent() -> CuratorAgent:
+    """Get or create the shared curator agent for the configured user profile."""
+    return CuratorAgent(USER_PROFILE)
+
+
+@lru_cache(maxsize=1)
+def get_email_agent() -> EmailAgent:
+    """Get or create the shared email agent for the configured user profile."""
+    return EmailAgent(USER_PROFILE)
+
+
+__all__ = [
+    "BaseAgent",
+    "DigestAgent",
+    "CuratorAgent",
+    "EmailAgent",
+    "get_digest_agent",
+    "get_curator_agent",
+    "get_email_agent",
+]
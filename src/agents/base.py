@@ -4,10 +4,14 @@ Base class for all AI agents.
 Provides common functionality and interface for agents.
 """
 
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, TypeVar, Generic
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Generic
 import structlog
 from google import genai
+from pydantic import TypeAdapter
 
 from ..config.settings import Settings, get_settings
 
@@ -18,6 +22,155 @@ InputType = TypeVar('InputType')
 OutputType = TypeVar('OutputType')
 
 
+@lru_cache(maxsize=4)
+def get_genai_client(api_key: Optional[str]) -> genai.Client:
+    """
+    Get a shared Gemini client for an API key.
+
+    Agents created per workflow run reuse one client, and with it one
+    HTTP connection pool, instead of building a new client each time.
+
+    Args:
+        api_key: Gemini API key
+
+    Returns:
+        Cached genai.Client
+    """
+    return genai.Client(api_key=api_key)
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether a Gemini error is a rate limit (quota) error."""
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message
+
+
+class RateLimiter:
+    """
+    Async request pacer for a requests-per-minute quota.
+
+    Each acquire() reserves the next free slot, spaced 60/rpm seconds
+    apart, so concurrent callers overlap their network round trips while
+    request starts stay within the quota.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum request starts per minute
+        """
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until the caller's reserved slot."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def _batch_request(instructions: str, prompts: Sequence[str], response_schema: Any, temperature: float) -> Dict[str, Any]:
+    """Build generate_content arguments for a packed batch of prompts."""
+    packed = "\n\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+    return {
+        "contents": (
+            f"{instructions}\n\n"
+            f"Return a JSON array of exactly {len(prompts)} objects, one per numbered input below, in the same order.\n\n"
+            f"{packed}"
+        ),
+        "config": {
+            "temperature": temperature,
+            "response_mime_type": "application/json",
+            "response_schema": list[response_schema]
+        }
+    }
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(response_schema: Any) -> TypeAdapter:
+    """
+    TypeAdapter for a list of response_schema, built once per schema.
+
+    Building an adapter compiles a pydantic-core validator, which is far
+    more expensive than validating a response with it.
+    """
+    return TypeAdapter(List[response_schema])
+
+
+def _parse_batch(text: str, response_schema: Any, expected: int) -> Optional[List[Any]]:
+    """Validate a batched JSON array response, or None on a count mismatch."""
+    # validate_json parses with pydantic-core's native JSON parser in one pass
+    results = _list_adapter(response_schema).validate_json(text)
+    if len(results) != expected:
+        log.warning("Batched generation returned wrong item count", expected=expected, received=len(results))
+        return None
+    return results
+
+
+def generate_content_batch(
+    client: genai.Client,
+    model: str,
+    instructions: str,
+    prompts: Sequence[str],
+    response_schema: Any,
+    temperature: float
+) -> Optional[List[Any]]:
+    """
+    Generate structured outputs for several prompts in one request.
+
+    The prompts are packed into a numbered list and the model is asked for
+    a JSON array with one object per prompt, so N outputs cost a single
+    request against the per-minute quota.
+
+    Args:
+        client: Gemini client
+        model: Gemini model name
+        instructions: Shared instructions placed before the packed prompts
+        prompts: Per-item prompts (callers should truncate long inputs)
+        response_schema: Pydantic model for each array element
+        temperature: Model temperature
+
+    Returns:
+        Validated outputs aligned with prompts, or None if the response
+        did not contain exactly one output per prompt
+
+    Raises:
+        Exception: If the request fails (including rate limit errors)
+    """
+    response = client.models.generate_content(
+        model=model,
+        **_batch_request(instructions, prompts, response_schema, temperature)
+    )
+    return _parse_batch(response.text, response_schema, len(prompts))
+
+
+async def agenerate_content_batch(
+    client: genai.Client,
+    model: str,
+    instructions: str,
+    prompts: Sequence[str],
+    response_schema: Any,
+    temperature: float
+) -> Optional[List[Any]]:
+    """
+    Async version of generate_content_batch, using the client's aio API.
+
+    Returns:
+        Validated outputs aligned with prompts, or None on a count mismatch
+    """
+    response = await client.aio.models.generate_content(
+        model=model,
+        **_batch_request(instructions, prompts, response_schema, temperature)
+    )
+    return _parse_batch(response.text, response_schema, len(prompts))
+
+
 class BaseAgent(ABC, Generic[InputType, OutputType]):
     """
     Abstract base class for all AI agents.
@@ -48,7 +201,7 @@ class BaseAgent(ABC, Generic[InputType, OutputType]):
         self.temperature = temperature
 
         # Initialize Gemini client
-        self.client = genai.Client(api_key=self.settings.gemini_api_key)
+        self.client = get_genai_client(self.settings.gemini_api_key)
 
         # Logger with agent context
         self.log = log.bind(
@@ -110,6 +263,69 @@ class BaseAgent(ABC, Generic[InputType, OutputType]):
             self.log.error("Content generation failed", error=str(e))
             raise
 
+    async def _agenerate_content(
+        self,
+        contents: str,
+        response_schema: Any,
+        temperature: Optional[float] = None
+    ) -> Any:
+        """
+        Async version of _generate_content, for running calls concurrently.
+
+        Args:
+            contents: Prompt content
+            response_schema: Pydantic model for response validation
+            temperature: Override default temperature
+
+        Returns:
+            Validated Pydantic model instance
+        """
+        temp = temperature if temperature is not None else self.temperature
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config={
+                    "temperature": temp,
+                    "response_mime_type": "application/json",
+                    "response_schema": response_schema
+                }
+            )
+
+            return response_schema.model_validate_json(response.text)
+
+        except Exception as e:
+            self.log.error("Content generation failed", error=str(e))
+            raise
+
+    def _generate_content_batch(
+        self,
+        instructions: str,
+        prompts: Sequence[str],
+        response_schema: Any,
+        temperature: Optional[float] = None
+    ) -> Optional[List[Any]]:
+        """
+        Generate structured outputs for several prompts in one request.
+
+        Args:
+            instructions: Shared instructions placed before the packed prompts
+            prompts: Per-item prompts
+            response_schema: Pydantic model for each output
+            temperature: Override default temperature
+
+        Returns:
+            Validated outputs aligned with prompts, or None on a count mismatch
+        """
+        temp = temperature if temperature is not None else self.temperature
+
+        try:
+            return generate_content_batch(self.client, self.model, instructions, prompts, response_schema, temp)
+        except Exception as e:
+            self.log.error("Batched content generation failed", error=str(e), batch_size=len(prompts))
+            raise
+
     def __repr__(self) -> str:
         """String representation of the agent."""
         return f"{self.__class__.__name__}(model={self.model}, temperature={self.temperature})"
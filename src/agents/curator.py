@@ -3,10 +3,11 @@
 import os
 import time
 from typing import List
-from google import genai
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+from .base import get_genai_client
+
 load_dotenv()
 
 
@@ -44,7 +45,7 @@ Rank articles from most relevant (rank 1) to least relevant. Ensure each article
 
 class CuratorAgent:
     def __init__(self, user_profile: dict):
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        self.client = get_genai_client(os.getenv("GEMINI_API_KEY"))
         self.model = "gemini-2.5-flash"
         self.user_profile = user_profile
         self.system_prompt = self._build_system_prompt()
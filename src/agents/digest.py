@@ -1,11 +1,12 @@
 """Digest Agent - Generates article summaries using AI."""
 
 import os
-from typing import Optional
-from google import genai
+from typing import List, Optional
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+from .base import agenerate_content_batch, generate_content_batch, get_genai_client, is_rate_limited
+
 load_dotenv()
 
 
@@ -25,10 +26,13 @@ Guidelines:
 - Use clear, accessible language while maintaining technical accuracy
 - Avoid marketing fluff - focus on substance"""
 
+# Per-article content budget when several articles share one prompt
+BATCH_CONTENT_CHARS = 2000
+
 
 class DigestAgent:
     def __init__(self):
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        self.client = get_genai_client(os.getenv("GEMINI_API_KEY"))
         self.model = "gemini-2.5-flash"
         self.system_prompt = PROMPT
 
@@ -50,3 +54,44 @@ class DigestAgent:
         except Exception as e:
             print(f"Error generating digest: {e}")
             return None
+
+    def generate_digests(self, articles: List[dict]) -> Optional[List[DigestOutput]]:
+        """
+        Generate digests for several articles in one request.
+
+        Args:
+            articles: Article dicts with title, content and type
+
+        Returns:
+            Digests aligned with articles, or None if the batch failed
+
+        Raises:
+            Exception: Rate limit errors (429 / RESOURCE_EXHAUSTED), so the
+                       caller can back off and retry
+        """
+        try:
+            return generate_content_batch(self.client, self.model, *self._batch_prompts(articles), DigestOutput, temperature=0.7)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            print(f"Error generating digests: {e}")
+            return None
+
+    async def agenerate_digests(self, articles: List[dict]) -> Optional[List[DigestOutput]]:
+        """Async version of generate_digests, so batches can run concurrently."""
+        try:
+            return await agenerate_content_batch(self.client, self.model, *self._batch_prompts(articles), DigestOutput, temperature=0.7)
+        except Exception as e:
+            if is_rate_limited(e):
+                raise
+            print(f"Error generating digests: {e}")
+            return None
+
+    def _batch_prompts(self, articles: List[dict]):
+        """Shared instructions and per-article prompts for a batched request."""
+        instructions = f"{self.system_prompt}\n\nCreate a digest for each of the following articles."
+        prompts = [
+            f"{article['type']}: \n Title: {article['title']} \n Content: {(article['content'] or '')[:BATCH_CONTENT_CHARS]}"
+            for article in articles
+        ]
+        return instructions, prompts
@@ -3,10 +3,11 @@
 import os
 from datetime import datetime
 from typing import List, Optional
-from google import genai
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+from .base import get_genai_client
+
 load_dotenv()
 
 
@@ -65,7 +66,7 @@ Keep it concise (2-3 sentences for the introduction), friendly, and professional
 
 class EmailAgent:
     def __init__(self, user_profile: dict):
-        self.client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+        self.client = get_genai_client(os.getenv("GEMINI_API_KEY"))
         self.model = "gemini-2.5-flash"
         self.user_profile = user_profile
 
@@ -1,38 +1,13 @@
 """Background task handlers for long-running operations."""
 
 import structlog
-from typing import Dict, Any
-from src.workflows.workflow import run_workflow
-from src.core.runner import run_scrapers
+from typing import Dict, Any, List
+from src.core.runner import run_scrapers_async
+from .cache import clear_response_caches
 
 log = structlog.get_logger()
 
 
-async def run_workflow_background(hours: int, top_n: int, skip_email: bool = False) -> Dict[str, Any]:
-    """
-    Run the complete workflow in the background.
-    
-    Args:
-        hours: Time window for scraping
-        top_n: Number of top articles
-        skip_email: Whether to skip email delivery
-        
-    Returns:
-        Workflow result dictionary
-    """
-    try:
-        log.info("Starting background workflow", hours=hours, top_n=top_n)
-        result = run_workflow(hours=hours, top_n=top_n)
-        log.info("Background workflow completed", success=result.get("success", False))
-        return result
-    except Exception as e:
-        log.error("Background workflow failed", error=str(e))
-        return {
-            "success": False,
-            "errors": [str(e)]
-        }
-
-
 async def run_scraping_background(hours: int) -> Dict[str, Any]:
     """
     Run scraping in the background.
@@ -45,7 +20,8 @@ async def run_scraping_background(hours: int) -> Dict[str, Any]:
     """
     try:
         log.info("Starting background scraping", hours=hours)
-        result = run_scrapers(hours=hours)
+        result = await run_scrapers_async(hours=hours)
+        clear_response_caches()
         log.info("Background scraping completed", total=result.get("total", 0))
         return result
     except Exception as e:
@@ -56,3 +32,27 @@ async def run_scraping_background(hours: int) -> Dict[str, Any]:
             "total": 0,
             "error": str(e)
         }
+
+
+def send_email_background(subject: str, body_text: str, body_html: str, recipients: List[str]) -> None:
+    """
+    Send an email in the background (runs in the FastAPI threadpool).
+
+    Args:
+        subject: Email subject
+        body_text: Plain text body
+        body_html: HTML body
+        recipients: Recipient addresses
+    """
+    from src.services.email import send_email
+
+    try:
+        send_email(
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            recipients=recipients
+        )
+        log.info("Background email sent", recipients=recipients)
+    except Exception as e:
+        log.error("Background email failed", recipients=recipients, error=str(e))
@@ -0,0 +1,67 @@
+"""
+Short-lived response caches for read-heavy API endpoints.
+
+Dashboards and n8n workflows poll /stats and /digests far more often than
+the underlying data changes, so responses are kept in memory for a few
+seconds, keyed by query parameters, and dropped whenever a write path
+(scraping, workflow completion) changes the data.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResponseCache:
+    """TTL cache with LRU eviction; cleared from worker threads, so access is locked."""
+
+    def __init__(self, ttl: float, max_size: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Time-to-live for cached responses (seconds)
+            max_size: Maximum number of cached keys
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached response (None if missing or expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """Cache a response, evicting the least recently used beyond max_size."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+# /api/v1/stats has no parameters; /api/v1/digests is keyed by (hours, page, page_size)
+stats_cache = ResponseCache(ttl=60, max_size=1)
+digests_cache = ResponseCache(ttl=30, max_size=256)
+
+
+def clear_response_caches(*_):
+    """Invalidate all response caches after a write (accepts and ignores callback args)."""
+    stats_cache.clear()
+    digests_cache.clear()
@@ -1,12 +1,26 @@
 """Dependency injection for FastAPI routes."""
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
 from src.database.connection import get_session
-from src.database.repository import Repository
+from src.database.async_repository import AsyncRepository
 from src.config.settings import Settings, get_settings
 from src.rag.retriever import get_article_retriever
 
+# Async pool for route queries; connections are opened lazily on first use.
+# Requests that can't get a connection within db_pool_timeout fail fast
+_settings = get_settings()
+async_engine = create_async_engine(
+    _settings.async_database_url,
+    pool_size=_settings.db_pool_size,
+    max_overflow=_settings.db_max_overflow,
+    pool_timeout=_settings.db_pool_timeout,
+    pool_pre_ping=True,
+    pool_recycle=1800
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -22,30 +36,43 @@ def get_db() -> Generator[Session, None, None]:
         session.close()
 
 
-def get_repository() -> Repository:
+async def get_repository() -> AsyncGenerator[AsyncRepository, None]:
     """
     Dependency for repository instance.
-        
-    Returns:
-        Repository instance
+
+    Per request, backed by an AsyncSession from the async pool, so route
+    queries are awaited and concurrent requests interleave on I/O instead
+    of blocking the event loop. The session is returned to the pool after
+    the request.
+
+    Yields:
+        Async repository instance
     """
-    return Repository()
+    async with AsyncSessionLocal() as session:
+        yield AsyncRepository(session=session)
 
 
-def get_app_settings() -> Settings:
+async def get_app_settings() -> Settings:
     """
     Dependency for application settings.
-    
+
+    Async so FastAPI resolves it on the event loop instead of dispatching
+    a threadpool task just to return the lru_cache'd settings.
+
     Returns:
         Settings instance
     """
     return get_settings()
 
 
-def get_retriever():
+async def get_retriever():
     """
     Dependency for RAG retriever.
-    
+
+    Returns the process-wide singleton, warmed in the app lifespan, so
+    resolving it is a global lookup; async for the same reason as
+    get_app_settings.
+
     Returns:
         Article retriever instance
     """
@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
 import structlog
 
 from .schemas import (
@@ -11,6 +12,7 @@ from .schemas import (
     ScrapeResponse,
     WorkflowRequest,
     WorkflowResponse,
+    JobStatusResponse,
     DigestsListResponse,
     DigestResponse,
     SearchRequest,
@@ -24,14 +26,32 @@ from .schemas import (
     SendEmailResponse,
 )
 from .dependencies import get_repository, get_app_settings, get_retriever
-from .background import run_workflow_background, run_scraping_background
-from src.database.repository import Repository
+from .background import run_scraping_background, send_email_background
+from .cache import stats_cache, digests_cache, clear_response_caches
+from src.core.jobs import get_job_registry
+from src.rag.semantic_cache import get_semantic_cache
+from src.database.async_repository import AsyncRepository
 from src.config.settings import Settings
-from src.database.models import YouTubeVideo, WebArticle
 
 log = structlog.get_logger()
 router = APIRouter()
 
+# Workflow runs write new digests; drop cached reads when one finishes
+get_job_registry().on_finished(clear_response_caches)
+
+
+def _json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model built from our own data.
+
+    List endpoints build their models with model_construct (the rows come
+    from our database or vector store, so per-field validation is wasted
+    work) and return the JSON directly, which also skips FastAPI's
+    response_model re-validation. response_model stays on the route for
+    the OpenAPI schema.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 
 @router.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check(settings: Settings = Depends(get_app_settings)):
@@ -52,7 +72,7 @@ async def health_check(settings: Settings = Depends(get_app_settings)):
 async def scrape_sources(
     request: ScrapeRequest,
     background_tasks: BackgroundTasks,
-    repo: Repository = Depends(get_repository)
+    repo: AsyncRepository = Depends(get_repository)
 ):
     """
     Trigger scraping of all 23 sources (3 YouTube + 20 Web).
@@ -86,10 +106,7 @@ async def scrape_sources(
 
 
 @router.post("/api/v1/workflow/run", response_model=WorkflowResponse, tags=["Workflow"])
-async def run_complete_workflow(
-    request: WorkflowRequest,
-    background_tasks: BackgroundTasks
-):
+async def run_complete_workflow(request: WorkflowRequest):
     """
     Run the complete AI news aggregator workflow.
     
@@ -100,25 +117,22 @@ async def run_complete_workflow(
     4. RAG indexing (vector database)
     5. Ranking (personalized curation)
     6. Email delivery (optional)
-    
+
+    Runs as a background job; poll /api/v1/jobs/{job_id} for progress.
+    A request matching a workflow that is still running joins that job.
+
     Args:
         request: Workflow request parameters
-        background_tasks: FastAPI background tasks
-        
+
     Returns:
-        Workflow execution status
+        Workflow execution status with the job ID
     """
     try:
         log.info("API: Workflow triggered", hours=request.hours, top_n=request.top_n)
-        
-        # Run workflow in background
-        background_tasks.add_task(
-            run_workflow_background,
-            request.hours,
-            request.top_n,
-            request.skip_email
-        )
-        
+
+        # Run workflow on the shared job registry's worker thread
+        job = get_job_registry().submit_workflow(hours=request.hours, top_n=request.top_n)
+
         return WorkflowResponse(
             success=True,
             articles_scraped=0,
@@ -126,18 +140,54 @@ async def run_complete_workflow(
             articles_ranked=0,
             email_sent=not request.skip_email,
             message=f"Workflow started. Processing last {request.hours} hours, top {request.top_n} articles.",
-            errors=[]
+            errors=[],
+            job_id=job.id
         )
     except Exception as e:
         log.error("API: Workflow failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/api/v1/jobs/{job_id}", response_model=JobStatusResponse, tags=["Workflow"])
+async def get_job_status(job_id: str):
+    """
+    Get the progress of a background job.
+
+    Args:
+        job_id: Job ID returned when the job was started
+
+    Returns:
+        Job status, current stage and progress
+    """
+    job = get_job_registry().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    result = job.result or {}
+    counts = result.get("counts", {})
+    errors = [f"{e['stage']}: {e['message']}" for e in result.get("errors", [])]
+    if job.error:
+        errors.append(job.error)
+
+    return JobStatusResponse(
+        job_id=job.id,
+        kind=job.kind,
+        status=job.status,
+        stage=job.stage,
+        pct=job.pct,
+        message=job.msg,
+        articles_scraped=counts.get("articles", 0),
+        digests_created=counts.get("digests", 0),
+        articles_ranked=counts.get("ranked", 0),
+        errors=errors
+    )
+
+
 @router.post("/api/v1/email/send", response_model=SendEmailResponse, tags=["Email"])
 async def send_email_digest(
     request: SendEmailRequest,
-    repo: Repository = Depends(get_repository),
-    settings: Settings = Depends(get_app_settings)
+    background_tasks: BackgroundTasks,
+    repo: AsyncRepository = Depends(get_repository)
 ):
     """
     Send AI news digest email immediately (on-demand).
@@ -147,18 +197,19 @@ async def send_email_digest(
     - n8n scheduled workflows
     - External integrations
 
+    The digest is built synchronously; SMTP delivery runs as a background
+    task so the response returns without waiting on the mail server.
+
     Args:
         request: Email request with time window and top N articles
+        background_tasks: FastAPI background tasks
         repo: Database repository
-        settings: Application settings
 
     Returns:
-        Email send status and details
+        Email queue status and details
     """
     try:
-        from src.database.repository import Repository
-        from src.agents.email import EmailAgent, RankedArticleDetail
-        from src.services.email import send_email, digest_to_html
+        from src.services.email import build_digest_email
         import os
 
         log.info("API: Email digest requested",
@@ -167,7 +218,7 @@ async def send_email_digest(
                 recipient=request.recipient)
 
         # Get recent digests
-        digests = repo.get_recent_digests(hours=request.hours)
+        digests = await repo.get_recent_digests(hours=request.hours)
 
         if not digests:
             raise HTTPException(
@@ -175,39 +226,8 @@ async def send_email_digest(
                 detail=f"No digests found in the last {request.hours} hours. Run the workflow first."
             )
 
-        # Convert to ranked article format (using digest scores or default ranking)
-        ranked_articles = []
-        for idx, digest in enumerate(digests[:request.top_n]):
-            ranked_articles.append(
-                RankedArticleDetail(
-                    digest_id=digest['id'],
-                    rank=idx + 1,
-                    relevance_score=10.0 - (idx * 0.5),  # Simple scoring
-                    title=digest['title'],
-                    summary=digest['summary'],
-                    url=digest['url'],
-                    article_type=digest['article_type'],
-                    reasoning=f"Ranked #{idx + 1} based on recency and relevance"
-                )
-            )
-
-        # Create email using EmailAgent
-        user_profile = {
-            "name": settings.user_name if hasattr(settings, 'user_name') else "AI Enthusiast",
-            "interests": ["AI", "Machine Learning", "LLMs", "AI Safety"]
-        }
-
-        email_agent = EmailAgent(user_profile=user_profile)
-        email_digest = email_agent.create_email_digest_response(
-            ranked_articles=ranked_articles,
-            total_ranked=len(digests),
-            limit=request.top_n
-        )
-
-        # Generate email content
-        subject = request.subject or f"🤖 AI News Digest - Top {request.top_n} Articles"
-        text_content = email_digest.to_markdown()
-        html_content = digest_to_html(email_digest)
+        # Build the email (ranking, introduction, HTML)
+        email = build_digest_email(digests, top_n=request.top_n, subject=request.subject)
 
         # Determine recipient
         recipient = request.recipient or os.getenv("MY_EMAIL")
@@ -217,20 +237,21 @@ async def send_email_digest(
                 detail="No recipient specified and MY_EMAIL not configured"
             )
 
-        # Send email
-        send_email(
-            subject=subject,
-            body_text=text_content,
-            body_html=html_content,
+        # Send email after the response is returned
+        background_tasks.add_task(
+            send_email_background,
+            subject=email["subject"],
+            body_text=email["body_text"],
+            body_html=email["body_html"],
             recipients=[recipient]
         )
 
-        log.info("API: Email sent successfully", recipient=recipient, articles=len(ranked_articles))
+        log.info("API: Email queued", recipient=recipient, articles=email["articles_count"])
 
         return SendEmailResponse(
             success=True,
-            message=f"Email digest sent successfully to {recipient}",
-            articles_count=len(ranked_articles),
+            message=f"Email digest queued for delivery to {recipient}",
+            articles_count=email["articles_count"],
             recipient=recipient,
             sent_at=datetime.now()
         )
@@ -247,7 +268,7 @@ async def get_digests(
     hours: int = Query(default=24, ge=1, le=168, description="Time window in hours"),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
-    repo: Repository = Depends(get_repository)
+    repo: AsyncRepository = Depends(get_repository)
 ):
     """
     Get recent article digests with pagination.
@@ -262,37 +283,29 @@ async def get_digests(
         Paginated list of digests
     """
     try:
+        cache_key = (hours, page, page_size)
+        cached = digests_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
         log.info("API: Fetching digests", hours=hours, page=page, page_size=page_size)
         
-        # Get all digests
-        all_digests = repo.get_recent_digests(hours=hours)
-        total = len(all_digests)
-        
-        # Paginate
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_digests = all_digests[start_idx:end_idx]
-        
-        # Convert to response models
-        digest_responses = [
-            DigestResponse(
-                id=d["id"],
-                article_type=d["article_type"],
-                article_id=d["article_id"],
-                url=d["url"],
-                title=d["title"],
-                summary=d["summary"],
-                created_at=d["created_at"]
-            )
-            for d in paginated_digests
-        ]
+        # Fetch only the requested page, with the window total in the same query
+        paginated_digests, total = await repo.get_recent_digests_page(
+            hours=hours,
+            limit=page_size,
+            offset=(page - 1) * page_size
+        )
         
-        return DigestsListResponse(
-            digests=digest_responses,
+        # Convert to response models (rows match DigestResponse's fields)
+        response = _json_response(DigestsListResponse.model_construct(
+            digests=[DigestResponse.model_construct(**d) for d in paginated_digests],
             total=total,
             page=page,
             page_size=page_size
-        )
+        ))
+        digests_cache.put(cache_key, response.body)
+        return response
     except Exception as e:
         log.error("API: Failed to fetch digests", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -302,12 +315,14 @@ async def get_digests(
 async def semantic_search(
     request: SearchRequest,
     retriever = Depends(get_retriever),
-    repo: Repository = Depends(get_repository)
+    repo: AsyncRepository = Depends(get_repository)
 ):
     """
-    Semantic search using RAG (vector similarity).
+    Search indexed articles.
     
-    Find articles similar to your query using embeddings.
+    Semantic mode (default) ranks by embedding similarity and keyword by
+    BM25; hybrid is opt-in and fuses both via Reciprocal Rank Fusion, so
+    its similarity values are RRF scores rather than cosine similarities.
     
     Args:
         request: Search request with query and filters
@@ -318,35 +333,60 @@ async def semantic_search(
         Search results with similarity scores
     """
     try:
-        log.info("API: Search query", query=request.query, n_results=request.n_results)
+        log.info("API: Search query", query=request.query, n_results=request.n_results, mode=request.mode)
         
-        # Perform semantic search
-        similar = retriever.find_similar(
-            query=request.query,
-            n_results=request.n_results,
-            article_type=request.article_type
-        )
+        # Column-oriented search: scores come back as one float32 array, so
+        # there is no per-result conversion
+        if request.mode == "keyword":
+            columns = retriever.keyword_search_columns(
+                request.query,
+                n_results=request.n_results,
+                article_type=request.article_type
+            )
+        else:
+            query_embedding = retriever.embed_query_cached(request.query)
+
+            if request.mode == "hybrid":
+                # Semantic and BM25 lists fused by rank, so exact-term
+                # matches the embedding misses still surface
+                columns = retriever.fused_search_columns(
+                    request.query,
+                    query_embedding,
+                    n_results=request.n_results,
+                    article_type=request.article_type
+                )
+            else:
+                # Near-duplicate queries are served from the semantic cache
+                cache = get_semantic_cache()
+                columns = cache.get(query_embedding, article_type=request.article_type, limit=request.n_results)
+                if columns is None:
+                    columns = retriever.search_columns(
+                        query_embedding=query_embedding,
+                        n_results=request.n_results,
+                        article_type=request.article_type
+                    )
+                    # Empty results are usually an unindexed store; don't pin them
+                    if len(columns["ids"]):
+                        cache.put(query_embedding, columns, article_type=request.article_type, limit=request.n_results)
         
         # Convert to response format
-        results = []
-        for item in similar:
-            metadata = item.get("metadata", {})
-            distance = item.get("distance", 0)
-            similarity = 1 - distance if distance is not None else 0
-            
-            results.append(SearchResultItem(
+        results = [
+            SearchResultItem.model_construct(
                 title=metadata.get("title", "N/A"),
                 url=metadata.get("url", ""),
                 article_type=metadata.get("article_type", "unknown"),
                 similarity=similarity,
                 summary=metadata.get("summary")
-            ))
+            )
+            for metadata, similarity in zip(columns["metadatas"], columns["similarities"].tolist())
+        ]
         
-        return SearchResponse(
+        return _json_response(SearchResponse.model_construct(
             query=request.query,
+            mode=request.mode,
             results=results,
             total=len(results)
-        )
+        ))
     except Exception as e:
         log.error("API: Search failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -354,7 +394,7 @@ async def semantic_search(
 
 @router.get("/api/v1/stats", response_model=StatsResponse, tags=["Statistics"])
 async def get_statistics(
-    repo: Repository = Depends(get_repository),
+    repo: AsyncRepository = Depends(get_repository),
     retriever = Depends(get_retriever),
     settings: Settings = Depends(get_app_settings)
 ):
@@ -365,21 +405,23 @@ async def get_statistics(
         System statistics including database and vector store counts
     """
     try:
+        cached = stats_cache.get("stats")
+        if cached is not None:
+            return cached
+
         log.info("API: Fetching statistics")
         
         # Get counts from database
-        youtube_count = repo.session.query(YouTubeVideo).count()
-        web_count = repo.session.query(WebArticle).count()
-        digest_count = len(repo.get_recent_digests(hours=24*365))  # All time
+        counts = await repo.get_table_counts()
         
         # Get vector store count
         vector_count = retriever.count_articles()
         
-        return StatsResponse(
+        response = StatsResponse(
             sources=SourceStats(
-                youtube_videos=youtube_count,
-                web_articles=web_count,
-                total_digests=digest_count,
+                youtube_videos=counts["youtube_videos"],
+                web_articles=counts["web_articles"],
+                total_digests=counts["digests"],
                 vector_store_count=vector_count
             ),
             database_status="connected",
@@ -388,6 +430,8 @@ async def get_statistics(
             embedding_model=settings.embedding_model,
             last_updated=datetime.now()
         )
+        stats_cache.put("stats", response)
+        return response
     except Exception as e:
         log.error("API: Failed to fetch statistics", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -397,7 +441,7 @@ async def get_statistics(
 async def get_articles(
     source_type: str = Query(default="youtube", description="Source type: youtube, web"),
     limit: int = Query(default=50, ge=1, le=200, description="Number of articles"),
-    repo: Repository = Depends(get_repository)
+    repo: AsyncRepository = Depends(get_repository)
 ):
     """
     Get recent articles by source type.
@@ -416,45 +460,19 @@ async def get_articles(
         articles = []
         
         if source_type.lower() == "youtube":
-            videos = repo.session.query(YouTubeVideo).order_by(
-                YouTubeVideo.published_at.desc()
-            ).limit(limit).all()
-            
-            articles = [
-                ArticleResponse(
-                    id=v.video_id,
-                    title=v.title,
-                    url=v.url,
-                    published_at=v.published_at,
-                    source="YouTube",
-                    description=v.description
-                )
-                for v in videos
-            ]
+            rows = await repo.get_latest_youtube_videos(limit=limit)
+            articles = [ArticleResponse.model_construct(**row) for row in rows]
         elif source_type.lower() == "web":
-            web_articles = repo.session.query(WebArticle).order_by(
-                WebArticle.published_at.desc()
-            ).limit(limit).all()
-            
-            articles = [
-                ArticleResponse(
-                    id=a.guid,
-                    title=a.title,
-                    url=a.url,
-                    published_at=a.published_at,
-                    source=a.source_name,
-                    description=a.description
-                )
-                for a in web_articles
-            ]
+            rows = await repo.get_latest_web_articles(limit=limit)
+            articles = [ArticleResponse.model_construct(**row) for row in rows]
         else:
             raise HTTPException(status_code=400, detail="Invalid source_type. Use 'youtube' or 'web'")
         
-        return ArticlesListResponse(
+        return _json_response(ArticlesListResponse.model_construct(
             articles=articles,
             total=len(articles),
             source_type=source_type
-        )
+        ))
     except HTTPException:
         raise
     except Exception as e:
@@ -1,7 +1,7 @@
 """Pydantic schemas for API request/response validation."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -40,6 +40,20 @@ class WorkflowResponse(BaseModel):
     email_sent: bool
     message: str
     errors: List[str] = []
+    job_id: Optional[str] = Field(default=None, description="Poll /api/v1/jobs/{job_id} for progress")
+
+
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str = Field(description="pending, running, succeeded or failed")
+    stage: Optional[str] = None
+    pct: int
+    message: str
+    articles_scraped: int = 0
+    digests_created: int = 0
+    articles_ranked: int = 0
+    errors: List[str] = []
 
 
 # Digests
@@ -68,18 +82,24 @@ class SearchRequest(BaseModel):
     query: str = Field(..., min_length=1, description="Search query")
     n_results: int = Field(default=5, ge=1, le=50, description="Number of results")
     article_type: Optional[str] = Field(default=None, description="Filter by article type")
+    mode: Literal["semantic", "keyword", "hybrid"] = Field(
+        default="semantic",
+        description="semantic (embeddings, cosine similarity), keyword (BM25), or hybrid "
+                    "(both fused with Reciprocal Rank Fusion; similarity is then the fused RRF score)"
+    )
 
 
 class SearchResultItem(BaseModel):
     title: str
     url: str
     article_type: str
-    similarity: float
+    similarity: float = Field(description="Cosine similarity, BM25 score or RRF score, depending on the search mode")
     summary: Optional[str] = None
 
 
 class SearchResponse(BaseModel):
     query: str
+    mode: str
     results: List[SearchResultItem]
     total: int
 
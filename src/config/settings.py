@@ -6,8 +6,7 @@ Loads configuration from environment variables and .env files.
 
 import os
 from functools import lru_cache
-from pathlib import Path
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,6 +40,9 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="ai_news_aggregator", description="PostgreSQL database name")
     postgres_host: str = Field(default="localhost", description="PostgreSQL host")
     postgres_port: int = Field(default=5432, description="PostgreSQL port")
+    db_pool_size: int = Field(default=20, description="Persistent connections per engine pool")
+    db_max_overflow: int = Field(default=10, description="Extra connections allowed under burst load")
+    db_pool_timeout: int = Field(default=5, description="Seconds to wait for a pooled connection before failing")
 
     # Redis Configuration (optional)
     redis_host: str = Field(default="localhost", description="Redis host")
@@ -51,9 +53,20 @@ class Settings(BaseSettings):
     chroma_persist_directory: str = Field(default="./chroma_db", description="ChromaDB persistence directory")
     chroma_collection_name: str = Field(default="ai_news_articles", description="ChromaDB collection name")
 
+    # Vector Search Backend
+    vector_backend: str = Field(default="chroma", description="Vector search backend (chroma/faiss)")
+    faiss_index_type: str = Field(default="flat", description="FAISS index type (flat/hnsw)")
+    faiss_persist_directory: str = Field(default="./faiss_index", description="FAISS index persistence directory")
+    embedding_quantization: str = Field(default="none", description="FAISS embedding quantization (none/int8/int8-compact)")
+
     # Embedding Configuration
     embedding_model: str = Field(default="all-MiniLM-L6-v2", description="Sentence transformer model")
-    embedding_dimension: int = Field(default=384, description="Embedding dimension")
+    embedding_dimension: int = Field(default=384, description="Embedding dimension (corrected from the loaded model)")
+    embedding_backend: str = Field(default="torch", description="Embedding runtime (torch/onnx/onnx-int8)")
+    embedding_cache_backend: str = Field(default="sqlite", description="Query embedding cache store (sqlite/redis)")
+    embedding_cache_path: str = Field(default="./cache/embeddings.sqlite", description="On-disk query embedding cache")
+    embedding_cache_ttl: int = Field(default=604800, description="Query embedding cache TTL (seconds)")
+    embedding_cache_max_entries: int = Field(default=10000, description="Maximum cached query embeddings")
 
     # Gemini Configuration
     gemini_model_digest: str = Field(default="gemini-2.5-flash", description="Gemini model for digests")
@@ -64,12 +77,12 @@ class Settings(BaseSettings):
     gemini_temperature_email: float = Field(default=0.7, description="Temperature for email generation")
 
     # YouTube Configuration - Only 3 channels
-    youtube_channels: List[str] = Field(
-        default=[
+    youtube_channels: Tuple[str, ...] = Field(
+        default=(
             "UCyR2Ct3pDOeZSRyZH5hPO-Q",  # Varun Mayya
             "UCNU_lfiiWBdtULKOw6X0Dig",  # Krish Naik
             "UCh9nVJoWXmFb7sLApWGcLPQ",  # Codebasics
-        ],
+        ),
         description="YouTube channel IDs to scrape"
     )
 
@@ -87,8 +100,8 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", description="FastAPI host")
     api_port: int = Field(default=8000, description="FastAPI port")
     api_workers: int = Field(default=1, description="Number of API workers")
-    api_cors_origins: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8000"],
+    api_cors_origins: Tuple[str, ...] = Field(
+        default=("http://localhost:3000", "http://localhost:8000"),
         description="CORS allowed origins"
     )
 
@@ -124,6 +137,14 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def async_database_url(self) -> str:
+        """Construct the asyncpg PostgreSQL URL used by the API."""
+        return (
+            f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
+
     @property
     def redis_url(self) -> str:
         """Construct Redis connection URL."""
@@ -138,19 +159,15 @@ class Settings(BaseSettings):
         return self.environment.lower() == "development"
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
-    Uses LRU cache to ensure settings are loaded only once.
+    Uses LRU cache to ensure settings are loaded only once. The .env file
+    is configured in model_config (a missing file falls back to
+    environment variables only), so there is no separate lookup here.
     """
-    # Look for .env in root directory
-    env_path = Path(".env")
-    if env_path.exists():
-        return Settings(_env_file=str(env_path))
-
-    # Fall back to environment variables only
     return Settings()
 
 
@@ -17,8 +17,30 @@ from .logging import configure_logging, get_logger
 from .formatters import format_datetime, truncate_text, format_file_size, format_duration
 from .validators import validate_url, validate_email, validate_api_key
 from .retry import retry_with_backoff
-from .runner import run_scrapers
-from .crawler import WebCrawler, crawl_url_sync
+
+# Runner, crawler, HTTP and job helpers pull in the scrapers, database,
+# crawl4ai, httpx and the workflow; they are loaded on first attribute access so importing
+# src.core stays light
+_LAZY_EXPORTS = {
+    'run_scrapers': '.runner',
+    'run_scrapers_async': '.runner',
+    'WebCrawler': '.crawler',
+    'crawl_url_sync': '.crawler',
+    'create_async_client': '.http',
+    'fetch_feed': '.http',
+    'iter_feed_entries': '.http',
+    'Job': '.jobs',
+    'JobRegistry': '.jobs',
+    'get_job_registry': '.jobs',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Enums
@@ -57,7 +79,16 @@ __all__ = [
     'retry_with_backoff',
     # Runner
     'run_scrapers',
+    'run_scrapers_async',
     # Crawler
     'WebCrawler',
-    'crawl_url_sync'
+    'crawl_url_sync',
+    # HTTP
+    'create_async_client',
+    'fetch_feed',
+    'iter_feed_entries',
+    # Jobs
+    'Job',
+    'JobRegistry',
+    'get_job_registry'
 ]
@@ -63,6 +63,23 @@ class WebCrawler:
         Returns:
             Markdown content or None if crawling fails
         """
+        try:
+            async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                return await self._crawl(crawler, url, wait_for=wait_for, timeout=timeout, **kwargs)
+
+        except Exception as e:
+            self.log.error("Crawling exception", url=url, error=str(e))
+            return None
+
+    async def _crawl(
+        self,
+        crawler: AsyncWebCrawler,
+        url: str,
+        wait_for: Optional[str] = None,
+        timeout: int = 30000,
+        **kwargs
+    ) -> Optional[str]:
+        """Crawl one URL on an already running browser, returning markdown or None."""
         try:
             self.log.info("Crawling URL", url=url)
 
@@ -74,18 +91,17 @@ class WebCrawler:
                 **kwargs
             )
 
-            async with AsyncWebCrawler(config=self.browser_config) as crawler:
-                result = await crawler.arun(
-                    url=url,
-                    config=run_config
-                )
-
-                if result.success:
-                    self.log.info("Successfully crawled URL", url=url, size=len(result.markdown))
-                    return result.markdown
-                else:
-                    self.log.error("Failed to crawl URL", url=url, error=result.error_message)
-                    return None
+            result = await crawler.arun(
+                url=url,
+                config=run_config
+            )
+
+            if result.success:
+                self.log.info("Successfully crawled URL", url=url, size=len(result.markdown))
+                return result.markdown
+            else:
+                self.log.error("Failed to crawl URL", url=url, error=result.error_message)
+                return None
 
         except Exception as e:
             self.log.error("Crawling exception", url=url, error=str(e))
@@ -98,7 +114,10 @@ class WebCrawler:
         **kwargs
     ) -> Dict[str, Optional[str]]:
         """
-        Crawl multiple URLs concurrently.
+        Crawl multiple URLs concurrently on one shared browser.
+
+        The browser is launched once; each URL gets its own page, so the
+        batch takes about as long as the slowest site.
 
         Args:
             urls: List of URLs to crawl
@@ -113,14 +132,17 @@ class WebCrawler:
         results = {}
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def crawl_with_semaphore(url: str):
+        async def crawl_with_semaphore(crawler: AsyncWebCrawler, url: str):
             async with semaphore:
-                markdown = await self.crawl_to_markdown(url, **kwargs)
-                results[url] = markdown
+                results[url] = await self._crawl(crawler, url, **kwargs)
 
-        # Create tasks for all URLs
-        tasks = [crawl_with_semaphore(url) for url in urls]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            async with AsyncWebCrawler(config=self.browser_config) as crawler:
+                # Create tasks for all URLs
+                tasks = [crawl_with_semaphore(crawler, url) for url in urls]
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except Exception as e:
+            self.log.error("Batch crawl failed", error=str(e))
 
         success_count = sum(1 for v in results.values() if v is not None)
         self.log.info("Batch crawl complete", total=len(urls), success=success_count)
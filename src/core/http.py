@@ -0,0 +1,190 @@
+"""
+Shared HTTP client utilities.
+
+Feed fetches go through one pooled httpx.AsyncClient per scrape run, so
+sources on the same host reuse TCP/TLS connections instead of opening a
+fresh one per request. Feeds are parsed incrementally as bytes arrive, so
+memory stays flat even for multi-megabyte feeds (e.g. arXiv).
+"""
+
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Optional
+
+import feedparser
+import httpx
+import structlog
+
+log = structlog.get_logger()
+
+# Connection pool sized for all 23 sources in flight at once
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Feeds are small; anything slower than this is treated as a failed source
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+USER_AGENT = "Mozilla/5.0 (compatible; AI-News-Aggregator/2.0)"
+
+# Item elements across RSS 2.0, RSS 1.0 (RDF) and Atom
+_ITEM_TAGS = {"item", "entry"}
+
+# Child element (local name) -> entry field, first match wins
+_FIELD_TAGS = {
+    "title": "title",
+    "guid": "id",
+    "id": "id",
+    "description": "description",
+    "summary": "summary",
+    "encoded": "description",
+    "pubDate": "published",
+    "published": "published",
+    "date": "published",
+    "updated": "updated",
+}
+
+
+def create_async_client() -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client.
+
+    The client is bound to the running event loop, so create one per run
+    and close it when done (use as an async context manager).
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT}
+    )
+
+
+async def fetch_feed(client: httpx.AsyncClient, url: str) -> feedparser.FeedParserDict:
+    """
+    Fetch and parse a whole RSS/Atom feed with feedparser.
+
+    Args:
+        client: Pooled async HTTP client
+        url: Feed URL
+
+    Returns:
+        Parsed feed
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    response = await client.get(url)
+    response.raise_for_status()
+    return feedparser.parse(response.content)
+
+
+def _local_name(tag) -> str:
+    """Strip the XML namespace from a tag ("{ns}item" -> "item")."""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _parse_date(value: str) -> Optional[time.struct_time]:
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) date to a UTC struct_time."""
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).timetuple()
+
+
+def _entry_from_element(elem) -> feedparser.FeedParserDict:
+    """
+    Convert an <item>/<entry> element to a feedparser-style entry.
+
+    Only the fields the scrapers read are populated: title, link, id,
+    description, summary, published_parsed and updated_parsed.
+    """
+    entry = feedparser.FeedParserDict()
+
+    for child in elem.iter():
+        if child is elem:
+            continue
+        name = _local_name(child.tag)
+
+        if name == "link":
+            # Atom links carry the URL in href; prefer rel="alternate"
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", href)
+            elif child.text and child.text.strip():
+                entry.setdefault("link", child.text.strip())
+            continue
+
+        field = _FIELD_TAGS.get(name)
+        if field and child.text and field not in entry:
+            entry[field] = child.text.strip()
+
+    # YouTube keeps the description in media:group/media:description
+    entry.setdefault("summary", entry.get("description", ""))
+    entry.setdefault("id", entry.get("link", ""))
+
+    for field in ("published", "updated"):
+        if field in entry:
+            entry[f"{field}_parsed"] = _parse_date(entry[field])
+
+    return entry
+
+
+async def iter_feed_entries(client: httpx.AsyncClient, url: str) -> AsyncIterator[feedparser.FeedParserDict]:
+    """
+    Stream an RSS/Atom feed, yielding entries as they are parsed.
+
+    The response is fed to an incremental XML parser chunk by chunk, and
+    each item element is freed once converted, so memory does not grow
+    with feed size. Malformed feeds that the strict XML parser rejects
+    are re-fetched and parsed leniently with feedparser.
+
+    Args:
+        client: Pooled async HTTP client
+        url: Feed URL
+
+    Yields:
+        feedparser-style entries
+
+    Raises:
+        httpx.HTTPError: If the request fails or returns an error status
+    """
+    from lxml import etree
+
+    parser = etree.XMLPullParser(events=("end",), recover=False, resolve_entities=False)
+    yielded = 0
+
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    if _local_name(elem.tag) not in _ITEM_TAGS:
+                        continue
+                    yield _entry_from_element(elem)
+                    yielded += 1
+
+                    # Drop the parsed item and any siblings before it
+                    elem.clear()
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+            parser.close()
+    except etree.XMLSyntaxError as e:
+        if yielded:
+            log.warning("Feed truncated by malformed XML", url=url, entries=yielded, error=str(e))
+            return
+        log.info("Malformed feed XML, falling back to feedparser", url=url, error=str(e))
+        for entry in (await fetch_feed(client, url)).entries:
+            yield entry
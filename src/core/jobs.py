@@ -0,0 +1,150 @@
+"""
+In-process background jobs.
+
+Long-running pipeline runs execute on a worker thread owned by the
+process instead of the caller (a Streamlit script run or an HTTP
+request), so they survive page reloads and navigation. Callers get a job
+ID and poll its progress.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+log = structlog.get_logger()
+
+
+@dataclass
+class Job:
+    """State of one background job, updated in place by its worker thread."""
+    id: str
+    kind: str
+    params: Dict[str, Any]
+    status: str = "pending"  # pending, running, succeeded, failed
+    stage: Optional[str] = None
+    pct: int = 0
+    msg: str = ""
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+
+class JobRegistry:
+    """
+    Registry of background jobs, keeping the most recent max_jobs.
+
+    Submitting a job while an identical one (same kind and parameters) is
+    still running returns the running job instead of starting a duplicate.
+    """
+
+    def __init__(self, max_jobs: int = 50):
+        """
+        Initialize the registry.
+
+        Args:
+            max_jobs: Number of jobs to remember; oldest finished jobs are dropped
+        """
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Job], None]] = []
+
+    def on_finished(self, callback: Callable[[Job], None]):
+        """
+        Register a callback run (on the worker thread) when any job finishes.
+
+        Args:
+            callback: Called with the finished job, e.g. to invalidate caches
+        """
+        self._listeners.append(callback)
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID (None if unknown or expired)."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def submit_workflow(self, hours: int, top_n: int) -> Job:
+        """
+        Run the complete workflow on a background thread.
+
+        Args:
+            hours: Time window for article scraping
+            top_n: Number of articles to include in email
+
+        Returns:
+            The new job, or the running job with the same parameters
+        """
+        params = {"hours": hours, "top_n": top_n}
+        with self._lock:
+            for job in self._jobs.values():
+                if job.kind == "workflow" and job.params == params and not job.done:
+                    return job
+
+            job = Job(id=uuid.uuid4().hex, kind="workflow", params=params)
+            self._jobs[job.id] = job
+            self._evict()
+
+        threading.Thread(target=self._run_workflow, args=(job,), name=f"workflow-{job.id[:8]}", daemon=True).start()
+        log.info("Workflow job submitted", job_id=job.id, **params)
+        return job
+
+    def _evict(self):
+        """Drop the oldest finished jobs beyond max_jobs (lock held)."""
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done]:
+            if len(self._jobs) <= self.max_jobs:
+                break
+            del self._jobs[job_id]
+
+    def _run_workflow(self, job: Job):
+        """Worker thread: drive the workflow and record progress on the job."""
+        from src.workflows.workflow import run_workflow_iter
+
+        job.status = "running"
+        try:
+            events = run_workflow_iter(**job.params)
+            while True:
+                try:
+                    event = next(events)
+                except StopIteration as stop:
+                    job.result = stop.value or {}
+                    break
+                job.stage, job.pct, job.msg = event["stage"], event["pct"], event["msg"]
+
+            job.pct = 100
+            job.status = "succeeded" if job.result.get("success") else "failed"
+        except Exception as e:
+            log.error("Workflow job failed", job_id=job.id, error=str(e))
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.finished_at = time.time()
+            log.info("Workflow job finished", job_id=job.id, status=job.status)
+            for callback in self._listeners:
+                try:
+                    callback(job)
+                except Exception as e:
+                    log.warning("Job listener failed", job_id=job.id, error=str(e))
+
+
+# Singleton instance
+_job_registry: Optional[JobRegistry] = None
+_job_registry_lock = threading.Lock()
+
+
+def get_job_registry() -> JobRegistry:
+    """Get or create the process-wide job registry."""
+    global _job_registry
+    with _job_registry_lock:
+        if _job_registry is None:
+            _job_registry = JobRegistry()
+        return _job_registry
@@ -4,52 +4,64 @@ Centralized logging configuration using structlog.
 
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO, Tuple
 
 import structlog
 from structlog.typing import FilteringBoundLogger
 
 from src.config.settings import Settings, get_settings
 
+# Processors shared by every configuration, built once at import
+_SHARED_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+)
+_JSON_RENDERER = structlog.processors.JSONRenderer()
+
+# (log_level, log_format, log_file, stream) of the active configuration
+_configured: Optional[Tuple[str, str, Optional[str], TextIO]] = None
+
 
 def configure_logging(
     settings: Optional[Settings] = None,
-    log_file: Optional[str] = None
+    log_file: Optional[str] = None,
+    stream: Optional[TextIO] = None
 ) -> None:
     """
     Configure structured logging for the application.
 
+    Repeated calls with the same effective configuration are no-ops.
+
     Args:
         settings: Application settings (auto-loaded if not provided)
         log_file: Optional log file path (overrides settings)
+        stream: Console stream (default: stdout; use stderr for stdio servers)
     """
+    global _configured
     settings = settings or get_settings()
+    log_path = log_file or settings.log_file
+    stream = stream or sys.stdout
+
+    key = (settings.log_level.upper(), settings.log_format, log_path, stream)
+    if key == _configured:
+        return
+    _configured = key
+
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
 
-    # Create processors based on format
+    # Pick the renderer based on format
     if settings.log_format == "json":
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
-        ]
+        renderer = _JSON_RENDERER
     else:
-        processors = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer(colors=True)
-        ]
+        renderer = structlog.dev.ConsoleRenderer(colors=True)
+    processors = [*_SHARED_PROCESSORS, renderer]
 
     # Configure structlog
     structlog.configure(
@@ -61,10 +73,9 @@ def configure_logging(
     )
 
     # Configure standard logging
-    handlers = [logging.StreamHandler(sys.stdout)]
+    handlers = [logging.StreamHandler(stream)]
 
     # Add file handler if log file specified
-    log_path = log_file or settings.log_file
     if log_path:
         log_dir = Path(log_path).parent
         log_dir.mkdir(parents=True, exist_ok=True)
@@ -83,9 +94,10 @@ def configure_logging(
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = None) -> FilteringBoundLogger:
     """
-    Get a structured logger instance.
+    Get a structured logger instance (cached per name).
 
     Args:
         name: Logger name (optional)
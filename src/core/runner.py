@@ -4,19 +4,88 @@ Scraper orchestration - runs all 23 sources.
 3 YouTube channels + 20 web sources = 23 total sources
 """
 
-from typing import List, Dict
+import asyncio
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, TypeVar
 import structlog
 from src.config.settings import Settings, get_settings
 from src.scrapers.youtube import YouTubeScraper, ChannelVideo
 from src.scrapers.web_scraper import UnifiedWebScraper, WebArticle
 from src.database.repository import Repository
+from src.core.http import create_async_client
 
 log = structlog.get_logger()
 
+T = TypeVar("T")
 
-def run_scrapers(hours: int = 24) -> Dict:
+# Feed fetches in flight at once; keeps bursts polite to shared hosts
+# (e.g. the two arXiv feeds) while still overlapping every source's latency
+MAX_CONCURRENT_FEEDS = 10
+
+
+# Volatile tokens that differ between copies of the same story
+_TAG_RE = re.compile(r"<[^>]+>")
+_DIGITS_RE = re.compile(r"\d+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def content_fingerprint(title: str, text: str, length: int = 512) -> bytes:
     """
-    Run all 23 scrapers (3 YouTube + 20 Web).
+    Fingerprint an article by its normalized title and leading text.
+
+    HTML tags, digits (dates, counters) and whitespace runs are stripped
+    before hashing, so syndicated copies of a story hash identically.
+
+    Args:
+        title: Article title
+        text: Article description or content
+        length: Number of leading characters of text to include
+
+    Returns:
+        SHA-1 digest
+    """
+    normalized = f"{title}\n{(text or '')[:length]}".lower()
+    for pattern, replacement in ((_TAG_RE, " "), (_DIGITS_RE, ""), (_SPACE_RE, " ")):
+        normalized = pattern.sub(replacement, normalized)
+    return hashlib.sha1(normalized.strip().encode("utf-8")).digest()
+
+
+def dedupe(items: Iterable[T], key: Callable[[T], Hashable]) -> List[T]:
+    """
+    Drop items whose key was already seen, keeping the first occurrence.
+
+    Args:
+        items: Items in priority order
+        key: Function returning the identity of an item
+
+    Returns:
+        Unique items, in original order
+    """
+    unique: Dict[Hashable, T] = {}
+    for item in items:
+        unique.setdefault(key(item), item)
+    return list(unique.values())
+
+
+async def _bounded(semaphore: asyncio.Semaphore, awaitable: Awaitable[T]) -> T:
+    """Await a task while holding a slot of the semaphore."""
+    async with semaphore:
+        return await awaitable
+
+
+async def run_scrapers_async(hours: int = 24) -> Dict:
+    """
+    Run all 23 scrapers (3 YouTube + 20 Web) concurrently.
+
+    RSS feeds (YouTube channels and RSS web sources) are fetched over one
+    pooled httpx.AsyncClient, so connections and TLS sessions are reused,
+    with at most MAX_CONCURRENT_FEEDS in flight.
+    Crawl sources are fetched as one batch on a single shared browser.
+    Everything is gathered together, so total wall time is roughly that
+    of the slowest source. Database writes happen afterwards on a worker
+    thread (the Repository is synchronous), so the event loop is not blocked.
 
     Args:
         hours: Time window in hours
@@ -26,57 +95,101 @@ def run_scrapers(hours: int = 24) -> Dict:
     """
     settings = get_settings()
     repo = Repository()
+    channels = settings.youtube_channels
 
     log.info("Starting scraper orchestration", total_sources=23, hours=hours)
 
+    youtube_scraper = YouTubeScraper()
+    web_scraper = UnifiedWebScraper()
+
+    rss_sources = [s for s in web_scraper.sources if s.scrape_type == "rss" and s.rss_url]
+    crawl_sources = [s for s in web_scraper.sources if s.scrape_type == "crawl"]
+
+    feed_slots = asyncio.Semaphore(MAX_CONCURRENT_FEEDS)
+
+    async with create_async_client() as client:
+        results = await asyncio.gather(
+            *[_bounded(feed_slots, youtube_scraper.get_latest_videos_async(client, channel_id, hours))
+              for channel_id in channels],
+            *[_bounded(feed_slots, web_scraper.scrape_rss_async(client, source, hours))
+              for source in rss_sources],
+            # All crawl sources share one browser
+            web_scraper.crawl_sources_async(crawl_sources, hours),
+            return_exceptions=True
+        )
+    youtube_results = results[:len(channels)]
+    rss_results = results[len(channels):-1]
+    crawl_results = results[-1]
+    if isinstance(crawl_results, Exception):
+        crawl_results = [crawl_results] * len(crawl_sources)
+
+    web_sources = rss_sources + crawl_sources
+    web_results = list(rss_results) + list(crawl_results)
+
     # ========================================
     # 1. YouTube (3 channels)
     # ========================================
-    log.info("Scraping YouTube channels", count=len(settings.youtube_channels))
-    youtube_scraper = YouTubeScraper()
     youtube_videos = []
     video_dicts = []
 
-    for i, channel_id in enumerate(settings.youtube_channels, 1):
-        try:
-            log.info(f"Scraping YouTube channel {i}/{len(settings.youtube_channels)}", channel_id=channel_id)
-            videos = youtube_scraper.get_latest_videos(channel_id, hours=hours)
-            youtube_videos.extend(videos)
+    for channel_id, videos in zip(channels, youtube_results):
+        if isinstance(videos, Exception):
+            log.error("YouTube channel scrape failed", channel_id=channel_id, error=str(videos))
+            continue
 
-            # Convert to dict format for database
-            video_dicts.extend([
-                {
-                    "video_id": v.video_id,
-                    "title": v.title,
-                    "url": v.url,
-                    "channel_id": channel_id,
-                    "published_at": v.published_at,
-                    "description": v.description,
-                    "transcript": v.transcript
-                }
-                for v in videos
-            ])
+        youtube_videos.extend(videos)
+
+        # Convert to dict format for database
+        video_dicts.extend([
+            {
+                "video_id": v.video_id,
+                "title": v.title,
+                "url": v.url,
+                "channel_id": channel_id,
+                "published_at": v.published_at,
+                "description": v.description,
+                "transcript": v.transcript
+            }
+            for v in videos
+        ])
 
-            log.info(f"Found {len(videos)} videos", channel_id=channel_id)
-        except Exception as e:
-            log.error("YouTube channel scrape failed", channel_id=channel_id, error=str(e))
+        log.info(f"Found {len(videos)} videos", channel_id=channel_id)
+
+    # Channels can cross-post the same video
+    youtube_videos = dedupe(youtube_videos, key=lambda v: v.video_id)
+    video_dicts = dedupe(video_dicts, key=lambda v: v["video_id"])
 
     # Save YouTube videos to database
     if video_dicts:
-        repo.bulk_create_youtube_videos(video_dicts)
+        await asyncio.to_thread(repo.bulk_create_youtube_videos, video_dicts)
         log.info("Saved YouTube videos to database", count=len(video_dicts))
 
     # ========================================
     # 2. Web Sources (20 sources)
     # ========================================
-    log.info("Scraping web sources", count=20)
-    web_scraper = UnifiedWebScraper()
     web_articles = []
 
-    try:
-        web_articles = web_scraper.get_all_articles(hours=hours)
-        log.info("Web scraping complete", count=len(web_articles))
+    for source, articles in zip(web_sources, web_results):
+        if isinstance(articles, Exception):
+            log.error("Failed to scrape source", source=source.name, error=str(articles))
+            continue
+        web_articles.extend(articles)
+
+    # The same story often appears in several feeds (e.g. an arXiv paper
+    # picked up by a news site); keep the first by URL (GUID for entries
+    # without a link), then by normalized content for reworded links
+    scraped = len(web_articles)
+    web_articles = dedupe(web_articles, key=lambda a: a.url or a.guid)
+    web_articles = dedupe(
+        web_articles,
+        # Entries with no text would all hash alike; they keep their URL key
+        key=lambda a: content_fingerprint(a.title, a.content or a.description)
+        if (a.content or a.description) else (a.url or a.guid)
+    )
 
+    log.info("Web scraping complete", count=len(web_articles), duplicates=scraped - len(web_articles))
+
+    try:
         # Save web articles to database
         if web_articles:
             article_dicts = [
@@ -92,11 +205,11 @@ def run_scrapers(hours: int = 24) -> Dict:
                 }
                 for a in web_articles
             ]
-            repo.bulk_create_web_articles(article_dicts)
+            await asyncio.to_thread(repo.bulk_create_web_articles, article_dicts)
             log.info("Saved web articles to database", count=len(article_dicts))
 
     except Exception as e:
-        log.error("Web scraping failed", error=str(e))
+        log.error("Saving web articles failed", error=str(e))
 
     # ========================================
     # Summary
@@ -114,6 +227,29 @@ def run_scrapers(hours: int = 24) -> Dict:
     }
 
 
+def run_scrapers(hours: int = 24) -> Dict:
+    """
+    Run all 23 scrapers (3 YouTube + 20 Web).
+
+    Synchronous wrapper around run_scrapers_async. When called from a
+    thread that already runs an event loop (e.g. MCP tools or FastAPI
+    background tasks), the scrape runs on a separate worker thread.
+
+    Args:
+        hours: Time window in hours
+
+    Returns:
+        Dictionary with scraped data from all sources
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_scrapers_async(hours=hours))
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_scrapers_async(hours=hours)).result()
+
+
 if __name__ == "__main__":
     print("AI News Aggregator - Scraper Test")
     print("=" * 60)
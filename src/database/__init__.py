@@ -1,6 +1,7 @@
 from .connection import get_session, get_database_url, engine, SessionLocal
 from .models import Base, YouTubeVideo, OpenAIArticle, AnthropicArticle, Digest
-from .repository import Repository
+from .repository import Repository, DigestsBatch
+from .async_repository import AsyncRepository
 
 __all__ = [
     'get_session',
@@ -12,5 +13,7 @@ __all__ = [
     'OpenAIArticle',
     'AnthropicArticle',
     'Digest',
-    'Repository'
+    'Repository',
+    'DigestsBatch',
+    'AsyncRepository'
 ]
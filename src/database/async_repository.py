@@ -0,0 +1,135 @@
+"""
+Async read queries for the API.
+
+FastAPI routes run on the event loop, so they query through an
+AsyncSession (asyncpg) and await each round trip instead of blocking the
+loop on a sync Session. Write paths (scraping, digests) stay on the sync
+Repository used by the pipeline.
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import YouTubeVideo, WebArticle, Digest
+
+
+def _cutoff(hours: int) -> datetime:
+    """
+    Start of a recent-digests window as naive UTC.
+
+    created_at is a naive DateTime written with datetime.utcnow; asyncpg
+    rejects an aware datetime bound against a timestamp-without-time-zone
+    column, so the cutoff must be naive too.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=hours)
+
+
+class AsyncRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_recent_digests(self, hours: int = 24, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        query = select(
+            Digest.id,
+            Digest.article_type,
+            Digest.article_id,
+            Digest.url,
+            Digest.title,
+            Digest.summary,
+            Digest.created_at
+        ).where(
+            Digest.created_at >= _cutoff(hours)
+        ).order_by(Digest.created_at.desc())
+
+        if limit:
+            query = query.limit(limit)
+
+        result = await self.session.execute(query)
+        return [row._asdict() for row in result]
+
+    async def get_recent_digests_page(self,
+                                      hours: int = 24,
+                                      limit: int = 20,
+                                      offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Get one page of recent digests and the window's total in one query.
+
+        The total comes from a COUNT(*) OVER () window column, so the page
+        and the count share a round trip; only a page past the end needs a
+        separate count.
+
+        Args:
+            hours: Time window in hours
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            Tuple of (digests, total digests in the window)
+        """
+        query = select(
+            Digest.id,
+            Digest.article_type,
+            Digest.article_id,
+            Digest.url,
+            Digest.title,
+            Digest.summary,
+            Digest.created_at,
+            func.count().over().label("total")
+        ).where(
+            Digest.created_at >= _cutoff(hours)
+        ).order_by(Digest.created_at.desc()).limit(limit).offset(offset)
+
+        rows = [row._asdict() for row in await self.session.execute(query)]
+        if not rows:
+            total = await self.count_recent_digests(hours=hours) if offset else 0
+            return [], total
+
+        total = rows[0]["total"]
+        for row in rows:
+            del row["total"]
+        return rows, total
+
+    async def count_recent_digests(self, hours: int = 24) -> int:
+        return await self.session.scalar(
+            select(func.count(Digest.id)).where(Digest.created_at >= _cutoff(hours))
+        )
+
+    async def get_table_counts(self) -> Dict[str, int]:
+        """Count YouTube videos, web articles and digests (all time) in one round trip."""
+        tables = {"youtube_videos": YouTubeVideo, "web_articles": WebArticle, "digests": Digest}
+        query = select(*(select(func.count()).select_from(model).scalar_subquery() for model in tables.values()))
+        counts = (await self.session.execute(query)).one()
+        return dict(zip(tables, counts))
+
+    # The article listings project only the listed columns, so the large
+    # transcript/content text columns never leave the database and no ORM
+    # objects are built. Rows are dicts shaped like ArticleResponse.
+
+    async def get_latest_youtube_videos(self, limit: int = 50) -> List[Dict[str, Any]]:
+        result = await self.session.execute(
+            select(
+                YouTubeVideo.video_id.label("id"),
+                YouTubeVideo.title,
+                YouTubeVideo.url,
+                YouTubeVideo.published_at,
+                literal("YouTube").label("source"),
+                YouTubeVideo.description
+            ).order_by(YouTubeVideo.published_at.desc()).limit(limit)
+        )
+        return [row._asdict() for row in result]
+
+    async def get_latest_web_articles(self, limit: int = 50) -> List[Dict[str, Any]]:
+        result = await self.session.execute(
+            select(
+                WebArticle.guid.label("id"),
+                WebArticle.title,
+                WebArticle.url,
+                WebArticle.published_at,
+                WebArticle.source_name.label("source"),
+                WebArticle.description
+            ).order_by(WebArticle.published_at.desc()).limit(limit)
+        )
+        return [row._asdict() for row in result]
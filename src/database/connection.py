@@ -13,7 +13,18 @@ def get_database_url() -> str:
     db = os.getenv("POSTGRES_DB", "ai_news_aggregator")
     return f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
-engine = create_engine(get_database_url())
+# Pooled connections are reused across repository calls. pre_ping drops
+# connections the server closed; recycle retires them before idle timeouts;
+# a short pool_timeout makes an exhausted pool fail fast instead of queueing
+# (same env vars as Settings.db_pool_*, read directly like the URL above)
+engine = create_engine(
+    get_database_url(),
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "5")),
+    pool_pre_ping=True,
+    pool_recycle=1800
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_session():
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Column, String, DateTime, Text
+from sqlalchemy import Column, String, DateTime, Text, Index
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -69,3 +69,6 @@ class Digest(Base):
     title = Column(String, nullable=False)
     summary = Column(Text, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Recent-window queries filter and sort on created_at (newest first)
+    __table_args__ = (Index("ix_digests_created_at", created_at.desc()),)
@@ -1,10 +1,51 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Dict, Any
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from .models import YouTubeVideo, OpenAIArticle, AnthropicArticle, Digest
 from .connection import get_session
 
 
+@dataclass
+class DigestsBatch:
+    """Column-oriented digests: one list per field, row-aligned."""
+    ids: List[str] = field(default_factory=list)
+    article_types: List[str] = field(default_factory=list)
+    article_ids: List[str] = field(default_factory=list)
+    urls: List[str] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    summaries: List[str] = field(default_factory=list)
+    created_ats: List[datetime] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def head(self, n: int) -> "DigestsBatch":
+        """First n rows as a new batch."""
+        return DigestsBatch(
+            ids=self.ids[:n],
+            article_types=self.article_types[:n],
+            article_ids=self.article_ids[:n],
+            urls=self.urls[:n],
+            titles=self.titles[:n],
+            summaries=self.summaries[:n],
+            created_ats=self.created_ats[:n]
+        )
+
+
+# Digest column name -> DigestsBatch field
+_DIGESTS_BATCH_FIELDS = {
+    "id": "ids",
+    "article_type": "article_types",
+    "article_id": "article_ids",
+    "url": "urls",
+    "title": "titles",
+    "summary": "summaries",
+    "created_at": "created_ats",
+}
+
+
 class Repository:
     def __init__(self, session: Optional[Session] = None):
         self.session = session or get_session()
@@ -61,11 +102,18 @@ class Repository:
         self.session.commit()
         return article
 
+    def _existing_keys(self, column, keys: List[str]) -> set:
+        """Return which of the given unique keys already exist, in one query."""
+        if not keys:
+            return set()
+        return {key for (key,) in self.session.query(column).filter(column.in_(keys))}
+
     def bulk_create_youtube_videos(self, videos: List[dict]) -> int:
+        existing = self._existing_keys(YouTubeVideo.video_id, [v["video_id"] for v in videos])
         new_videos = []
         for v in videos:
-            existing = self.session.query(YouTubeVideo).filter_by(video_id=v["video_id"]).first()
-            if not existing:
+            if v["video_id"] not in existing:
+                existing.add(v["video_id"])
                 new_videos.append(YouTubeVideo(
                     video_id=v["video_id"],
                     title=v["title"],
@@ -119,10 +167,11 @@ class Repository:
     def bulk_create_web_articles(self, articles: List[dict]) -> int:
         """Bulk create web articles from 20 sources."""
         from .models import WebArticle
+        existing = self._existing_keys(WebArticle.guid, [a["guid"] for a in articles])
         new_articles = []
         for a in articles:
-            existing = self.session.query(WebArticle).filter_by(guid=a["guid"]).first()
-            if not existing:
+            if a["guid"] not in existing:
+                existing.add(a["guid"])
                 new_articles.append(WebArticle(
                     guid=a["guid"],
                     source_name=a["source_name"],
@@ -166,6 +215,16 @@ class Repository:
             return True
         return False
 
+    def bulk_update_youtube_video_transcripts(self, transcripts: Dict[str, str]) -> int:
+        """Set transcripts for many videos (video_id -> text) in one commit."""
+        if not transcripts:
+            return 0
+        videos = self.session.query(YouTubeVideo).filter(YouTubeVideo.video_id.in_(list(transcripts))).all()
+        for video in videos:
+            video.transcript = transcripts[video.video_id]
+        self.session.commit()
+        return len(videos)
+
     def get_articles_without_digest(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         from .models import WebArticle
 
@@ -238,21 +297,48 @@ class Repository:
         self.session.commit()
         return digest
 
-    def get_recent_digests(self, hours: int = 24) -> List[Dict[str, Any]]:
+    def _recent_digests_query(self, hours: int, limit: Optional[int]):
+        """Digest columns in a time window, newest first (callers group by day relying on this)."""
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        query = self.session.query(
+            Digest.id,
+            Digest.article_type,
+            Digest.article_id,
+            Digest.url,
+            Digest.title,
+            Digest.summary,
+            Digest.created_at
+        ).filter(
+            Digest.created_at >= cutoff_time
+        ).order_by(Digest.created_at.desc())
+
+        if limit:
+            query = query.limit(limit)
+        return query
+
+    def get_recent_digests(self, hours: int = 24, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [row._asdict() for row in self._recent_digests_query(hours, limit).all()]
+
+    def get_recent_digests_batch(self, hours: int = 24, limit: Optional[int] = None) -> DigestsBatch:
+        rows = self._recent_digests_query(hours, limit).all()
+        if not rows:
+            return DigestsBatch()
+        # Matched by column name, so the SELECT order doesn't matter
+        return DigestsBatch(**{
+            _DIGESTS_BATCH_FIELDS[name]: list(column) for name, column in zip(rows[0]._fields, zip(*rows))
+        })
+
+    def get_digest_type_counts(self, hours: int = 24) -> Dict[str, int]:
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        rows = self.session.query(
+            Digest.article_type, func.count(Digest.id)
+        ).filter(
+            Digest.created_at >= cutoff_time
+        ).group_by(Digest.article_type).all()
+        return {article_type: count for article_type, count in rows}
+
+    def count_recent_digests(self, hours: int = 24) -> int:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        digests = self.session.query(Digest).filter(
+        return self.session.query(func.count(Digest.id)).filter(
             Digest.created_at >= cutoff_time
-        ).order_by(Digest.created_at.desc()).all()
-
-        return [
-            {
-                "id": d.id,
-                "article_type": d.article_type,
-                "article_id": d.article_id,
-                "url": d.url,
-                "title": d.title,
-                "summary": d.summary,
-                "created_at": d.created_at
-            }
-            for d in digests
-        ]
+        ).scalar()
@@ -1,6 +1,10 @@
 from .embeddings import EmbeddingGenerator, get_embedding_generator
 from .vectorstore import VectorStore, get_vector_store
-from .retriever import ArticleRetriever, get_article_retriever
+from .retriever import ArticleRetriever, get_article_retriever, BatchEmbedder, get_batch_embedder
+from .faiss_store import FaissArticleStore, get_faiss_store
+from .semantic_cache import SemanticQueryCache, get_semantic_cache
+from .embedding_cache import EmbeddingCache, RedisEmbeddingCache, get_embedding_cache
+from .bm25 import BM25Index
 
 __all__ = [
     'EmbeddingGenerator',
@@ -8,5 +12,15 @@ __all__ = [
     'VectorStore',
     'get_vector_store',
     'ArticleRetriever',
-    'get_article_retriever'
+    'get_article_retriever',
+    'BatchEmbedder',
+    'get_batch_embedder',
+    'FaissArticleStore',
+    'get_faiss_store',
+    'SemanticQueryCache',
+    'get_semantic_cache',
+    'EmbeddingCache',
+    'RedisEmbeddingCache',
+    'get_embedding_cache',
+    'BM25Index'
 ]
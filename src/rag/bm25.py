@@ -0,0 +1,169 @@
+"""
+BM25 Keyword Index Module
+
+In-memory Okapi BM25 index over indexed article documents.
+Complements embedding search for queries that hinge on rare exact tokens
+(model names like "GPT-5" or "DeepSeek-R1").
+"""
+
+import re
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+import structlog
+
+log = structlog.get_logger()
+
+# Words with internal hyphens/dots stay whole ("gpt-5", "llama-3.1")
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-.][a-z0-9]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into BM25 tokens."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class BM25Index:
+    """
+    Okapi BM25 index with column-oriented postings.
+
+    Each term maps to (row indices, term frequencies) arrays, so scoring a
+    query is a scatter-add per query term over matching documents only.
+    """
+
+    def __init__(self,
+                 ids: List[str],
+                 documents: List[str],
+                 metadatas: List[Dict[str, Any]],
+                 k1: float = 1.2,
+                 b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            ids: Article IDs
+            documents: Article text (title + summary)
+            metadatas: Metadata dictionaries, row-aligned with ids
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.ids = np.asarray(ids, dtype=object)
+        self._row_of = {article_id: row for row, article_id in enumerate(ids)}
+        self.documents = documents
+        self.metadatas = metadatas
+        self.k1 = k1
+        self.b = b
+
+        postings: Dict[str, Dict[int, int]] = {}
+        doc_lengths = np.zeros(len(documents), dtype=np.float32)
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            doc_lengths[row] = len(tokens)
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[row] = counts.get(row, 0) + 1
+
+        n_docs = len(documents)
+        avg_length = float(doc_lengths.mean()) if n_docs else 0.0
+
+        # Per-document length normalization term of the BM25 denominator
+        if avg_length:
+            self._length_norm = k1 * (1 - b + b * doc_lengths / avg_length)
+        else:
+            self._length_norm = np.full(n_docs, k1, dtype=np.float32)
+
+        self._postings: Dict[str, tuple] = {}
+        for token, counts in postings.items():
+            rows = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            idf = np.log(1 + (n_docs - len(counts) + 0.5) / (len(counts) + 0.5))
+            self._postings[token] = (rows, tf, np.float32(idf))
+
+        log.info("BM25 index built", documents=n_docs, terms=len(self._postings))
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def get_scores(self, query: str) -> np.ndarray:
+        """
+        Score every document against a query.
+
+        Args:
+            query: Text query
+
+        Returns:
+            float32 array of BM25 scores, row-aligned with ids
+        """
+        scores = np.zeros(len(self.documents), dtype=np.float32)
+        for token in set(tokenize(query)):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+            rows, tf, idf = posting
+            scores[rows] += idf * tf * (self.k1 + 1) / (tf + self._length_norm[rows])
+        return scores
+
+    def get_scores_for(self, query: str, article_ids) -> np.ndarray:
+        """
+        Score a subset of documents against a query.
+
+        Args:
+            query: Text query
+            article_ids: Article IDs to score (unknown IDs score 0)
+
+        Returns:
+            float32 array of BM25 scores, aligned with article_ids
+        """
+        scores = self.get_scores(query)
+        return np.asarray(
+            [scores[self._row_of[article_id]] if article_id in self._row_of else 0.0 for article_id in article_ids],
+            dtype=np.float32
+        )
+
+    def get_documents(self, article_ids) -> List[Optional[str]]:
+        """
+        Look up indexed document text.
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            Documents aligned with article_ids (None for IDs not in the index)
+        """
+        return [
+            self.documents[self._row_of[article_id]] if article_id in self._row_of else None
+            for article_id in article_ids
+        ]
+
+    def search_columns(self,
+                      query: str,
+                      n_results: int = 10,
+                      where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Keyword search returning column-oriented results.
+
+        Args:
+            query: Text query
+            n_results: Number of results to return
+            where: Exact-match metadata filter (e.g., {"article_type": "youtube"})
+
+        Returns:
+            Dict with ids (ndarray), scores (float32 ndarray),
+            documents and metadatas (lists), row-aligned
+        """
+        scores = self.get_scores(query)
+        if where:
+            scores[[
+                not all(metadata.get(key) == value for key, value in where.items())
+                for metadata in self.metadatas
+            ]] = 0.0
+
+        matched = np.flatnonzero(scores > 0)
+        rows = matched[np.argsort(-scores[matched], kind="stable")[:n_results]]
+
+        return {
+            "ids": self.ids[rows],
+            "scores": scores[rows],
+            "documents": [self.documents[row] for row in rows],
+            "metadatas": [self.metadatas[row] for row in rows]
+        }
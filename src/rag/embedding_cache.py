@@ -0,0 +1,250 @@
+"""
+Embedding Cache Module
+
+Persistent cache of query embeddings keyed by SHA-256 of the model name
+and query text. Repeated searches (e.g. re-running the CLI) skip the
+embedding model entirely. Stored on disk in SQLite by default, or in
+Redis so that every API worker and host shares one cache.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import structlog
+
+log = structlog.get_logger()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed LRU cache of query embeddings with TTL.
+
+    Vectors are stored as raw float32 bytes. Entries whose dimension does
+    not match the expected embedding dimension are treated as misses, so a
+    model swap never serves stale vectors.
+    """
+
+    def __init__(self,
+                 path: str = "./cache/embeddings.sqlite",
+                 ttl: int = 7 * 24 * 3600,
+                 max_entries: int = 10000,
+                 dimension: Optional[int] = None):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            path: SQLite database file
+            ttl: Time-to-live for cached embeddings (seconds)
+            max_entries: Maximum number of cached embeddings
+            dimension: Expected embedding dimension (None to skip the check)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.dimension = dimension
+        self.hits = 0
+        self.misses = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON embeddings (accessed_at)")
+        self._conn.commit()
+
+    @staticmethod
+    def _key(model_name: str, text: str) -> str:
+        """Build the cache key for a model/query pair."""
+        return hashlib.sha256(f"{model_name}|{text}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Embedding vector on hit, None on miss
+        """
+        key = self._key(model_name, text)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT vector, expires_at FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+
+            vector = np.frombuffer(row[0], dtype=np.float32)
+            if self.dimension and len(vector) != self.dimension:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE embeddings SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        self.hits += 1
+        return vector.tolist()
+
+    def put(self, model_name: str, text: str, embedding: List[float]):
+        """
+        Store an embedding, evicting least recently used entries beyond max_entries.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+            embedding: Embedding vector
+        """
+        key = self._key(model_name, text)
+        now = time.time()
+        vector = np.asarray(embedding, dtype=np.float32).tobytes()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vector, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, vector, now + self.ttl, now)
+            )
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE key IN ("
+                "SELECT key FROM embeddings ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        """Remove all cached embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+        log.info("Embedding cache cleared")
+
+
+class RedisEmbeddingCache:
+    """
+    Redis-backed cache of query embeddings with TTL.
+
+    Same interface and key scheme as EmbeddingCache. Entries expire via
+    SETEX; size is bounded by the server's maxmemory policy rather than
+    max_entries. Redis errors are logged and treated as misses, so an
+    unavailable cache only costs a model forward pass.
+    """
+
+    KEY_PREFIX = "emb:"
+
+    def __init__(self, url: str, ttl: int = 7 * 24 * 3600, dimension: Optional[int] = None):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            url: Redis connection URL
+            ttl: Time-to-live for cached embeddings (seconds)
+            dimension: Expected embedding dimension (None to skip the check)
+        """
+        import redis
+
+        self.ttl = ttl
+        self.dimension = dimension
+        self.hits = 0
+        self.misses = 0
+
+        # Short timeouts: a slow cache must not cost more than the encode it saves
+        self._client = redis.Redis.from_url(url, socket_timeout=0.25, socket_connect_timeout=0.5)
+        self._client.ping()
+
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a cached embedding.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Embedding vector on hit, None on miss
+        """
+        try:
+            raw = self._client.get(self.KEY_PREFIX + EmbeddingCache._key(model_name, text))
+        except Exception as e:
+            log.warning("Redis embedding cache read failed", error=str(e))
+            raw = None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        vector = np.frombuffer(raw, dtype=np.float32)
+        if self.dimension and len(vector) != self.dimension:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return vector.tolist()
+
+    def put(self, model_name: str, text: str, embedding: List[float]):
+        """
+        Store an embedding with the cache TTL.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+            embedding: Embedding vector
+        """
+        try:
+            self._client.setex(
+                self.KEY_PREFIX + EmbeddingCache._key(model_name, text),
+                self.ttl,
+                np.asarray(embedding, dtype=np.float32).tobytes()
+            )
+        except Exception as e:
+            log.warning("Redis embedding cache write failed", error=str(e))
+
+    def clear(self):
+        """Remove all cached embeddings."""
+        keys = list(self._client.scan_iter(match=self.KEY_PREFIX + "*", count=1000))
+        if keys:
+            self._client.delete(*keys)
+        log.info("Embedding cache cleared", removed=len(keys))
+
+
+# Singleton instance
+_embedding_cache: Optional[Union[EmbeddingCache, RedisEmbeddingCache]] = None
+
+
+def get_embedding_cache() -> Union[EmbeddingCache, RedisEmbeddingCache]:
+    """Get or create singleton embedding cache instance (settings.embedding_cache_backend)."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        from src.config.settings import get_settings
+        settings = get_settings()
+
+        if settings.embedding_cache_backend == "redis":
+            try:
+                _embedding_cache = RedisEmbeddingCache(
+                    url=settings.redis_url,
+                    ttl=settings.embedding_cache_ttl,
+                    dimension=settings.embedding_dimension
+                )
+                return _embedding_cache
+            except Exception as e:
+                log.warning("Redis embedding cache unavailable, using SQLite", error=str(e))
+
+        _embedding_cache = EmbeddingCache(
+            path=settings.embedding_cache_path,
+            ttl=settings.embedding_cache_ttl,
+            max_entries=settings.embedding_cache_max_entries,
+            dimension=settings.embedding_dimension
+        )
+    return _embedding_cache
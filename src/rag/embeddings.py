@@ -7,7 +7,6 @@ Uses a lightweight model optimized for semantic search.
 
 import os
 from typing import List, Optional
-from sentence_transformers import SentenceTransformer
 import structlog
 
 log = structlog.get_logger()
@@ -17,26 +16,49 @@ class EmbeddingGenerator:
     """
     Generates semantic embeddings for text using sentence-transformers.
 
-    Uses 'all-MiniLM-L6-v2' model:
+    Defaults to the 'all-MiniLM-L6-v2' model (settings.embedding_model):
     - Fast inference (~5ms per sentence)
     - 384 dimensions
     - Good balance of speed and quality
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # Quantized ONNX export published alongside sentence-transformers models;
+    # int8 weights use VNNI dot products on recent CPUs
+    INT8_ONNX_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", backend: str = "torch"):
         """
         Initialize the embedding generator.
 
         Args:
             model_name: HuggingFace model name for embeddings
+            backend: "torch", "onnx", or "onnx-int8" (int8-quantized ONNX
+                     export of the same model; falls back to torch if the
+                     model has none or onnxruntime is not installed)
         """
         self.model_name = model_name
-        log.info(f"Loading embedding model: {model_name}")
+        log.info(f"Loading embedding model: {model_name}", backend=backend)
 
         try:
-            self.model = SentenceTransformer(model_name)
+            # Imported lazily so torch only loads when embeddings are needed
+            from sentence_transformers import SentenceTransformer
+
+            self.model = None
+            if backend in ("onnx", "onnx-int8"):
+                model_kwargs = {"file_name": self.INT8_ONNX_FILE} if backend == "onnx-int8" else None
+                try:
+                    self.model = SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+                except Exception as e:
+                    log.warning("ONNX embedding backend unavailable, falling back to torch",
+                               backend=backend, error=str(e))
+                    backend = "torch"
+            if self.model is None:
+                self.model = SentenceTransformer(model_name)
+
+            self.backend = backend
             log.info(f"Embedding model loaded successfully",
                     model=model_name,
+                    backend=backend,
                     dimensions=self.model.get_sentence_embedding_dimension())
         except Exception as e:
             log.error(f"Failed to load embedding model", error=str(e))
@@ -53,18 +75,19 @@ class EmbeddingGenerator:
             List of floats representing the embedding vector
         """
         try:
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
             return embedding.tolist()
         except Exception as e:
             log.error(f"Failed to generate embedding", error=str(e))
             raise
 
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings(self, texts: List[str], show_progress_bar: bool = True) -> List[List[float]]:
         """
         Generate embeddings for multiple texts (batch processing).
 
         Args:
             texts: List of texts to embed
+            show_progress_bar: Display a progress bar while encoding
 
         Returns:
             List of embedding vectors
@@ -73,8 +96,9 @@ class EmbeddingGenerator:
             log.info(f"Generating embeddings for {len(texts)} texts")
             embeddings = self.model.encode(texts,
                                           convert_to_numpy=True,
-                                          show_progress_bar=True,
-                                          batch_size=32)
+                                          normalize_embeddings=True,
+                                          show_progress_bar=show_progress_bar,
+                                          batch_size=64)
             log.info(f"Generated {len(embeddings)} embeddings")
             return embeddings.tolist()
         except Exception as e:
@@ -102,6 +126,11 @@ class EmbeddingGenerator:
 
         return self.generate_embedding(combined_text)
 
+    def warmup(self):
+        """Run one throwaway encode so the first real query skips lazy torch init."""
+        self.model.encode(["warmup"], convert_to_numpy=True, normalize_embeddings=True)
+        log.info("Embedding model warmed up", model=self.model_name)
+
     def get_embedding_dimension(self) -> int:
         """Get the dimension of the embeddings."""
         return self.model.get_sentence_embedding_dimension()
@@ -112,10 +141,30 @@ _embedding_generator: Optional[EmbeddingGenerator] = None
 
 
 def get_embedding_generator() -> EmbeddingGenerator:
-    """Get or create singleton embedding generator instance."""
+    """
+    Get or create singleton embedding generator instance.
+
+    The model is loaded and warmed up once per process and shared by every
+    caller (retriever, batch embedder, API, MCP server and Streamlit).
+    """
     global _embedding_generator
     if _embedding_generator is None:
-        _embedding_generator = EmbeddingGenerator()
+        from src.config.settings import get_settings
+        settings = get_settings()
+        _embedding_generator = EmbeddingGenerator(
+            model_name=settings.embedding_model,
+            backend=settings.embedding_backend
+        )
+
+        # The model is the source of truth for the vector size
+        dimension = _embedding_generator.get_embedding_dimension()
+        if dimension != settings.embedding_dimension:
+            log.warning("EMBEDDING_DIMENSION does not match the model, using model dimension",
+                       configured=settings.embedding_dimension,
+                       model_dimension=dimension)
+            settings.embedding_dimension = dimension
+
+        _embedding_generator.warmup()
     return _embedding_generator
 
 
@@ -0,0 +1,440 @@
+"""
+FAISS Vector Store Module
+
+In-memory FAISS index for the retriever hot path.
+ChromaDB remains the system of record; this store mirrors its writes and
+serves similarity search from a contiguous float32 matrix.
+"""
+
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+import structlog
+
+from .vectorstore import results_from_columns
+
+log = structlog.get_logger()
+
+
+class FaissArticleStore:
+    """
+    Vector store backed by a FAISS inner-product index.
+
+    Embeddings are L2-normalized on insert, so inner product equals cosine
+    similarity and the raw index score is returned as the similarity.
+    Results use the same shape as VectorStore.search, with distance also
+    reported as cosine distance (1 - similarity) for parity with the
+    ChromaDB collection.
+    """
+
+    # Candidates fetched from the int8 index per requested result,
+    # re-scored against full-precision vectors
+    RERANK_FACTOR = 4
+
+    # Maximum number of vectors used to train the scalar quantizer
+    TRAIN_SAMPLE_SIZE = 10000
+
+    # Minimum batch size for data-driven quantizer training; smaller
+    # batches train on the [-1, 1] range of unit vectors instead
+    MIN_TRAIN_SIZE = 1000
+
+    def __init__(self,
+                 dimension: int,
+                 persist_directory: str = "./faiss_index",
+                 index_type: str = "flat",
+                 quantization: str = "none",
+                 embedding_model: Optional[str] = None):
+        """
+        Initialize the FAISS store, loading a persisted index if present.
+
+        A persisted index built with a different embedding model,
+        dimension, index type or quantization is ignored, and a fresh
+        index is started (the retriever backfills it from ChromaDB).
+
+        Args:
+            dimension: Embedding dimension
+            persist_directory: Directory to persist the index and metadata
+            index_type: "flat" (exact) or "hnsw" (approximate)
+            quantization: "none" (float32), "int8" (scalar quantized
+                          scan with float32 re-ranking) or "int8-compact"
+                          (int8 codes only, ~4x smaller index, no re-rank)
+            embedding_model: Embedding model name, stamped on the index
+        """
+        import faiss
+
+        self._faiss = faiss
+        self.dimension = dimension
+        self.index_type = index_type
+        self.quantization = quantization
+        self.embedding_model = embedding_model
+        self.persist_directory = Path(persist_directory)
+        self.index_path = self.persist_directory / "index.faiss"
+        self.meta_path = self.persist_directory / "metadata.json"
+
+        # Row-aligned with the index
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+        self._id_to_row: Dict[str, int] = {}
+        self._type_masks: Dict[str, np.ndarray] = {}
+        self._dirty = False
+        # mtime of the metadata file this copy was loaded from / last saved
+        # to; save() skips writing over a newer copy from another process
+        self._disk_mtime_ns: Optional[int] = None
+        # Serializes writers: index.add runs before _id_to_row is updated,
+        # so concurrent adds/syncs would insert the same rows twice
+        self._write_lock = threading.RLock()
+
+        stored = None
+        if self.index_path.exists() and self.meta_path.exists():
+            with open(self.meta_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("embedding_model") != embedding_model or stored.get("dimension", dimension) != dimension:
+                log.warning("Persisted FAISS index was built with a different embedding model, rebuilding",
+                           stored_model=stored.get("embedding_model"),
+                           model=embedding_model)
+                stored = None
+            elif (stored.get("index_type", "flat"), stored.get("quantization", "none")) != (index_type, quantization):
+                log.warning("Persisted FAISS index has a different layout, rebuilding",
+                           stored_index_type=stored.get("index_type", "flat"),
+                           stored_quantization=stored.get("quantization", "none"),
+                           index_type=index_type,
+                           quantization=quantization)
+                stored = None
+
+        if stored is not None:
+            self.index = faiss.read_index(str(self.index_path))
+            if self.index.ntotal != len(stored["ids"]):
+                # Index and metadata from different saves; start over and
+                # let the retriever backfill from ChromaDB
+                log.warning("Persisted FAISS index and metadata disagree, rebuilding",
+                           index_count=self.index.ntotal,
+                           metadata_count=len(stored["ids"]))
+                stored = None
+
+        if stored is not None:
+            self._disk_mtime_ns = self.meta_path.stat().st_mtime_ns
+            self.ids = stored["ids"]
+            self.documents = stored["documents"]
+            self.metadatas = stored["metadatas"]
+            self._id_to_row = {article_id: row for row, article_id in enumerate(self.ids)}
+        else:
+            self.index = self._create_index()
+
+        log.info("FAISS store initialized",
+                index_type=index_type,
+                quantization=quantization,
+                count=self.index.ntotal)
+
+    def _create_index(self):
+        """Create an empty index of the configured type."""
+        faiss = self._faiss
+
+        if self.quantization in ("int8", "int8-compact"):
+            if self.index_type == "hnsw":
+                base = faiss.IndexHNSWSQ(self.dimension, faiss.ScalarQuantizer.QT_8bit, 32,
+                                         faiss.METRIC_INNER_PRODUCT)
+                base.hnsw.efSearch = 64
+            else:
+                base = faiss.IndexScalarQuantizer(self.dimension, faiss.ScalarQuantizer.QT_8bit,
+                                                  faiss.METRIC_INNER_PRODUCT)
+            if self.quantization == "int8-compact":
+                # One byte per dimension; scores come straight from the codes
+                return base
+
+            # Keeps float32 copies to re-rank the int8 candidates
+            index = faiss.IndexRefineFlat(base)
+            index.k_factor = self.RERANK_FACTOR
+            return index
+
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(self.dimension, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efSearch = 64
+            return index
+        return faiss.IndexFlatIP(self.dimension)
+
+    def _train(self, vectors: np.ndarray):
+        """Train the scalar quantizer on a sample of normalized vectors."""
+        if len(vectors) >= self.MIN_TRAIN_SIZE:
+            rng = np.random.default_rng(0)
+            size = min(len(vectors), self.TRAIN_SAMPLE_SIZE)
+            sample = vectors[rng.choice(len(vectors), size=size, replace=False)]
+        else:
+            # Unit vectors lie within [-1, 1] on every axis
+            identity = np.eye(self.dimension, dtype=np.float32)
+            sample = np.vstack([identity, -identity])
+
+        self.index.train(sample)
+        log.info("Trained int8 scalar quantizer", sample_size=len(sample))
+
+    @staticmethod
+    def _normalize(embeddings: List[List[float]]) -> np.ndarray:
+        """Convert embeddings to a contiguous, L2-normalized float32 matrix."""
+        matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def add_articles(self,
+                    article_ids: List[str],
+                    embeddings: List[List[float]],
+                    documents: List[str],
+                    metadatas: List[Dict[str, Any]]):
+        """
+        Add articles to the index, skipping IDs that are already present.
+
+        Args:
+            article_ids: Unique IDs for articles
+            embeddings: Embedding vectors
+            documents: Text content for each article
+            metadatas: Metadata dictionaries (title, url, type, etc.)
+        """
+        with self._write_lock:
+            rows = [i for i, article_id in enumerate(article_ids) if article_id not in self._id_to_row]
+            if not rows:
+                return
+
+            vectors = self._normalize([embeddings[i] for i in rows])
+            if not self.index.is_trained:
+                self._train(vectors)
+            self.index.add(vectors)
+            for i in rows:
+                self._id_to_row[article_ids[i]] = len(self.ids)
+                self.ids.append(article_ids[i])
+                self.documents.append(documents[i])
+                self.metadatas.append(metadatas[i])
+
+            self._type_masks.clear()
+            self._dirty = True
+        log.info("Added articles to FAISS store", count=len(rows), total_articles=self.index.ntotal)
+
+    def search_columns(self,
+                      query_embedding: List[float],
+                      n_results: int = 10,
+                      where: Optional[Dict[str, Any]] = None,
+                      include_documents: bool = True) -> Dict[str, Any]:
+        """
+        Semantic search returning column-oriented results.
+
+        Args:
+            query_embedding: Query vector
+            n_results: Number of results to return
+            where: Exact-match metadata filter (e.g., {"article_type": "youtube"})
+            include_documents: Return document text (same contract as
+                               VectorStore.search_columns)
+
+        Returns:
+            Dict with ids (ndarray), distances and similarities (float32
+            ndarrays), documents (list, or None if not included) and
+            metadatas (list), row-aligned
+        """
+        mask = self._where_mask(where) if where else None
+
+        if self.index.ntotal == 0 or (mask is not None and not mask.any()):
+            rows = np.empty(0, dtype=np.int64)
+            scores = np.empty(0, dtype=np.float32)
+        elif mask is None:
+            scores, rows = self._search(query_embedding, min(n_results, self.index.ntotal))
+            keep = rows >= 0
+            rows, scores = rows[keep], scores[keep]
+        else:
+            matches = int(mask.sum())
+
+            # Over-fetch in proportion to the filter's selectivity, and
+            # fall back to a full scan if too few candidates survive
+            k = min(self.index.ntotal, -(-n_results * self.index.ntotal // max(matches, 1)) * 2)
+            while True:
+                scores, rows = self._search(query_embedding, k)
+                keep = rows >= 0
+                keep[keep] = mask[rows[keep]]
+                if keep.sum() >= min(n_results, matches) or k == self.index.ntotal:
+                    break
+                k = self.index.ntotal
+
+            rows = rows[keep][:n_results]
+            scores = scores[keep][:n_results]
+
+        return {
+            "ids": np.asarray([self.ids[row] for row in rows], dtype=object),
+            "distances": (1.0 - scores).astype(np.float32),
+            "similarities": scores.astype(np.float32),
+            "documents": [self.documents[row] for row in rows] if include_documents else None,
+            "metadatas": [self.metadatas[row] for row in rows]
+        }
+
+    def _search(self, query_embedding: List[float], k: int):
+        """
+        Run a top-k index search for a single query, returning (scores, rows).
+
+        Query embeddings come unit-length from EmbeddingGenerator, so they
+        are passed to the index as-is.
+        """
+        scores, rows = self.index.search(np.ascontiguousarray([query_embedding], dtype=np.float32), k)
+        return scores[0], rows[0]
+
+    def _where_mask(self, where: Dict[str, Any]) -> np.ndarray:
+        """
+        Boolean row mask for an exact-match metadata filter.
+
+        Single-key article_type filters (the common case) use a cached
+        per-type mask, rebuilt only after new articles are added.
+        """
+        if set(where) == {"article_type"}:
+            article_type = where["article_type"]
+            mask = self._type_masks.get(article_type)
+            if mask is None:
+                mask = np.fromiter(
+                    (metadata.get("article_type") == article_type for metadata in self.metadatas),
+                    dtype=bool,
+                    count=len(self.metadatas)
+                )
+                self._type_masks[article_type] = mask
+            return mask
+
+        return np.fromiter(
+            (all(metadata.get(key) == value for key, value in where.items()) for metadata in self.metadatas),
+            dtype=bool,
+            count=len(self.metadatas)
+        )
+
+    def search(self,
+              query_embedding: List[float],
+              n_results: int = 10,
+              where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Semantic search using query embedding.
+
+        Args:
+            query_embedding: Query vector
+            n_results: Number of results to return
+            where: Exact-match metadata filter (e.g., {"article_type": "youtube"})
+
+        Returns:
+            Dict with results (id, distance, document, metadata) and count
+        """
+        return results_from_columns(self.search_columns(query_embedding, n_results, where))
+
+    def count(self) -> int:
+        """Get total number of articles in the index."""
+        return self.index.ntotal
+
+    def sync_from(self, vector_store) -> int:
+        """
+        Add articles stored in a ChromaDB vector store but missing here.
+
+        Used for the initial backfill and to reconcile with writes from
+        other processes; only the missing articles' embeddings are fetched.
+
+        Args:
+            vector_store: VectorStore to copy embeddings from
+
+        Returns:
+            Number of articles added
+        """
+        with self._write_lock:
+            stored_ids = vector_store.collection.get(include=[])["ids"]
+            missing = [article_id for article_id in stored_ids if article_id not in self._id_to_row]
+            if not missing:
+                return 0
+
+            existing = vector_store.collection.get(ids=missing, include=["embeddings", "documents", "metadatas"])
+            before = self.index.ntotal
+            if existing["ids"]:
+                self.add_articles(
+                    article_ids=existing["ids"],
+                    embeddings=existing["embeddings"],
+                    documents=existing["documents"],
+                    metadatas=existing["metadatas"]
+                )
+            return self.index.ntotal - before
+
+    def save(self):
+        """
+        Persist the index and row metadata to disk if changed.
+
+        Several processes (API, MCP server, Streamlit, CLI) share the files.
+        If another process saved since this copy was loaded, its file is
+        kept rather than overwritten; whatever either copy is missing is
+        restored from ChromaDB by the retriever's sync on the next load.
+        Files are written to temporaries and swapped in with os.replace,
+        so readers never see a partially written file.
+        """
+        if not self._dirty:
+            return
+
+        if self.meta_path.exists() and self.meta_path.stat().st_mtime_ns != self._disk_mtime_ns:
+            log.warning("FAISS index on disk was saved by another process, keeping it",
+                       path=str(self.persist_directory))
+            self._dirty = False
+            return
+
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        index_tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+        meta_tmp = self.meta_path.with_name(self.meta_path.name + ".tmp")
+        self._faiss.write_index(self.index, str(index_tmp))
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "embedding_model": self.embedding_model,
+                "dimension": self.dimension,
+                "index_type": self.index_type,
+                "quantization": self.quantization,
+                "ids": self.ids,
+                "documents": self.documents,
+                "metadatas": self.metadatas
+            }, f)
+        os.replace(index_tmp, self.index_path)
+        os.replace(meta_tmp, self.meta_path)
+
+        self._disk_mtime_ns = self.meta_path.stat().st_mtime_ns
+        self._dirty = False
+        log.info("FAISS store persisted", path=str(self.persist_directory), count=self.index.ntotal)
+
+
+# Singleton instance
+_faiss_store: Optional[FaissArticleStore] = None
+_faiss_unavailable = False
+
+
+def get_faiss_store() -> Optional[FaissArticleStore]:
+    """
+    Get or create the singleton FAISS store.
+
+    Returns None unless settings.vector_backend is "faiss". Falls back
+    silently (returning None) if faiss is not installed or the index
+    cannot be loaded, so callers keep using ChromaDB.
+    """
+    global _faiss_store, _faiss_unavailable
+    if _faiss_store is not None or _faiss_unavailable:
+        return _faiss_store
+
+    from src.config.settings import get_settings
+    settings = get_settings()
+    if settings.vector_backend != "faiss":
+        _faiss_unavailable = True
+        return None
+
+    try:
+        _faiss_store = FaissArticleStore(
+            dimension=settings.embedding_dimension,
+            persist_directory=settings.faiss_persist_directory,
+            index_type=settings.faiss_index_type,
+            quantization=settings.embedding_quantization,
+            embedding_model=settings.embedding_model
+        )
+        atexit.register(persist_faiss_store)
+    except Exception as e:
+        log.warning("FAISS unavailable, falling back to ChromaDB", error=str(e))
+        _faiss_unavailable = True
+
+    return _faiss_store
+
+
+def persist_faiss_store():
+    """Persist the FAISS store if it has been created."""
+    if _faiss_store is not None:
+        _faiss_store.save()
@@ -5,10 +5,20 @@ High-level interface for semantic article retrieval using RAG.
 Combines embedding generation and vector search for intelligent retrieval.
 """
 
-from typing import List, Dict, Optional, Any
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple
+import numpy as np
 import structlog
 from .embeddings import EmbeddingGenerator, get_embedding_generator
-from .vectorstore import VectorStore, get_vector_store
+from .vectorstore import VectorStore, get_vector_store, results_from_columns
+from .semantic_cache import get_semantic_cache
+from .embedding_cache import get_embedding_cache
+from .faiss_store import FaissArticleStore, get_faiss_store
+from .bm25 import BM25Index
 
 log = structlog.get_logger()
 
@@ -24,18 +34,42 @@ class ArticleRetriever:
     - Duplicate detection
     """
 
+    # In-process LRU sizes: query embeddings never go stale for a given
+    # model, similarity results are dropped whenever the index changes
+    QUERY_EMBEDDING_CACHE_SIZE = 2048
+    RESULT_CACHE_SIZE = 512
+
+    # Seconds between checks of the shared ChromaDB count for writes made
+    # by other processes (kept off the per-query path)
+    REFRESH_INTERVAL = 30
+
     def __init__(self,
                  embedding_generator: Optional[EmbeddingGenerator] = None,
-                 vector_store: Optional[VectorStore] = None):
+                 vector_store: Optional[VectorStore] = None,
+                 faiss_store: Optional[FaissArticleStore] = None):
         """
         Initialize the article retriever.
 
         Args:
             embedding_generator: Embedding generator instance
             vector_store: Vector store instance
+            faiss_store: Optional FAISS store for the search hot path
+                         (defaults to settings.vector_backend)
         """
         self.embedding_generator = embedding_generator or get_embedding_generator()
         self.vector_store = vector_store or get_vector_store()
+        self.faiss_store = faiss_store or get_faiss_store()
+        self._keyword_index: Optional[BM25Index] = None
+        self._encode_query = lru_cache(maxsize=self.QUERY_EMBEDDING_CACHE_SIZE)(
+            lambda query: tuple(self.embedding_generator.generate_embedding(query))
+        )
+        self._results: "OrderedDict[Tuple[str, int, Optional[str]], List[Dict[str, Any]]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+
+        # Backfill a fresh FAISS index, or one missing other processes' writes
+        self._indexed_count = self.vector_store.count()
+        self._next_refresh = time.monotonic() + self.REFRESH_INTERVAL
+        self._sync_faiss(self._indexed_count)
 
         log.info("Article retriever initialized",
                 embedding_dim=self.embedding_generator.get_embedding_dimension(),
@@ -84,7 +118,9 @@ class ArticleRetriever:
                 document=document,
                 metadata=meta
             )
+            self._mirror_to_faiss([article_id], [embedding], [document], [meta])
 
+            self._invalidate_query_caches()
             log.info("Article indexed successfully", article_id=article_id)
 
         except Exception as e:
@@ -129,8 +165,8 @@ class ArticleRetriever:
                 })
                 metadatas.append(meta)
 
-            # Generate embeddings in batch (faster)
-            embeddings = self.embedding_generator.generate_embeddings(texts)
+            # Generate all embeddings in one encode call (batch_size=64)
+            embeddings = self.embedding_generator.generate_embeddings(texts, show_progress_bar=False)
 
             # Add to vector store
             self.vector_store.add_articles(
@@ -139,51 +175,406 @@ class ArticleRetriever:
                 documents=documents,
                 metadatas=metadatas
             )
+            self._mirror_to_faiss(article_ids, embeddings, documents, metadatas)
 
+            self._invalidate_query_caches()
             log.info(f"Successfully indexed {len(articles)} articles")
 
         except Exception as e:
             log.error("Failed to index articles batch", error=str(e))
             raise
 
-    def find_similar(self,
-                    query: str,
-                    n_results: int = 5,
-                    article_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _mirror_to_faiss(self,
+                        article_ids: List[str],
+                        embeddings: List[List[float]],
+                        documents: List[str],
+                        metadatas: List[Dict[str, Any]]):
+        """Dual-write articles to the FAISS store (ChromaDB stays authoritative)."""
+        if self.faiss_store is None:
+            return
+        try:
+            self.faiss_store.add_articles(
+                article_ids=article_ids,
+                embeddings=embeddings,
+                documents=documents,
+                metadatas=metadatas
+            )
+        except Exception as e:
+            log.warning("FAISS dual-write failed", error=str(e))
+
+    def _sync_faiss(self, chroma_count: int):
         """
-        Find articles similar to a query.
+        Add articles ChromaDB has but the FAISS mirror lacks.
+
+        Other processes index into the shared ChromaDB and may have saved
+        their own FAISS copy over ours, so the mirror is reconciled when
+        ChromaDB holds more articles, like the BM25 index rebuild.
+
+        Args:
+            chroma_count: Current ChromaDB article count
+        """
+        if self.faiss_store is None or self.faiss_store.count() >= chroma_count:
+            return
+        synced = self.faiss_store.sync_from(self.vector_store)
+        if synced:
+            self._invalidate_query_caches()
+            log.info("FAISS store synced from ChromaDB", count=synced)
+
+    def _refresh_if_stale(self):
+        """
+        Pick up writes made by other processes, at most every REFRESH_INTERVAL.
+
+        A changed ChromaDB count drops the cached results and the BM25
+        index and reconciles the FAISS mirror.
+        """
+        now = time.monotonic()
+        if now < self._next_refresh:
+            return
+        self._next_refresh = now + self.REFRESH_INTERVAL
+
+        try:
+            count = self.vector_store.count()
+        except Exception as e:
+            log.warning("Index refresh check failed", error=str(e))
+            return
+        if count == self._indexed_count:
+            return
+
+        self._indexed_count = count
+        self._invalidate_query_caches()
+        try:
+            self._sync_faiss(count)
+        except Exception as e:
+            log.warning("FAISS sync failed", error=str(e))
+
+    def _invalidate_query_caches(self):
+        """Drop everything derived from the index contents after a write."""
+        self._keyword_index = None
+        with self._results_lock:
+            self._results.clear()
+        get_semantic_cache().clear()
+
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Generate the embedding for a search query.
+
+        Repeated queries (e.g. the same interest profile across ranking
+        calls) are served from an in-process LRU instead of re-encoding.
+
+        Args:
+            query: Text query
+
+        Returns:
+            Query embedding vector
+        """
+        return list(self._encode_query(query))
+
+    def embed_query_cached(self, query: str) -> List[float]:
+        """
+        Generate the embedding for a search query, using the on-disk cache.
 
         Args:
             query: Text query
+
+        Returns:
+            Query embedding vector
+        """
+        cache = get_embedding_cache()
+        model_name = self.embedding_generator.model_name
+
+        embedding = cache.get(model_name, query)
+        if embedding is None:
+            embedding = self.embed_query(query)
+            cache.put(model_name, query, embedding)
+        return embedding
+
+    def search_columns(self,
+                      query_embedding: List[float],
+                      n_results: int = 5,
+                      article_type: Optional[str] = None,
+                      include_documents: bool = True) -> Dict[str, Any]:
+        """
+        Find similar articles, returning column-oriented results.
+
+        Args:
+            query_embedding: Query vector (see embed_query)
             n_results: Number of results to return
             article_type: Filter by type (youtube, openai, anthropic)
+            include_documents: Return document text (disable for candidate
+                               over-fetches)
 
         Returns:
-            List of similar articles with scores
+            Dict with ids (ndarray), distances and similarities (float32
+            ndarrays), documents (list, or None if not included) and
+            metadatas (list), row-aligned
         """
-        try:
-            # Generate query embedding
-            query_embedding = self.embedding_generator.generate_embedding(query)
+        # Build filter
+        where = None
+        if article_type:
+            where = {"article_type": article_type}
+
+        self._refresh_if_stale()
+
+        if self.faiss_store is not None:
+            try:
+                return self.faiss_store.search_columns(
+                    query_embedding=query_embedding,
+                    n_results=n_results,
+                    where=where,
+                    include_documents=include_documents
+                )
+            except Exception as e:
+                log.warning("FAISS search failed, falling back to ChromaDB", error=str(e))
+
+        # Search vector store
+        return self.vector_store.search_columns(
+            query_embedding=query_embedding,
+            n_results=n_results,
+            where=where,
+            include_documents=include_documents
+        )
+
+    def get_keyword_index(self) -> BM25Index:
+        """
+        Get the BM25 index over all indexed documents.
 
-            # Build filter
-            where = None
-            if article_type:
-                where = {"article_type": article_type}
+        Built lazily and rebuilt when the vector store count changes
+        (including writes from other processes).
+        """
+        if self._keyword_index is None or len(self._keyword_index) != self.vector_store.count():
+            stored = self.vector_store.collection.get(include=["documents", "metadatas"])
+            self._keyword_index = BM25Index(
+                ids=stored["ids"],
+                documents=stored["documents"],
+                metadatas=stored["metadatas"]
+            )
+        return self._keyword_index
 
-            # Search vector store
-            results = self.vector_store.search(
+    def keyword_search_columns(self,
+                              query: str,
+                              n_results: int = 5,
+                              article_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Find articles by BM25 keyword match, returning column-oriented results.
+
+        Args:
+            query: Text query
+            n_results: Number of results to return
+            article_type: Filter by type (youtube, openai, anthropic)
+
+        Returns:
+            Dict with ids (ndarray), similarities (BM25 scores, float32
+            ndarray), documents and metadatas (lists), row-aligned
+        """
+        where = {"article_type": article_type} if article_type else None
+        results = self.get_keyword_index().search_columns(query, n_results=n_results, where=where)
+        results["similarities"] = results.pop("scores")
+        return results
+
+    def hybrid_search_columns(self,
+                             query: str,
+                             query_embedding: List[float],
+                             n_results: int = 5,
+                             article_type: Optional[str] = None,
+                             keyword_weight: float = 0.4,
+                             candidate_factor: int = 5) -> Dict[str, Any]:
+        """
+        Re-rank semantic candidates with a weighted BM25 + cosine score.
+
+        Both scores are min-max normalized over the candidate set, then
+        combined as keyword_weight * bm25 + (1 - keyword_weight) * cosine.
+
+        Args:
+            query: Text query
+            query_embedding: Query vector (see embed_query)
+            n_results: Number of results to return
+            article_type: Filter by type (youtube, openai, anthropic)
+            keyword_weight: Weight of the BM25 score
+            candidate_factor: Semantic candidates fetched per requested result
+
+        Returns:
+            Dict with ids (ndarray), similarities (hybrid scores, float32
+            ndarray), documents and metadatas (lists), row-aligned
+        """
+        # Over-fetch without document text; only the survivors need it
+        candidates = self.search_columns(
+            query_embedding=query_embedding,
+            n_results=n_results * candidate_factor,
+            article_type=article_type,
+            include_documents=False
+        )
+
+        keyword_index = self.get_keyword_index()
+        bm25 = keyword_index.get_scores_for(query, candidates["ids"])
+
+        def min_max(scores: np.ndarray) -> np.ndarray:
+            spread = scores.max() - scores.min() if len(scores) else 0
+            return (scores - scores.min()) / spread if spread > 0 else np.zeros_like(scores)
+
+        combined = keyword_weight * min_max(bm25) + (1 - keyword_weight) * min_max(candidates["similarities"])
+        order = np.argsort(-combined, kind="stable")[:n_results]
+        ids = candidates["ids"][order]
+
+        # The keyword index already holds document text in memory; only
+        # articles indexed since it was built go back to the vector store
+        documents = keyword_index.get_documents(ids)
+        missing = [i for i, document in enumerate(documents) if document is None]
+        if missing:
+            fetched = self.vector_store.get_documents([ids[i] for i in missing])
+            for i, document in zip(missing, fetched):
+                documents[i] = document
+
+        return {
+            "ids": ids,
+            "similarities": combined[order].astype(np.float32),
+            "documents": documents,
+            "metadatas": [candidates["metadatas"][i] for i in order]
+        }
+
+    def fused_search_columns(self,
+                            query: str,
+                            query_embedding: List[float],
+                            n_results: int = 5,
+                            article_type: Optional[str] = None,
+                            rrf_k: int = 60,
+                            candidate_factor: int = 5) -> Dict[str, Any]:
+        """
+        Merge semantic and BM25 result lists with Reciprocal Rank Fusion.
+
+        Unlike hybrid_search_columns, which only re-ranks semantic
+        candidates, both retrievers contribute candidates, so exact-term
+        matches the embedding misses still surface. Each article scores
+        sum(1 / (rrf_k + rank)) over the lists it appears in.
+
+        Args:
+            query: Text query
+            query_embedding: Query vector (see embed_query)
+            n_results: Number of results to return
+            article_type: Filter by type (youtube, openai, anthropic)
+            rrf_k: RRF rank offset (60 is the standard choice)
+            candidate_factor: Candidates fetched per requested result from each list
+
+        Returns:
+            Dict with ids (ndarray), similarities (RRF scores, float32
+            ndarray), documents and metadatas (lists), row-aligned
+        """
+        n_candidates = n_results * candidate_factor
+        semantic = self.search_columns(
+            query_embedding=query_embedding,
+            n_results=n_candidates,
+            article_type=article_type,
+            include_documents=False
+        )
+        keyword = self.keyword_search_columns(query, n_results=n_candidates, article_type=article_type)
+
+        scores: Dict[str, float] = {}
+        metadata_of: Dict[str, Dict[str, Any]] = {}
+        for results in (semantic, keyword):
+            for rank, (article_id, metadata) in enumerate(zip(results["ids"], results["metadatas"]), 1):
+                scores[article_id] = scores.get(article_id, 0.0) + 1.0 / (rrf_k + rank)
+                metadata_of.setdefault(article_id, metadata)
+
+        ids = np.asarray(list(scores), dtype=object)
+        fused = np.fromiter(scores.values(), dtype=np.float32, count=len(scores))
+        order = np.argsort(-fused, kind="stable")[:n_results]
+        ids = ids[order]
+
+        documents = self.get_keyword_index().get_documents(ids)
+        missing = [i for i, document in enumerate(documents) if document is None]
+        if missing:
+            fetched = self.vector_store.get_documents([ids[i] for i in missing])
+            for i, document in zip(missing, fetched):
+                documents[i] = document
+
+        return {
+            "ids": ids,
+            "similarities": fused[order],
+            "documents": documents,
+            "metadatas": [metadata_of[article_id] for article_id in ids]
+        }
+
+    def search_by_embedding(self,
+                           query_embedding: List[float],
+                           n_results: int = 5,
+                           article_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find articles similar to a precomputed query embedding.
+
+        Args:
+            query_embedding: Query vector (see embed_query)
+            n_results: Number of results to return
+            article_type: Filter by type (youtube, openai, anthropic)
+
+        Returns:
+            List of similar articles with scores
+        """
+        try:
+            results = results_from_columns(self.search_columns(
                 query_embedding=query_embedding,
                 n_results=n_results,
-                where=where
-            )
+                article_type=article_type
+            ))
 
-            log.info(f"Found {results['count']} similar articles", query=query[:50])
+            log.info(f"Found {results['count']} similar articles")
             return results["results"]
 
         except Exception as e:
             log.error("Similarity search failed", error=str(e))
             return []
 
+    def find_similar(self,
+                    query: str,
+                    n_results: int = 5,
+                    article_type: Optional[str] = None,
+                    use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Find articles similar to a query.
+
+        Results are kept in an in-process LRU keyed on the arguments until
+        the index changes (a write here, or a ChromaDB count change seen
+        by the periodic refresh), so repeated lookups skip the encode and
+        the ANN search.
+
+        Args:
+            query: Text query
+            n_results: Number of results to return
+            article_type: Filter by type (youtube, openai, anthropic)
+            use_cache: Whether to read and populate the result LRU
+
+        Returns:
+            List of similar articles with scores
+        """
+        self._refresh_if_stale()
+
+        key = (query, n_results, article_type)
+        if use_cache:
+            with self._results_lock:
+                cached = self._results.get(key)
+                if cached is not None:
+                    self._results.move_to_end(key)
+                    return [dict(result) for result in cached]
+
+        try:
+            query_embedding = self.embed_query(query)
+        except Exception as e:
+            log.error("Similarity search failed", error=str(e))
+            return []
+
+        log.debug("Searching for similar articles", query=query[:50])
+        results = self.search_by_embedding(
+            query_embedding=query_embedding,
+            n_results=n_results,
+            article_type=article_type
+        )
+
+        # Empty results may be a swallowed search error; don't pin them
+        if results and use_cache:
+            with self._results_lock:
+                self._results[key] = [dict(result) for result in results]
+                while len(self._results) > self.RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+        return results
+
     def find_similar_to_article(self,
                                article_id: str,
                                n_results: int = 5,
@@ -282,6 +673,132 @@ class ArticleRetriever:
         return self.vector_store.count()
 
 
+class BatchEmbedder:
+    """
+    Coalesces concurrent query embeddings into a single batched encode.
+
+    Requests arriving within a short window are drained from a queue and
+    embedded together, amortizing per-call model overhead when several
+    searches run at once (e.g. MCP tool fan-out). The embedder owns a
+    background event loop thread so it can be used from sync callers.
+    """
+
+    def __init__(self,
+                 embedding_generator: Optional[EmbeddingGenerator] = None,
+                 max_batch: int = 32,
+                 window_ms: int = 10):
+        """
+        Initialize the batch embedder.
+
+        Args:
+            embedding_generator: Embedding generator instance
+            max_batch: Maximum number of queries per batch
+            window_ms: Coalescing window in milliseconds
+        """
+        self.embedding_generator = embedding_generator or get_embedding_generator()
+        self.max_batch = max_batch
+        self.window = window_ms / 1000
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._lock = threading.Lock()
+
+        self.batches = 0
+        self.items = 0
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop thread and drain task on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="batch-embedder", daemon=True).start()
+                asyncio.run_coroutine_threadsafe(self._start(), loop).result()
+                self._loop = loop
+        return self._loop
+
+    async def _start(self):
+        """Create the queue and drain task on the embedder loop."""
+        self._queue = asyncio.Queue()
+        asyncio.get_running_loop().create_task(self._drain())
+
+    async def _submit(self, text: str) -> List[float]:
+        """Enqueue a query and wait for its embedding."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _drain(self):
+        """Drain the queue in batches of up to max_batch or window_ms."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.window
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                embeddings = await loop.run_in_executor(
+                    None,
+                    lambda: self.embedding_generator.generate_embeddings(texts, show_progress_bar=False)
+                )
+            except Exception as e:
+                log.error("Batched query embedding failed", batch_size=len(batch), error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def embed_query_batched(self, text: str) -> List[float]:
+        """
+        Embed a query, coalescing with other concurrent requests.
+
+        Safe to await from any event loop.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding vector
+        """
+        loop = self._ensure_loop()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._submit(text), loop))
+
+    def embed(self, text: str) -> List[float]:
+        """
+        Blocking variant of embed_query_batched for sync callers.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Query embedding vector
+        """
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._submit(text), loop).result()
+
+    @property
+    def batch_fill_ratio(self) -> float:
+        """Average fraction of max_batch filled per encode call."""
+        if not self.batches:
+            return 0.0
+        return self.items / (self.batches * self.max_batch)
+
+
 # Singleton instance
 _retriever: Optional[ArticleRetriever] = None
 
@@ -294,6 +811,17 @@ def get_article_retriever() -> ArticleRetriever:
     return _retriever
 
 
+_batch_embedder: Optional[BatchEmbedder] = None
+
+
+def get_batch_embedder() -> BatchEmbedder:
+    """Get or create singleton batch embedder instance."""
+    global _batch_embedder
+    if _batch_embedder is None:
+        _batch_embedder = BatchEmbedder()
+    return _batch_embedder
+
+
 if __name__ == "__main__":
     # Test the retriever
     import structlog
@@ -0,0 +1,149 @@
+"""
+Semantic Query Cache Module
+
+In-process cache for search results keyed by query embedding.
+Near-duplicate queries (cosine similarity above a threshold) are served
+from memory, skipping the vector store search entirely.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import structlog
+
+log = structlog.get_logger()
+
+
+class SemanticQueryCache:
+    """
+    LRU cache of search results looked up by embedding similarity.
+
+    Entries are partitioned by (article_type, limit) so that a cached
+    result set is only reused for an identical search shape. Within a
+    partition, cached query embeddings are kept L2-normalized in a single
+    float32 matrix, so a lookup is one matrix-vector product.
+    """
+
+    def __init__(self, max_size: int = 256, ttl: int = 600, threshold: float = 0.97):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            max_size: Maximum number of cached queries per partition
+            ttl: Time-to-live for cached entries (seconds)
+            threshold: Minimum cosine similarity for a cache hit
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.threshold = threshold
+
+        # (article_type, limit) -> (keys_emb[N, d], [(results, expiry), ...])
+        self._partitions: "OrderedDict[Tuple[Optional[str], int], Tuple[np.ndarray, List[Tuple[Any, float]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # Shared across Streamlit script threads and the API threadpool
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self,
+            query_embedding: List[float],
+            article_type: Optional[str] = None,
+            limit: int = 5) -> Optional[Any]:
+        """
+        Look up cached results for a query embedding.
+
+        Args:
+            query_embedding: Embedding of the incoming query
+            article_type: Article type filter used for the search
+            limit: Number of results requested
+
+        Returns:
+            Cached results on hit, None on miss
+        """
+        query = self._normalize(query_embedding)
+        with self._lock:
+            partition = self._partitions.get((article_type, limit))
+            if partition is None:
+                self.misses += 1
+                return None
+
+            keys_emb, entries = partition
+            scores = keys_emb @ query
+            best = int(np.argmax(scores))
+            results, expiry = entries[best]
+
+            if scores[best] >= self.threshold and expiry > time.monotonic():
+                self.hits += 1
+                log.debug("Semantic cache hit", score=float(scores[best]), article_type=article_type)
+                return results
+
+            self.misses += 1
+            return None
+
+    def put(self,
+            query_embedding: List[float],
+            results: Any,
+            article_type: Optional[str] = None,
+            limit: int = 5):
+        """
+        Store results for a query embedding.
+
+        Args:
+            query_embedding: Embedding of the query
+            results: Search results to cache
+            article_type: Article type filter used for the search
+            limit: Number of results requested
+        """
+        key = (article_type, limit)
+        vector = self._normalize(query_embedding)[None, :]
+        entry = (results, time.monotonic() + self.ttl)
+
+        with self._lock:
+            partition = self._partitions.get(key)
+            if partition is None:
+                self._partitions[key] = (vector, [entry])
+                return
+
+            keys_emb, entries = partition
+
+            # Drop expired entries and evict the oldest beyond max_size
+            now = time.monotonic()
+            keep = [i for i, (_, expiry) in enumerate(entries) if expiry > now]
+            keep = keep[max(0, len(keep) - self.max_size + 1):]
+            keys_emb = np.vstack([keys_emb[keep], vector]) if keep else vector
+            entries = [entries[i] for i in keep] + [entry]
+
+            self._partitions[key] = (keys_emb, entries)
+            self._partitions.move_to_end(key)
+
+    def clear(self):
+        """Invalidate all cached results (call after content writes)."""
+        with self._lock:
+            self._partitions.clear()
+        log.info("Semantic cache cleared")
+
+    def size(self) -> int:
+        """Get total number of cached queries."""
+        with self._lock:
+            return sum(len(entries) for _, entries in self._partitions.values())
+
+
+# Singleton instance
+_semantic_cache: Optional[SemanticQueryCache] = None
+
+
+def get_semantic_cache() -> SemanticQueryCache:
+    """Get or create singleton semantic cache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticQueryCache()
+    return _semantic_cache
@@ -7,9 +7,9 @@ Supports semantic search, filtering, and similarity-based retrieval.
 
 import os
 from typing import List, Dict, Optional, Any
+import numpy as np
 import chromadb
 from chromadb.config import Settings
-from chromadb.utils import embedding_functions
 import structlog
 
 log = structlog.get_logger()
@@ -26,18 +26,38 @@ class VectorStore:
     - Hybrid search (keyword + semantic)
     """
 
+    # Articles per collection.add call when indexing large batches
+    ADD_BATCH_SIZE = 128
+
+    # HNSW settings for new collections (Chroma reads them at creation only).
+    # construction_ef/M stay at 100/16, which keeps inserts cheap at this
+    # collection size; search_ef is raised from Chroma's default of 10 for
+    # recall; batch_size matches ADD_BATCH_SIZE so each add is flushed to
+    # the graph once, and sync_threshold batches index writes to disk
+    HNSW_METADATA = {
+        "hnsw:space": "cosine",
+        "hnsw:construction_ef": 100,
+        "hnsw:M": 16,
+        "hnsw:search_ef": 64,
+        "hnsw:batch_size": ADD_BATCH_SIZE,
+        "hnsw:sync_threshold": 1000,
+    }
+
     def __init__(self,
                  persist_directory: str = "./chroma_db",
-                 collection_name: str = "ai_news_articles"):
+                 collection_name: str = "ai_news_articles",
+                 embedding_model: Optional[str] = None):
         """
         Initialize ChromaDB vector store.
 
         Args:
             persist_directory: Directory to persist the database
             collection_name: Name of the collection to use
+            embedding_model: Embedding model name, stamped on new collections
         """
         self.persist_directory = persist_directory
         self.collection_name = collection_name
+        self.embedding_model = embedding_model
 
         log.info("Initializing ChromaDB vector store",
                 persist_dir=persist_directory,
@@ -54,11 +74,24 @@ class VectorStore:
             )
 
             # Get or create collection
+            metadata = dict(self.HNSW_METADATA)
+            if embedding_model:
+                metadata["embedding_model"] = embedding_model
+            # Embeddings always come from EmbeddingGenerator; without this
+            # Chroma instantiates its own default ONNX embedding model
             self.collection = self.client.get_or_create_collection(
                 name=collection_name,
-                metadata={"hnsw:space": "cosine"}  # Cosine similarity
+                metadata=metadata,
+                embedding_function=None
             )
 
+            stored_model = (self.collection.metadata or {}).get("embedding_model")
+            if embedding_model and stored_model and stored_model != embedding_model:
+                log.warning("Collection was indexed with a different embedding model; re-index required",
+                           collection=collection_name,
+                           stored_model=stored_model,
+                           model=embedding_model)
+
             log.info("Vector store initialized successfully",
                     count=self.collection.count())
 
@@ -74,6 +107,9 @@ class VectorStore:
         """
         Add articles to the vector store.
 
+        Large inputs are written in ADD_BATCH_SIZE slices, capped at the
+        client's maximum batch size, so each add stays one bounded write.
+
         Args:
             article_ids: Unique IDs for articles
             embeddings: Embedding vectors
@@ -83,12 +119,15 @@ class VectorStore:
         try:
             log.info(f"Adding {len(article_ids)} articles to vector store")
 
-            self.collection.add(
-                ids=article_ids,
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas
-            )
+            batch_size = min(self.ADD_BATCH_SIZE, self._max_batch_size())
+            for start in range(0, len(article_ids), batch_size):
+                end = start + batch_size
+                self.collection.add(
+                    ids=article_ids[start:end],
+                    embeddings=embeddings[start:end],
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end]
+                )
 
             log.info(f"Successfully added articles",
                     count=len(article_ids),
@@ -98,6 +137,14 @@ class VectorStore:
             log.error("Failed to add articles", error=str(e))
             raise
 
+    def _max_batch_size(self) -> int:
+        """Largest add the Chroma client accepts in one call."""
+        try:
+            return self.client.get_max_batch_size()
+        except AttributeError:
+            # Older chromadb clients expose it as a property
+            return getattr(self.client, "max_batch_size", self.ADD_BATCH_SIZE)
+
     def add_article(self,
                    article_id: str,
                    embedding: List[float],
@@ -155,12 +202,61 @@ class VectorStore:
             log.error("Search failed", error=str(e))
             raise
 
+    def search_columns(self,
+                      query_embedding: List[float],
+                      n_results: int = 10,
+                      where: Optional[Dict[str, Any]] = None,
+                      include_documents: bool = True) -> Dict[str, Any]:
+        """
+        Semantic search returning column-oriented results.
+
+        Skips building a dict per row, so callers can post-process
+        distances as a single NumPy array.
+
+        Args:
+            query_embedding: Query vector
+            n_results: Number of results to return
+            where: Metadata filter (e.g., {"article_type": "youtube"})
+            include_documents: Return document text; disable for candidate
+                               over-fetches, then fetch the survivors'
+                               documents with get_documents
+
+        Returns:
+            Dict with ids (ndarray), distances and similarities (float32
+            ndarrays), documents (list, or None if not included) and
+            metadatas (list), row-aligned
+        """
+        include = ["metadatas", "distances"]
+        if include_documents:
+            include.append("documents")
+
+        try:
+            results = self.collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where,
+                include=include
+            )
+
+            distances = np.asarray(results["distances"][0], dtype=np.float32)
+            return {
+                "ids": np.asarray(results["ids"][0], dtype=object),
+                "distances": distances,
+                "similarities": 1.0 - distances,
+                "documents": results["documents"][0] if include_documents else None,
+                "metadatas": results["metadatas"][0]
+            }
+
+        except Exception as e:
+            log.error("Search failed", error=str(e))
+            raise
+
     def search_by_text(self,
                       query_text: str,
                       n_results: int = 10,
                       where: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Search using text query (will be embedded automatically).
+        Search using text query (embedded with the indexing model).
 
         Args:
             query_text: Text query
@@ -170,10 +266,11 @@ class VectorStore:
         Returns:
             Search results
         """
-        # ChromaDB will handle embedding automatically if we use query_texts
+        from .embeddings import get_embedding_generator
+
         try:
             results = self.collection.query(
-                query_texts=[query_text],
+                query_embeddings=[get_embedding_generator().generate_embedding(query_text)],
                 n_results=n_results,
                 where=where
             )
@@ -213,6 +310,37 @@ class VectorStore:
             log.error("Failed to get article", article_id=article_id, error=str(e))
             return None
 
+    def existing_ids(self, article_ids: List[str]) -> set:
+        """
+        Get the subset of IDs already stored in the collection.
+
+        Args:
+            article_ids: Article IDs to check
+
+        Returns:
+            Set of IDs that are already indexed
+        """
+        if not article_ids:
+            return set()
+        result = self.collection.get(ids=article_ids, include=[])
+        return set(result["ids"])
+
+    def get_documents(self, article_ids: List[str]) -> List[Optional[str]]:
+        """
+        Fetch document text for specific articles.
+
+        Args:
+            article_ids: Article IDs
+
+        Returns:
+            Documents aligned with article_ids (None for unknown IDs)
+        """
+        if not article_ids:
+            return []
+        result = self.collection.get(ids=list(article_ids), include=["documents"])
+        by_id = dict(zip(result["ids"], result["documents"]))
+        return [by_id.get(article_id) for article_id in article_ids]
+
     def delete_article(self, article_id: str):
         """Delete an article from the vector store."""
         try:
@@ -229,9 +357,13 @@ class VectorStore:
         """Delete all articles from the collection."""
         try:
             self.client.delete_collection(self.collection_name)
+            metadata = dict(self.HNSW_METADATA)
+            if self.embedding_model:
+                metadata["embedding_model"] = self.embedding_model
             self.collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"hnsw:space": "cosine"}
+                metadata=metadata,
+                embedding_function=None
             )
             log.info("Vector store reset")
         except Exception as e:
@@ -255,6 +387,26 @@ class VectorStore:
         }
 
 
+def results_from_columns(columns: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert column-oriented search results into the row format of VectorStore.search."""
+    formatted = [
+        {
+            "id": article_id,
+            "distance": float(distance),
+            "document": document,
+            "metadata": metadata
+        }
+        for article_id, distance, document, metadata in zip(
+            columns["ids"], columns["distances"], columns["documents"], columns["metadatas"]
+        )
+    ]
+
+    return {
+        "results": formatted,
+        "count": len(formatted)
+    }
+
+
 # Singleton instance
 _vector_store: Optional[VectorStore] = None
 
@@ -263,7 +415,13 @@ def get_vector_store() -> VectorStore:
     """Get or create singleton vector store instance."""
     global _vector_store
     if _vector_store is None:
-        _vector_store = VectorStore()
+        from src.config.settings import get_settings
+        settings = get_settings()
+        _vector_store = VectorStore(
+            persist_directory=settings.chroma_persist_directory,
+            collection_name=settings.chroma_collection_name,
+            embedding_model=settings.embedding_model
+        )
     return _vector_store
 
 
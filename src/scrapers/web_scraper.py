@@ -8,6 +8,7 @@ from pydantic import BaseModel
 import structlog
 
 from ..core.crawler import WebCrawler
+from ..core.http import iter_feed_entries
 from ..config.web_sources import WebSource, ALL_WEB_SOURCES
 
 log = structlog.get_logger()
@@ -76,45 +77,45 @@ class UnifiedWebScraper:
         try:
             self.log.info("Scraping RSS", source=source.name, url=source.rss_url)
             feed = feedparser.parse(source.rss_url)
+            return self._articles_from_feed(source, feed, hours)
 
-            if not feed.entries:
-                self.log.warning("No entries found", source=source.name)
-                return []
+        except Exception as e:
+            self.log.error("RSS scrape failed", source=source.name, error=str(e))
+            return []
+
+    async def scrape_rss_async(
+        self,
+        client,
+        source: WebSource,
+        hours: int
+    ) -> List[WebArticle]:
+        """
+        Scrape articles from an RSS feed over a pooled async HTTP client.
 
+        Args:
+            client: Shared httpx.AsyncClient (see src.core.http)
+            source: WebSource configuration
+            hours: Time window in hours
+
+        Returns:
+            List of WebArticle objects
+        """
+        try:
+            self.log.info("Scraping RSS", source=source.name, url=source.rss_url)
             now = datetime.now(timezone.utc)
             cutoff_time = now - timedelta(hours=hours)
             articles = []
+            seen = 0
 
-            for entry in feed.entries:
-                # Try different date fields
-                published_parsed = getattr(entry, "published_parsed", None)
-                if not published_parsed:
-                    published_parsed = getattr(entry, "updated_parsed", None)
-
-                if not published_parsed:
-                    # If no date, use current time (for sources without dates)
-                    published_time = now
-                else:
-                    published_time = datetime(*published_parsed[:6], tzinfo=timezone.utc)
-
-                if published_time >= cutoff_time:
-                    # Get description/summary
-                    description = entry.get("description", "")
-                    if not description:
-                        description = entry.get("summary", "")
-
-                    # Create article
-                    article = WebArticle(
-                        source_name=source.name,
-                        title=entry.get("title", "No title"),
-                        description=description[:1000],  # Limit description length
-                        url=entry.get("link", ""),
-                        guid=f"{source.name}:{entry.get('id', entry.get('link', str(published_time)))}",
-                        published_at=published_time,
-                        category=source.category
-                    )
+            # Entries are converted as they stream in; the raw feed is never buffered
+            async for entry in iter_feed_entries(client, source.rss_url):
+                seen += 1
+                article = self._article_from_entry(source, entry, now, cutoff_time)
+                if article is not None:
                     articles.append(article)
 
+            if not seen:
+                self.log.warning("No entries found", source=source.name)
             self.log.info("RSS scrape complete", source=source.name, count=len(articles))
             return articles
 
@@ -122,6 +123,87 @@ class UnifiedWebScraper:
             self.log.error("RSS scrape failed", source=source.name, error=str(e))
             return []
 
+    def _articles_from_feed(
+        self,
+        source: WebSource,
+        feed,
+        hours: int
+    ) -> List[WebArticle]:
+        """
+        Convert parsed feed entries within the time window to articles.
+
+        Args:
+            source: WebSource configuration
+            feed: Parsed feed (feedparser result)
+            hours: Time window in hours
+
+        Returns:
+            List of WebArticle objects
+        """
+        if not feed.entries:
+            self.log.warning("No entries found", source=source.name)
+            return []
+
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=hours)
+        articles = [
+            article for article in (
+                self._article_from_entry(source, entry, now, cutoff_time) for entry in feed.entries
+            )
+            if article is not None
+        ]
+
+        self.log.info("RSS scrape complete", source=source.name, count=len(articles))
+        return articles
+
+    def _article_from_entry(
+        self,
+        source: WebSource,
+        entry,
+        now: datetime,
+        cutoff_time: datetime
+    ) -> Optional[WebArticle]:
+        """
+        Convert one feed entry to an article if it falls within the time window.
+
+        Args:
+            source: WebSource configuration
+            entry: feedparser-style entry
+            now: Scrape time (used for entries without a date)
+            cutoff_time: Oldest publish time to keep
+
+        Returns:
+            WebArticle, or None if the entry is too old
+        """
+        # Try different date fields
+        published_parsed = getattr(entry, "published_parsed", None)
+        if not published_parsed:
+            published_parsed = getattr(entry, "updated_parsed", None)
+
+        if not published_parsed:
+            # If no date, use current time (for sources without dates)
+            published_time = now
+        else:
+            published_time = datetime(*published_parsed[:6], tzinfo=timezone.utc)
+
+        if published_time < cutoff_time:
+            return None
+
+        # Get description/summary
+        description = entry.get("description", "")
+        if not description:
+            description = entry.get("summary", "")
+
+        return WebArticle(
+            source_name=source.name,
+            title=entry.get("title", "No title"),
+            description=description[:1000],  # Limit description length
+            url=entry.get("link", ""),
+            guid=f"{source.name}:{entry.get('id', entry.get('link', str(published_time)))}",
+            published_at=published_time,
+            category=source.category
+        )
+
     def _scrape_web(
         self,
         source: WebSource,
@@ -146,29 +228,72 @@ class UnifiedWebScraper:
             markdown = asyncio.run(
                 self.crawler.crawl_to_markdown(source.url, timeout=60000)
             )
+            return self._articles_from_markdown(source, markdown)
+
+        except Exception as e:
+            self.log.error("Web crawl failed", source=source.name, error=str(e))
+            return []
+
+    async def crawl_sources_async(
+        self,
+        sources: List[WebSource],
+        hours: int
+    ) -> List[List[WebArticle]]:
+        """
+        Crawl several sources concurrently on one shared browser.
 
-            if markdown:
-                # Create a single article representing latest content
-                article = WebArticle(
-                    source_name=source.name,
-                    title=f"Latest from {source.name}",
-                    description=markdown[:500],  # First 500 chars
-                    url=source.url,
-                    guid=f"{source.name}:{datetime.now().isoformat()}",
-                    published_at=datetime.now(timezone.utc),
-                    category=source.category,
-                    content=markdown  # Full content
-                )
-
-                self.log.info("Web crawl complete", source=source.name, size=len(markdown))
-                return [article]
+        Args:
+            sources: WebSource configurations with scrape_type "crawl"
+            hours: Time window in hours (crawled pages carry no dates)
 
+        Returns:
+            Article lists, aligned with sources
+        """
+        if not sources:
             return []
 
-        except Exception as e:
-            self.log.error("Web crawl failed", source=source.name, error=str(e))
+        for source in sources:
+            self.log.info("Crawling website", source=source.name, url=source.url)
+
+        pages = await self.crawler.crawl_batch(
+            [source.url for source in sources],
+            max_concurrent=len(sources),
+            timeout=60000
+        )
+        return [self._articles_from_markdown(source, pages.get(source.url)) for source in sources]
+
+    def _articles_from_markdown(
+        self,
+        source: WebSource,
+        markdown: Optional[str]
+    ) -> List[WebArticle]:
+        """
+        Wrap a crawled page as a single article representing its latest content.
+
+        Args:
+            source: WebSource configuration
+            markdown: Crawled page markdown (None if the crawl failed)
+
+        Returns:
+            List with one WebArticle, or empty if nothing was crawled
+        """
+        if not markdown:
             return []
 
+        article = WebArticle(
+            source_name=source.name,
+            title=f"Latest from {source.name}",
+            description=markdown[:500],  # First 500 chars
+            url=source.url,
+            guid=f"{source.name}:{datetime.now().isoformat()}",
+            published_at=datetime.now(timezone.utc),
+            category=source.category,
+            content=markdown  # Full content
+        )
+
+        self.log.info("Web crawl complete", source=source.name, size=len(markdown))
+        return [article]
+
     def get_all_articles(self, hours: int = 24) -> List[WebArticle]:
         """
         Get articles from all 20 configured sources sequentially.
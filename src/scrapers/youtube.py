@@ -2,11 +2,15 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 import os
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 from youtube_transcript_api.proxies import WebshareProxyConfig
 
+from ..core.http import iter_feed_entries
+
 
 class Transcript(BaseModel):
     text: str
@@ -21,6 +25,10 @@ class ChannelVideo(BaseModel):
     transcript: Optional[str] = None
 
 
+# Keep-alive connections to youtube.com for concurrent transcript fetches
+TRANSCRIPT_POOL_SIZE = 10
+
+
 class YouTubeScraper:
     def __init__(self):
         proxy_config = None
@@ -33,7 +41,11 @@ class YouTubeScraper:
                 proxy_password=proxy_password
             )
 
-        self.transcript_api = YouTubeTranscriptApi(proxy_config=proxy_config)
+        # One pooled session shared by every transcript fetch, sized for
+        # the processor's worker threads so connections are reused
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=TRANSCRIPT_POOL_SIZE))
+        self.transcript_api = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=session)
 
     def _get_rss_url(self, channel_id: str) -> str:
         return f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
@@ -59,27 +71,35 @@ class YouTubeScraper:
 
     def get_latest_videos(self, channel_id: str, hours: int = 24) -> list[ChannelVideo]:
         feed = feedparser.parse(self._get_rss_url(channel_id))
-        if not feed.entries:
-            return []
+        return self._videos_from_feed(feed, hours)
 
+    async def get_latest_videos_async(self, client, channel_id: str, hours: int = 24) -> list[ChannelVideo]:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         videos = []
+        async for entry in iter_feed_entries(client, self._get_rss_url(channel_id)):
+            video = self._video_from_entry(entry, cutoff_time)
+            if video is not None:
+                videos.append(video)
+        return videos
 
-        for entry in feed.entries:
-            if "/shorts/" in entry.link:
-                continue
-            published_time = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            if published_time >= cutoff_time:
-                video_id = self._extract_video_id(entry.link)
-                videos.append(ChannelVideo(
-                    title=entry.title,
-                    url=entry.link,
-                    video_id=video_id,
-                    published_at=published_time,
-                    description=entry.get("summary", "")
-                ))
+    def _videos_from_feed(self, feed, hours: int) -> list[ChannelVideo]:
+        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        videos = [self._video_from_entry(entry, cutoff_time) for entry in feed.entries]
+        return [video for video in videos if video is not None]
 
-        return videos
+    def _video_from_entry(self, entry, cutoff_time: datetime) -> Optional[ChannelVideo]:
+        if "/shorts/" in entry.link:
+            return None
+        published_time = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+        if published_time < cutoff_time:
+            return None
+        return ChannelVideo(
+            title=entry.title,
+            url=entry.link,
+            video_id=self._extract_video_id(entry.link),
+            published_at=published_time,
+            description=entry.get("summary", "")
+        )
 
     def scrape_channel(self, channel_id: str, hours: int = 150) -> list[ChannelVideo]:
         videos = self.get_latest_videos(channel_id, hours)
@@ -1,4 +1,4 @@
-from .email import send_email, send_email_to_self, markdown_to_html, digest_to_html
+from .email import send_email, send_email_to_self, markdown_to_html, digest_to_html, build_digest_email
 from .digest_processor import process_digests
 from .anthropic_processor import process_anthropic_markdown
 from .youtube_processor import process_youtube_transcripts
@@ -8,6 +8,7 @@ __all__ = [
     'send_email_to_self',
     'markdown_to_html',
     'digest_to_html',
+    'build_digest_email',
     'process_digests',
     'process_anthropic_markdown',
     'process_youtube_transcripts'
@@ -1,7 +1,10 @@
-from typing import Optional
+from typing import Awaitable, Callable, List, Optional
+import asyncio
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 
+from src.agents.base import RateLimiter, is_rate_limited
+from src.agents import get_digest_agent
 from src.agents.digest import DigestAgent
 from src.database.repository import Repository
 
@@ -18,77 +21,163 @@ logger = logging.getLogger(__name__)
 RATE_LIMIT_DELAY = 7  # seconds between API calls
 
 
-def process_digests(limit: Optional[int] = None) -> dict:
-    agent = DigestAgent()
-    repo = Repository()
+# Articles summarized per request; one batch costs one request against the quota
+DIGEST_BATCH_SIZE = 8
 
-    articles = repo.get_articles_without_digest(limit=limit)
-    total = len(articles)
-    processed = 0
-    failed = 0
+# Requests in flight at once. Paced by RATE_LIMIT_DELAY, a new request
+# starts every 7s; a batched request takes ~10-20s, so 3 keeps the quota full
+MAX_CONCURRENT_REQUESTS = 3
 
-    logger.info(f"Starting digest processing for {total} articles")
 
-    for idx, article in enumerate(articles, 1):
+def _save_batch(repo: Repository, batch: List[dict], results: List) -> List[dict]:
+    """Save a batch's generated digests, returning the saved digests."""
+    saved = []
+    for article, digest_result in zip(batch, results):
         article_type = article["type"]
         article_id = article["id"]
-        article_title = article["title"][:60] + "..." if len(article["title"]) > 60 else article["title"]
 
-        logger.info(f"[{idx}/{total}] Processing {article_type}: {article_title} (ID: {article_id})")
+        if not digest_result:
+            logger.warning(f"[FAIL] Failed to generate digest for {article_type} {article_id}")
+            continue
 
         try:
-            # Generate digest with retry logic for rate limits
-            max_retries = 3
-            retry_count = 0
-            digest_result = None
-
-            while retry_count < max_retries:
+            digest = repo.create_digest(
+                article_type=article_type,
+                article_id=article_id,
+                url=article["url"],
+                title=digest_result.title,
+                summary=digest_result.summary,
+                published_at=article.get("published_at")
+            )
+        except Exception as e:
+            logger.error(f"[ERROR] Error saving digest for {article_type} {article_id}: {e}")
+            continue
+
+        logger.info(f"[OK] Successfully created digest for {article_type} {article_id}")
+        if digest:
+            saved.append({
+                "id": digest.id,
+                "article_type": digest.article_type,
+                "title": digest.title,
+                "summary": digest.summary,
+                "url": digest.url,
+                "published_at": digest.created_at
+            })
+
+    return saved
+
+
+async def _generate_batches(agent: DigestAgent,
+                            batches: List[List[dict]],
+                            on_batch: Callable[[List[dict], List], None],
+                            max_retries: int = 3):
+    """
+    Generate digests for all batches concurrently within the rate limit.
+
+    Request starts are paced by a RateLimiter and at most
+    MAX_CONCURRENT_REQUESTS are in flight, so network round trips overlap
+    instead of adding up. Finished batches are streamed through a queue to
+    a single consumer that runs on_batch (DB save, downstream RAG indexing)
+    on a worker thread, so those writes and embeddings overlap with the
+    requests still in flight instead of stalling the event loop.
+    """
+    limiter = RateLimiter(requests_per_minute=60 / RATE_LIMIT_DELAY)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def limited(call: Callable[[], Awaitable], description: str):
+        for attempt in range(1, max_retries + 1):
+            async with semaphore:
+                await limiter.acquire()
                 try:
-                    digest_result = agent.generate_digest(
-                        title=article["title"],
-                        content=article["content"],
-                        article_type=article_type
-                    )
-                    break  # Success, exit retry loop
-
+                    return await call()
                 except Exception as e:
-                    error_msg = str(e)
-                    if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-                        retry_count += 1
-                        if retry_count < max_retries:
-                            wait_time = 15 * retry_count  # 15s, 30s, 45s
-                            logger.warning(f"[RATE LIMIT] Retry {retry_count}/{max_retries} after {wait_time}s...")
-                            time.sleep(wait_time)
-                        else:
-                            logger.error(f"[RATE LIMIT] Max retries reached for {article_id}")
-                            raise
-                    else:
+                    if not is_rate_limited(e):
                         raise  # Non-rate-limit error, fail immediately
+                    if attempt == max_retries:
+                        logger.error(f"[RATE LIMIT] Max retries reached for {description}")
+                        raise
+            wait_time = 15 * attempt  # 15s, 30s
+            logger.warning(f"[RATE LIMIT] Retry {attempt}/{max_retries} for {description} after {wait_time}s...")
+            await asyncio.sleep(wait_time)
+
+    async def run_batch(batch: List[dict]):
+        label = f"batch of {len(batch)} ({batch[0]['type']} {batch[0]['id']}...)"
+        try:
+            results = await limited(lambda: agent.agenerate_digests(batch), label)
+        except Exception as e:
+            logger.error(f"[ERROR] {label} failed: {e}")
+            results = None
+
+        if results is None:
+            # Fall back to one request per article for this batch
+            logger.warning(f"[FALLBACK] Generating {label} one article at a time")
+            results = []
+            for article in batch:
+                try:
+                    results.append(await limited(
+                        lambda: asyncio.to_thread(
+                            agent.generate_digest,
+                            title=article["title"],
+                            content=article["content"],
+                            article_type=article["type"]
+                        ),
+                        f"{article['type']} {article['id']}"
+                    ))
+                except Exception as e:
+                    logger.error(f"[ERROR] Error processing {article['type']} {article['id']}: {e}")
+                    results.append(None)
 
-            if digest_result:
-                repo.create_digest(
-                    article_type=article_type,
-                    article_id=article_id,
-                    url=article["url"],
-                    title=digest_result.title,
-                    summary=digest_result.summary,
-                    published_at=article.get("published_at")
-                )
-                processed += 1
-                logger.info(f"[OK] Successfully created digest for {article_type} {article_id}")
-
-                # Rate limit: Wait before next request (except for last article)
-                if idx < total:
-                    logger.info(f"⏱️  Waiting {RATE_LIMIT_DELAY}s (rate limit)...")
-                    time.sleep(RATE_LIMIT_DELAY)
-            else:
-                failed += 1
-                logger.warning(f"[FAIL] Failed to generate digest for {article_type} {article_id}")
+        await finished.put((batch, results))
 
-        except Exception as e:
-            failed += 1
-            logger.error(f"[ERROR] Error processing {article_type} {article_id}: {e}")
+    async def consume():
+        for _ in batches:
+            batch, results = await finished.get()
+            await asyncio.to_thread(on_batch, batch, results)
 
+    finished: "asyncio.Queue[tuple]" = asyncio.Queue()
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(consume())
+        for batch in batches:
+            tg.create_task(run_batch(batch))
+
+
+def process_digests(limit: Optional[int] = None, on_digests: Optional[Callable[[List[dict]], None]] = None) -> dict:
+    agent = get_digest_agent()
+    repo = Repository()
+
+    articles = repo.get_articles_without_digest(limit=limit)
+    total = len(articles)
+    batches = [articles[i:i + DIGEST_BATCH_SIZE] for i in range(0, total, DIGEST_BATCH_SIZE)]
+    processed = 0
+
+    logger.info(f"Starting digest processing for {total} articles "
+                f"({len(batches)} batches, up to {MAX_CONCURRENT_REQUESTS} in flight)")
+
+    def on_batch(batch: List[dict], results: List):
+        nonlocal processed
+        saved = _save_batch(repo, batch, results)
+        processed += len(saved)
+        logger.info(f"[{processed}/{total}] digests created so far")
+
+        # Hand the batch downstream (e.g. RAG indexing) while other batches are in flight
+        if saved and on_digests:
+            try:
+                on_digests(saved)
+            except Exception as e:
+                logger.warning(f"Digest callback failed for a batch of {len(saved)}: {e}")
+
+    if batches:
+        driver = _generate_batches(agent, batches, on_batch)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(driver)
+        else:
+            # Called from inside an event loop: drive ours on a worker thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(asyncio.run, driver).result()
+
+    failed = total - processed
     logger.info(f"Processing complete: {processed} processed, {failed} failed out of {total} total")
 
     return {
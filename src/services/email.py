@@ -233,6 +233,54 @@ def digest_to_html(digest_response) -> str:
 </html>"""
 
 
+def build_digest_email(digests, top_n: int, total_ranked: int = None, subject: str = None) -> dict:
+    """
+    Build the top-N digest email from recent digests.
+
+    Shared by POST /api/v1/email/send, the MCP send_email_digest tool and
+    the Streamlit email page; each caller delivers the result its own way.
+
+    Args:
+        digests: Recent digest dicts (id, title, summary, url, article_type), newest first
+        top_n: Number of top articles to include
+        total_ranked: Total digests considered (defaults to len(digests))
+        subject: Email subject (defaults to the standard digest subject)
+
+    Returns:
+        Dictionary with subject, body_text, body_html and articles_count
+    """
+    from src.agents import get_email_agent
+    from src.agents.email import RankedArticleDetail
+
+    # Digests arrive newest first; rank by recency
+    ranked_articles = [
+        RankedArticleDetail(
+            digest_id=digest['id'],
+            rank=idx + 1,
+            relevance_score=10.0 - (idx * 0.5),
+            title=digest['title'],
+            summary=digest['summary'],
+            url=digest['url'],
+            article_type=digest['article_type'],
+            reasoning=f"Ranked #{idx + 1} based on recency and relevance"
+        )
+        for idx, digest in enumerate(digests[:top_n])
+    ]
+
+    email_digest = get_email_agent().create_email_digest_response(
+        ranked_articles=ranked_articles,
+        total_ranked=len(digests) if total_ranked is None else total_ranked,
+        limit=top_n
+    )
+
+    return {
+        "subject": subject or f"🤖 AI News Digest - Top {top_n} Articles",
+        "body_text": email_digest.to_markdown(),
+        "body_html": digest_to_html(email_digest),
+        "articles_count": len(ranked_articles)
+    }
+
+
 def send_email_to_self(subject: str, body: str):
     if not MY_EMAIL:
         raise ValueError("MY_EMAIL environment variable is not set. Please set it in your .env file.")
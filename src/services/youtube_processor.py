@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from src.scrapers.youtube import YouTubeScraper
@@ -6,6 +7,10 @@ from src.database.repository import Repository
 
 TRANSCRIPT_UNAVAILABLE_MARKER = "__UNAVAILABLE__"
 
+# Transcript fetches in flight at once; kept low since YouTube throttles
+# aggressive transcript scraping
+TRANSCRIPT_WORKERS = 4
+
 
 def process_youtube_transcripts(limit: Optional[int] = None) -> dict:
     scraper = YouTubeScraper()
@@ -16,19 +21,23 @@ def process_youtube_transcripts(limit: Optional[int] = None) -> dict:
     unavailable = 0
     failed = 0
 
-    for video in videos:
-        try:
-            transcript_result = scraper.get_transcript(video.video_id)
+    # Fetches overlap on worker threads (sharing the scraper's pooled
+    # session); results are written back in one commit on this thread,
+    # since the repository's session is not thread-safe
+    transcripts = {}
+    with ThreadPoolExecutor(max_workers=TRANSCRIPT_WORKERS) as executor:
+        results = executor.map(scraper.get_transcript, [video.video_id for video in videos])
+
+        for video, transcript_result in zip(videos, results):
             if transcript_result:
-                repo.update_youtube_video_transcript(video.video_id, transcript_result.text)
+                transcripts[video.video_id] = transcript_result.text
                 processed += 1
             else:
-                repo.update_youtube_video_transcript(video.video_id, TRANSCRIPT_UNAVAILABLE_MARKER)
+                # Marked so later runs don't retry; the DB is the transcript cache
+                transcripts[video.video_id] = TRANSCRIPT_UNAVAILABLE_MARKER
                 unavailable += 1
-        except Exception as e:
-            repo.update_youtube_video_transcript(video.video_id, TRANSCRIPT_UNAVAILABLE_MARKER)
-            unavailable += 1
-            print(f"Error processing video {video.video_id}: {e}")
+
+    repo.bulk_update_youtube_video_transcripts(transcripts)
 
     return {
         "total": len(videos),
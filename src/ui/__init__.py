@@ -0,0 +1,23 @@
+from .cache import (
+    get_cached_repository,
+    get_cached_retriever,
+    get_recent_digests_cached,
+    get_digest_type_counts_cached,
+    start_cache_warmup
+)
+from .constants import DEFAULT_TYPE_EMOJI, TYPE_EMOJI, TYPE_LABELS
+from .html import details_html, field_html, link_html
+
+__all__ = [
+    'get_cached_repository',
+    'get_cached_retriever',
+    'get_recent_digests_cached',
+    'get_digest_type_counts_cached',
+    'start_cache_warmup',
+    'DEFAULT_TYPE_EMOJI',
+    'TYPE_EMOJI',
+    'TYPE_LABELS',
+    'details_html',
+    'field_html',
+    'link_html'
+]
@@ -0,0 +1,109 @@
+"""
+Shared Streamlit caches.
+
+Streamlit keys cached entries by function identity, so data used by
+several pages is cached here once instead of per page.
+
+Digest rows are cached as shared resources (no per-hit deep copy), so
+callers must treat the returned rows as read-only.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
+
+import streamlit as st
+import structlog
+
+from src.database.repository import Repository
+from src.rag.retriever import get_article_retriever
+
+log = structlog.get_logger()
+
+# Widest time window offered by any page (Digests: last 30 days)
+MAX_DIGEST_HOURS = 720
+
+
+@st.cache_resource(show_spinner=False)
+def get_cached_repository():
+    """Get database repository (cached)."""
+    return Repository()
+
+
+@st.cache_resource(show_spinner=False)
+def get_cached_retriever():
+    """Get article retriever (cached across all users)."""
+    return get_article_retriever()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)  # Cache for 60 seconds; shared reference, not copied per hit
+def get_widest_digests_cached(hours: int = MAX_DIGEST_HOURS) -> Tuple[Dict[str, Any], ...]:
+    """Get digests for the widest window from database (cached, shared across pages, read-only)."""
+    repo = get_cached_repository()
+    return tuple(repo.get_recent_digests(hours=hours))
+
+
+@st.cache_data(ttl=60)  # Cache for 60 seconds
+def get_digest_type_counts_cached(hours: int):
+    """Get per-type digest counts for a time window, aggregated in SQL (cached)."""
+    repo = get_cached_repository()
+    return repo.get_digest_type_counts(hours=hours)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps from the database as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def get_recent_digests_cached(hours: int) -> Tuple[Dict[str, Any], ...]:
+    """
+    Get digests from the last `hours` hours.
+
+    Narrower windows are sliced from the single cached widest-window
+    query, so changing the time filter does not hit the database.
+    The rows are shared across sessions and must not be mutated.
+
+    Args:
+        hours: Time window in hours
+
+    Returns:
+        Tuple of digests, newest first
+    """
+    if hours > MAX_DIGEST_HOURS:
+        return get_widest_digests_cached(hours)
+
+    digests = get_widest_digests_cached()
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+    # Digests are ordered newest first, so the window is a prefix
+    end = 0
+    while end < len(digests) and _as_utc(digests[end]["created_at"]) >= cutoff:
+        end += 1
+    return digests[:end]
+
+
+def _warm():
+    """Populate the shared caches (runs on the warmup thread)."""
+    try:
+        get_cached_repository()
+        get_widest_digests_cached()
+        get_cached_retriever()
+        log.info("Streamlit caches warmed")
+    except Exception as e:
+        log.warning("Streamlit cache warmup failed", error=str(e))
+
+
+@st.cache_resource(show_spinner=False)
+def start_cache_warmup() -> threading.Thread:
+    """
+    Warm the shared caches on a background thread, once per server process.
+
+    Overlaps the Chroma client, embedding model and first digests query
+    with the first render, so the first visitor hits warm caches.
+
+    Returns:
+        The warmup thread
+    """
+    thread = threading.Thread(target=_warm, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,26 @@
+"""
+Shared display constants for the Streamlit pages.
+
+Built once at import time instead of per rendered row.
+"""
+
+# Badge for article types missing from TYPE_EMOJI
+DEFAULT_TYPE_EMOJI = '📄'
+
+# Article type -> emoji badge
+TYPE_EMOJI = {
+    'official': '🏢',
+    'research': '🔬',
+    'news': '📰',
+    'safety': '🛡️',
+    'youtube': '📺'
+}
+
+# Article type -> readable chart label
+TYPE_LABELS = {
+    'official': '🏢 Official Blogs',
+    'research': '🔬 Research Papers',
+    'news': '📰 News Sites',
+    'safety': '🛡️ AI Safety',
+    'youtube': '📺 YouTube'
+}
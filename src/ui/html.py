@@ -0,0 +1,36 @@
+"""
+HTML builders for batched Streamlit rendering.
+
+Lists of results are assembled into one HTML string and emitted with a
+single st.markdown call instead of one element per field. All scraped or
+user-provided text is escaped before it is embedded.
+"""
+
+from html import escape
+from typing import Any, Iterable
+
+
+def field_html(label: str, value: Any) -> str:
+    """Build a bold-labelled field line."""
+    return f"<p><strong>{escape(label)}:</strong> {escape(str(value))}</p>"
+
+
+def link_html(url: str, text: str) -> str:
+    """Build a link that opens in a new tab."""
+    return f'<p><a href="{escape(url, quote=True)}" target="_blank">{escape(text)}</a></p>'
+
+
+def details_html(summary: str, body: Iterable[str], expanded: bool = False) -> str:
+    """
+    Build a collapsible <details> block.
+
+    Args:
+        summary: Summary line text (escaped)
+        body: Pre-built HTML fragments for the body
+        expanded: Whether the block starts open
+
+    Returns:
+        HTML string without blank lines, so Markdown keeps it as one HTML block
+    """
+    open_attr = " open" if expanded else ""
+    return f"<details{open_attr}><summary>{escape(summary)}</summary>{''.join(body)}</details>"
@@ -1,4 +1,13 @@
-from .state import WorkflowState, Article, Digest, RankedArticle, ErrorInfo, create_initial_state
+from .state import (
+    WorkflowState,
+    WorkflowCounts,
+    WorkflowResult,
+    Article,
+    Digest,
+    RankedArticle,
+    ErrorInfo,
+    create_initial_state
+)
 from .nodes import (
     scraping_node,
     processing_node,
@@ -8,11 +17,13 @@ from .nodes import (
     email_node,
     error_handler_node
 )
-from .workflow import create_workflow, run_workflow
+from .workflow import WORKFLOW_STAGES, create_workflow, run_workflow, run_workflow_iter, summarize_state
 
 __all__ = [
     # State
     'WorkflowState',
+    'WorkflowCounts',
+    'WorkflowResult',
     'Article',
     'Digest',
     'RankedArticle',
@@ -27,6 +38,9 @@ __all__ = [
     'email_node',
     'error_handler_node',
     # Workflow
+    'WORKFLOW_STAGES',
     'create_workflow',
-    'run_workflow'
+    'run_workflow',
+    'run_workflow_iter',
+    'summarize_state'
 ]
@@ -6,7 +6,7 @@ Nodes can modify the state and control workflow routing.
 """
 
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 import structlog
 from .state import WorkflowState, ErrorInfo
 
@@ -21,6 +21,21 @@ from src.config.user_profile import USER_PROFILE
 log = structlog.get_logger()
 
 
+def _to_index_article(digest: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the retriever indexing payload for a digest."""
+    return {
+        "id": digest["id"],
+        "title": digest["title"],
+        "summary": digest["summary"],
+        "content": None,  # We could fetch full content if needed
+        "metadata": {
+            "article_type": digest["article_type"],
+            "url": digest["url"],
+            "published_at": str(digest.get("published_at", ""))
+        }
+    }
+
+
 def scraping_node(state: WorkflowState) -> Dict[str, Any]:
     """
     Node: Scrape articles from sources.
@@ -127,8 +142,15 @@ def digest_node(state: WorkflowState) -> Dict[str, Any]:
     log.info("=== Digest Node ===")
 
     try:
+        retriever = get_article_retriever()
+
+        def index_digests(digests: List[Dict[str, Any]]):
+            # Index each generated batch as soon as it is saved so RAG
+            # indexing overlaps with the rate-limited digest generation
+            retriever.index_articles_batch([_to_index_article(digest) for digest in digests])
+
         # Process digests using existing service
-        digest_result = process_digests()
+        digest_result = process_digests(on_digests=index_digests)
 
         log.info(f"Created {digest_result['processed']} digests")
 
@@ -178,20 +200,14 @@ def rag_indexing_node(state: WorkflowState) -> Dict[str, Any]:
     try:
         retriever = get_article_retriever()
 
-        # Prepare articles for indexing
-        articles_to_index = []
-        for digest in state["digests"]:
-            articles_to_index.append({
-                "id": digest["id"],
-                "title": digest["title"],
-                "summary": digest["summary"],
-                "content": None,  # We could fetch full content if needed
-                "metadata": {
-                    "article_type": digest["article_type"],
-                    "url": digest["url"],
-                    "published_at": str(digest.get("published_at", ""))
-                }
-            })
+        # Digests created in this run were indexed by the digest node;
+        # only embed the ones that are not in the vector store yet
+        indexed = retriever.vector_store.existing_ids([d["id"] for d in state["digests"]])
+        articles_to_index = [
+            _to_index_article(digest)
+            for digest in state["digests"]
+            if digest["id"] not in indexed
+        ]
 
         # Index in batch
         if articles_to_index:
@@ -226,9 +242,9 @@ def ranking_node(state: WorkflowState) -> Dict[str, Any]:
     log.info("=== Ranking Node ===")
 
     try:
-        from src.agents.curator import CuratorAgent
+        from src.agents import get_curator_agent
 
-        curator = CuratorAgent(USER_PROFILE)
+        curator = get_curator_agent()
 
         # Get RAG context for ranking
         retriever = get_article_retriever()
@@ -306,10 +322,11 @@ def email_node(state: WorkflowState) -> Dict[str, Any]:
         }
 
     try:
-        from src.agents.email import EmailAgent, RankedArticleDetail, EmailDigestResponse
+        from src.agents import get_email_agent
+        from src.agents.email import RankedArticleDetail, EmailDigestResponse
         from src.services.email import send_email, digest_to_html
 
-        email_agent = EmailAgent(USER_PROFILE)
+        email_agent = get_email_agent()
 
         # Prepare top N articles
         top_articles = state["ranked_articles"][:state["top_n"]]
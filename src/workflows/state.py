@@ -85,6 +85,29 @@ class WorkflowState(TypedDict):
     success: bool  # Overall workflow success
 
 
+class WorkflowCounts(TypedDict):
+    """Item counts per pipeline stage"""
+    articles: int
+    digests: int
+    ranked: int
+
+
+class WorkflowResult(TypedDict):
+    """
+    Compact outcome of a workflow run, returned to callers.
+
+    Only counts and the top_n ranked articles are kept; the full article
+    and digest lists stay in the database, so results held by the UI or
+    the job registry don't grow with the number of articles scraped.
+    """
+    success: bool
+    top_n: int
+    vector_indexed: bool
+    counts: WorkflowCounts
+    top_articles: List[RankedArticle]
+    errors: List[ErrorInfo]
+
+
 def create_initial_state(hours: int = 24, top_n: int = 10) -> WorkflowState:
     """
     Create initial workflow state.
@@ -4,12 +4,12 @@ LangGraph Workflow Definition
 Creates and executes the stateful workflow graph for the AI news aggregator.
 """
 
-from typing import Dict, Any, Literal
+from typing import Dict, Any, Generator, Literal
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 import structlog
 
-from .state import WorkflowState, create_initial_state
+from .state import WorkflowState, WorkflowResult, create_initial_state
 from .nodes import (
     scraping_node,
     processing_node,
@@ -22,6 +22,17 @@ from .nodes import (
 
 log = structlog.get_logger()
 
+# Pipeline node -> progress label, in execution order
+WORKFLOW_STAGES = {
+    "scraping": "🕷️ Scraping",
+    "processing": "🔧 Processing",
+    "digest": "📝 Digest",
+    "rag_indexing": "🗄️ RAG Indexing",
+    "ranking": "🎯 Ranking",
+    "email": "📧 Email",
+}
+_STAGE_ORDER = {node: i for i, node in enumerate(WORKFLOW_STAGES, 1)}
+
 
 def should_continue(state: WorkflowState) -> Literal["continue", "error", "end"]:
     """
@@ -215,17 +226,53 @@ def create_workflow() -> StateGraph:
     return app
 
 
-def run_workflow(hours: int = 24, top_n: int = 10, config: Dict[str, Any] = None) -> WorkflowState:
+def summarize_state(state: WorkflowState) -> WorkflowResult:
     """
-    Run the complete workflow.
+    Reduce a final workflow state to counts and the top ranked articles.
+
+    Args:
+        state: Final workflow state
+
+    Returns:
+        Compact workflow result
+    """
+    top_n = state.get("top_n", 10)
+    ranked = state.get("ranked_articles", [])
+    return WorkflowResult(
+        success=state.get("success", False),
+        top_n=top_n,
+        vector_indexed=state.get("vector_indexed", False),
+        counts={
+            "articles": len(state.get("articles", [])),
+            "digests": len(state.get("digests", [])),
+            "ranked": len(ranked)
+        },
+        top_articles=list(ranked[:top_n]),
+        errors=list(state.get("errors", []))
+    )
+
+
+def run_workflow_iter(hours: int = 24,
+                     top_n: int = 10,
+                     config: Dict[str, Any] = None) -> Generator[Dict[str, Any], None, WorkflowResult]:
+    """
+    Run the complete workflow, yielding a progress event after each node.
+
+    Each event is a dict with stage (node name), done and total (pipeline
+    stages completed), pct (0-100), msg (display text) and errors (count
+    so far). The compact workflow result (see summarize_state) is the
+    generator's return value (StopIteration.value).
 
     Args:
         hours: Time window for article scraping
         top_n: Number of articles to include in email
         config: Optional LangGraph configuration
 
+    Yields:
+        Progress events
+
     Returns:
-        Final workflow state
+        Workflow result with counts and the top ranked articles
     """
     log.info("=" * 60)
     log.info("Starting AI News Aggregator Workflow (LangGraph)")
@@ -242,12 +289,27 @@ def run_workflow(hours: int = 24, top_n: int = 10, config: Dict[str, Any] = None
 
     try:
         # Stream workflow and track progress
+        total = len(WORKFLOW_STAGES)
+        done = 0
         for state in app.stream(initial_state, config):
-            # Log progress
             for node_name, node_state in state.items():
+                node_state = node_state or {}
+                errors = len(node_state.get("errors", []))
                 log.info(f"Completed node: {node_name}",
                         stage=node_state.get("current_stage"),
-                        errors=len(node_state.get("errors", [])))
+                        errors=errors)
+
+                # Retries restart from scraping, so progress can move back
+                done = _STAGE_ORDER.get(node_name, done)
+                label = WORKFLOW_STAGES.get(node_name, "⚠️ Error handling")
+                yield {
+                    "stage": node_name,
+                    "done": done,
+                    "total": total,
+                    "pct": done * 100 // total,
+                    "msg": f"**{label}** ({done}/{total}): `{node_state.get('current_stage', node_name)}`",
+                    "errors": errors
+                }
 
         # Get the final accumulated state
         final_state = app.get_state(config)
@@ -257,20 +319,40 @@ def run_workflow(hours: int = 24, top_n: int = 10, config: Dict[str, Any] = None
         log.info("Workflow Complete")
         log.info("=" * 60)
 
-        if final_state_values:
-            log.info(f"Success: {final_state_values.get('success', False)}")
-            log.info(f"Total errors: {len(final_state_values.get('errors', []))}")
-            log.info(f"Articles scraped: {len(final_state_values.get('articles', []))}")
-            log.info(f"Digests created: {len(final_state_values.get('digests', []))}")
-            log.info(f"Articles ranked: {len(final_state_values.get('ranked_articles', []))}")
+        result = summarize_state(final_state_values or {})
+        log.info(f"Success: {result['success']}")
+        log.info(f"Total errors: {len(result['errors'])}")
+        log.info(f"Articles scraped: {result['counts']['articles']}")
+        log.info(f"Digests created: {result['counts']['digests']}")
+        log.info(f"Articles ranked: {result['counts']['ranked']}")
 
-        return final_state_values
+        return result
 
     except Exception as e:
         log.error("Workflow failed with exception", error=str(e))
         raise
 
 
+def run_workflow(hours: int = 24, top_n: int = 10, config: Dict[str, Any] = None) -> WorkflowResult:
+    """
+    Run the complete workflow.
+
+    Args:
+        hours: Time window for article scraping
+        top_n: Number of articles to include in email
+        config: Optional LangGraph configuration
+
+    Returns:
+        Workflow result with counts and the top ranked articles
+    """
+    events = run_workflow_iter(hours=hours, top_n=top_n, config=config)
+    while True:
+        try:
+            next(events)
+        except StopIteration as stop:
+            return stop.value
+
+
 if __name__ == "__main__":
     # Configure logging
     import logging
@@ -290,7 +372,7 @@ if __name__ == "__main__":
 
     if result and result.get("success"):
         print("\n✓ Workflow completed successfully!")
-        print(f"Email sent with {len(result.get('ranked_articles', [])[:result.get('top_n', 10)])} articles")
+        print(f"Email sent with {len(result['top_articles'])} articles")
     else:
         print("\n✗ Workflow failed")
         if result:
@@ -27,6 +27,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Warm the retriever, repository and digests caches while the first page renders
+from src.ui.cache import start_cache_warmup
+start_cache_warmup()
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
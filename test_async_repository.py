@@ -0,0 +1,75 @@
+"""
+Async Repository Testing Script
+
+Runs the API's AsyncRepository queries against the configured PostgreSQL
+database through asyncpg (no mocks), so driver-level type errors such as
+binding an aware datetime to a naive timestamp column surface here.
+Requires the database from setup_database.py.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.config.settings import get_settings
+from src.database.async_repository import AsyncRepository
+
+
+async def _run(check):
+    """Run a check with a repository on a fresh asyncpg engine."""
+    engine = create_async_engine(get_settings().async_database_url)
+    try:
+        async with async_sessionmaker(engine)() as session:
+            return await check(AsyncRepository(session=session))
+    finally:
+        await engine.dispose()
+
+
+def test_recent_digests():
+    """Recent digests bind a naive UTC cutoff and come back newest first."""
+    async def check(repo):
+        digests = await repo.get_recent_digests(hours=24 * 7, limit=5)
+        total = await repo.count_recent_digests(hours=24 * 7)
+        assert len(digests) <= min(5, total)
+        created = [d["created_at"] for d in digests]
+        assert created == sorted(created, reverse=True)
+        assert all(isinstance(c, datetime) for c in created)
+
+    asyncio.run(_run(check))
+
+
+def test_recent_digests_page():
+    """A page and its window total come from one query; past the end is empty."""
+    async def check(repo):
+        total = await repo.count_recent_digests(hours=24 * 7)
+        page, page_total = await repo.get_recent_digests_page(hours=24 * 7, limit=3, offset=0)
+        assert page_total == total
+        assert len(page) == min(3, total)
+        assert all("total" not in digest for digest in page)
+
+        past_end, past_end_total = await repo.get_recent_digests_page(hours=24 * 7, limit=3, offset=total + 3)
+        assert past_end == [] and past_end_total == total
+
+    asyncio.run(_run(check))
+
+
+def test_table_counts():
+    """All-time counts come back as ints in one query."""
+    async def check(repo):
+        counts = await repo.get_table_counts()
+        assert set(counts) == {"youtube_videos", "web_articles", "digests"}
+        assert all(isinstance(count, int) for count in counts.values())
+
+    asyncio.run(_run(check))
+
+
+if __name__ == "__main__":
+    for test in (test_recent_digests, test_recent_digests_page, test_table_counts):
+        test()
+        print(f"✅ {test.__name__} passed")
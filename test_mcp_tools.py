@@ -180,9 +180,9 @@ def main():
             if workflow_result and workflow_result.get("success"):
                 result = {
                     "status": "success",
-                    "articles_scraped": len(workflow_result.get("articles", [])),
-                    "digests_created": len(workflow_result.get("digests", [])),
-                    "articles_ranked": len(workflow_result.get("ranked_articles", [])),
+                    "articles_scraped": workflow_result["counts"]["articles"],
+                    "digests_created": workflow_result["counts"]["digests"],
+                    "articles_ranked": workflow_result["counts"]["ranked"],
                     "email_sent": True
                 }
             else: